@@ -4,11 +4,17 @@ from .browser import LinkedInBrowserController
 from .linkedin_actions import LinkedInActionsController
 from .login import LinkedInLoginController
 from .navigation import AppState, NavigationController
+from .scheduler import BrowserScheduler, TaskPriority
+from .search_plan import SearchPlanExecutor, expand_search_plan
 
 __all__ = [
     "AppState",
+    "BrowserScheduler",
     "LinkedInBrowserController",
     "LinkedInActionsController",
     "LinkedInLoginController",
     "NavigationController",
+    "SearchPlanExecutor",
+    "TaskPriority",
+    "expand_search_plan",
 ]
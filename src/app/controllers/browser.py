@@ -2,57 +2,100 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import threading
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Awaitable, Callable, Optional, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, List, Optional, TypeVar
 
 from playwright.async_api import (
+    APIResponse,
     BrowserContext,
     Error as PlaywrightError,
+    Frame,
     Playwright,
     TimeoutError as PlaywrightTimeoutError,
     Page,
+    Response,
     async_playwright,
 )
 
+from .page_pool import PagePool
+from .rate_limiter import (
+    THROTTLE_STATUSES,
+    AdaptiveRateLimiter,
+    ChallengeDetectedError,
+    is_challenge_url,
+)
+from .resource_blocking import BlockList, ResourceBlocker, ScrapeStats
+from .scheduler import BrowserScheduler, SchedulerStats, TaskPriority
+from .selectors import first_matching_selector
+from .webkit_install import WebKitInstaller
+from ..models.selector_stats import SelectorRegistry
+from ..models.session_state import (
+    SessionVerdict,
+    inspect_storage_state,
+    load_storage_state,
+    save_storage_state,
+)
+
 
 T = TypeVar("T")
 
+LOGGER = logging.getLogger(__name__)
+
+# Receives the checkpoint URL when automation pauses and ``None`` when it resumes.
+ChallengeListener = Callable[[Optional[str]], None]
+
 
 class LinkedInBrowserController:
     """Manage a persistent Playwright WebKit context across GUI actions."""
 
     HOME_URL = "https://www.linkedin.com/"
     LOGIN_URL = "https://www.linkedin.com/login/pt"
-
-    def __init__(self, profile_dir: Path) -> None:
+    FEED_URL = "https://www.linkedin.com/feed/"
+    LOGGED_OUT_URL_MARKERS = ("/login", "/authwall", "/checkpoint", "/uas/")
+    STORAGE_STATE_FILENAME = "webkit_storage_state.json"
+
+    DEFAULT_PAGE_POOL_SIZE = 3
+
+    def __init__(
+        self,
+        profile_dir: Path,
+        *,
+        page_pool_size: int = DEFAULT_PAGE_POOL_SIZE,
+        scrape_blocklist: Optional[BlockList] = None,
+        storage_state_path: Optional[Path] = None,
+        installer: Optional[WebKitInstaller] = None,
+        selector_registry: Optional[SelectorRegistry] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ) -> None:
         self.profile_dir = profile_dir
+        self.storage_state_path = storage_state_path or profile_dir.parent / self.STORAGE_STATE_FILENAME
+        self.scrape_blocklist = scrape_blocklist or BlockList()
+        self._scrape_stats = ScrapeStats()
+        self._scrape_stats_lock = threading.Lock()
+        self.selector_registry = selector_registry
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.challenge_url: Optional[str] = None
+        self._challenge_page: Optional[Page] = None
+        # Tab opened by ``api_get`` to show a checkpoint; outside the page pool.
+        self._challenge_tab: Optional[Page] = None
+        self._challenge_listeners: List[ChallengeListener] = []
         self._loop = asyncio.new_event_loop()
         self._loop_ready = threading.Event()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
         self._playwright: Optional[Playwright] = None
         self._context: Optional[BrowserContext] = None
-        self._lock = threading.Lock()
-        self._ensure_webkit_installed()
+        self._pages = PagePool(page_pool_size)
+        self._scheduler = BrowserScheduler(page_pool_size)
+        self._launch_lock = asyncio.Lock()
+        # Started by the caller (or on the first launch), so building the controller has no side effects.
+        self.installer = installer or WebKitInstaller(profile_dir.parent)
 
     # -- event loop bootstrap -----------------------------------------------
-    def _ensure_webkit_installed(self) -> None:
-        import os
-        import subprocess
-        import sys
-
-        try:
-            from playwright._impl._driver import get_driver_dir
-
-            driver_dir = get_driver_dir()
-            webkit_path = os.path.join(driver_dir, "webkit")
-            if not os.path.exists(webkit_path):
-                subprocess.run([sys.executable, "-m", "playwright", "install", "webkit"], check=True)
-        except Exception:
-            subprocess.run([sys.executable, "-m", "playwright", "install", "webkit"], check=True)
-
     def _run_loop(self) -> None:
         asyncio.set_event_loop(self._loop)
         self._loop_ready.set()
@@ -65,8 +108,17 @@ class LinkedInBrowserController:
         return self._playwright
 
     async def _ensure_context(self, headless: bool = False) -> BrowserContext:
+        async with self._launch_lock:
+            return await self._launch_context(headless)
+
+    async def _ensure_webkit_ready(self) -> None:
+        if not self.installer.ready:
+            await asyncio.get_running_loop().run_in_executor(None, self.installer.wait)
+
+    async def _launch_context(self, headless: bool) -> BrowserContext:
         await self._ensure_playwright()
         if self._context is None:
+            await self._ensure_webkit_ready()
             self.profile_dir.mkdir(parents=True, exist_ok=True)
             try:
                 self._context = await self._playwright.webkit.launch_persistent_context(
@@ -79,6 +131,10 @@ class LinkedInBrowserController:
                     "`playwright install webkit` e tente novamente."
                 )
                 raise RuntimeError(message) from exc
+            self._pages.bind(self._context)
+            for page in self._context.pages:
+                self._watch_page(page)
+            self._context.on("page", self._watch_page)
         return self._context
 
     def _ensure_loop_ready(self) -> bool:
@@ -86,6 +142,68 @@ class LinkedInBrowserController:
         return not (self._loop.is_closed() or not self._loop.is_running())
 
     # -- public API ---------------------------------------------------------
+    @property
+    def page_pool_size(self) -> int:
+        """Maximum number of tabs the controller keeps open at once."""
+
+        return self._pages.size
+
+    def scheduler_stats(self) -> SchedulerStats:
+        """Return queue depth and throughput metrics for the browser scheduler."""
+
+        return self._scheduler.stats()
+
+    def add_challenge_listener(self, listener: ChallengeListener) -> None:
+        """Be told when a checkpoint/CAPTCHA pauses automation (called on the browser thread)."""
+
+        self._challenge_listeners.append(listener)
+
+    def resume_automation(self) -> None:
+        """Resume queued work after the user dealt with a checkpoint."""
+
+        if self._ensure_loop_ready():
+            self._loop.call_soon_threadsafe(self._resume_after_challenge)
+
+    async def navigate(self, page: Page, url: str, *, wait_until: str = "domcontentloaded") -> Optional[Response]:
+        """Open ``url`` in ``page`` at the pace allowed by the shared rate limiter.
+
+        Raises :class:`ChallengeDetectedError` when LinkedIn answers with a
+        checkpoint or CAPTCHA page; queued work stays paused until it is solved.
+        Tasks that already hold a tab get the same error, without touching
+        LinkedIn, while a checkpoint is pending.
+        """
+
+        self._raise_if_challenged()
+        await self.rate_limiter.acquire()
+        # The checkpoint may have been met while this call waited for a token.
+        self._raise_if_challenged()
+        started = time.monotonic()
+        response = await page.goto(url, wait_until=wait_until)
+        self.rate_limiter.record_response(
+            response.status if response is not None else None,
+            time.monotonic() - started,
+        )
+        if is_challenge_url(page.url):
+            self._pause_for_challenge(page, page.url)
+            raise ChallengeDetectedError(page.url)
+        return response
+
+    def warm_up(self) -> asyncio.Future:
+        """Start Playwright and launch the persistent context ahead of the first action."""
+
+        if not self._ensure_loop_ready():
+            raise RuntimeError("O controlador do Playwright já foi finalizado.")
+        return asyncio.run_coroutine_threadsafe(self._warm_up(), self._loop)
+
+    async def _warm_up(self) -> bool:
+        async with self._scheduler.slot(TaskPriority.PREFETCH):
+            try:
+                await self._ensure_context(headless=False)
+            except Exception as exc:  # noqa: BLE001 - the next real action retries the launch
+                LOGGER.warning("Pré-aquecimento do navegador falhou: %s", exc)
+                return False
+            return True
+
     def open_page(self, url: str) -> asyncio.Future:
         """Launch (or reuse) the persistent browser in headful mode."""
 
@@ -94,24 +212,115 @@ class LinkedInBrowserController:
         return asyncio.run_coroutine_threadsafe(self._open_page(url), self._loop)
 
     async def _open_page(self, url: str) -> None:
-        async with self._context_lock():
-            context = await self._ensure_context(headless=False)
-            page = context.pages[0] if context.pages else await context.new_page()
-            await page.goto(url, wait_until="domcontentloaded")
-
-    def run_with_page(self, handler: Callable[[Page], Awaitable[T]]) -> asyncio.Future[T]:
-        """Execute a coroutine with exclusive access to the current page."""
+        async with self._leased_page(TaskPriority.INTERACTIVE) as page:
+            await page.bring_to_front()
+            await self.navigate(page, url)
+
+    def run_with_page(
+        self,
+        handler: Callable[[Page], Awaitable[T]],
+        *,
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        scrape_mode: bool = False,
+    ) -> asyncio.Future[T]:
+        """Execute a coroutine with exclusive access to a tab leased from the pool.
+
+        With ``scrape_mode`` enabled the tab drops the resources listed in
+        ``scrape_blocklist`` for the duration of the handler and the savings are
+        added to the run totals returned by :meth:`take_scrape_stats`.
+        """
 
         if not self._ensure_loop_ready():
             raise RuntimeError("O controlador do Playwright já foi finalizado.")
-        return asyncio.run_coroutine_threadsafe(self._run_with_page(handler), self._loop)
+        return asyncio.run_coroutine_threadsafe(
+            self._run_with_page(handler, priority, scrape_mode),
+            self._loop,
+        )
 
-    async def _run_with_page(self, handler: Callable[[Page], Awaitable[T]]) -> T:
-        async with self._context_lock():
-            context = await self._ensure_context(headless=False)
-            page = context.pages[0] if context.pages else await context.new_page()
+    async def _run_with_page(
+        self,
+        handler: Callable[[Page], Awaitable[T]],
+        priority: TaskPriority,
+        scrape_mode: bool = False,
+    ) -> T:
+        async with self.page_session(priority, scrape_mode=scrape_mode) as page:
             return await handler(page)
 
+    @asynccontextmanager
+    async def page_session(
+        self,
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        *,
+        scrape_mode: bool = False,
+    ) -> AsyncIterator[Page]:
+        """Lease a pooled tab from coroutines already running on the browser loop."""
+
+        async with self._leased_page(priority) as page:
+            if not scrape_mode:
+                yield page
+                return
+            blocker = ResourceBlocker(self.scrape_blocklist)
+            await blocker.attach(page)
+            try:
+                yield page
+            finally:
+                await blocker.detach(page)
+                with self._scrape_stats_lock:
+                    self._scrape_stats.merge(blocker.stats)
+                LOGGER.info(
+                    "Modo de raspagem bloqueou %s requisições (~%s bytes economizados).",
+                    blocker.stats.blocked_requests,
+                    blocker.stats.estimated_bytes_saved,
+                )
+
+    def take_scrape_stats(self) -> ScrapeStats:
+        """Return the savings of every scrape-mode session since the last call and start a new run.
+
+        Sessions running concurrently all add to the same totals.
+        """
+
+        with self._scrape_stats_lock:
+            stats, self._scrape_stats = self._scrape_stats, ScrapeStats()
+        return stats
+
+    async def api_get(self, url: str, *, headers: Optional[Dict[str, str]] = None) -> APIResponse:
+        """GET ``url`` with the persistent profile's cookies, without rendering anything.
+
+        Goes through the shared rate limiter like page navigations and refuses
+        to run while automation is paused on a checkpoint. A checkpoint answer
+        pauses the scheduler and opens the challenge in a tab for the user to
+        solve; queued work resumes once that tab navigates away.
+        """
+
+        self._raise_if_challenged()
+        context = await self._ensure_context(headless=False)
+        await self.rate_limiter.acquire()
+        started = time.monotonic()
+        response = await context.request.get(url, headers=headers)
+        self.rate_limiter.record_response(response.status, time.monotonic() - started)
+        if is_challenge_url(response.url):
+            # Concurrent requests can all land on the checkpoint; only the first opens a tab.
+            if self._pause_for_challenge(None, response.url):
+                await self._show_challenge(context, response.url)
+            raise ChallengeDetectedError(response.url)
+        return response
+
+    async def cookie_value(self, name: str, url: str = HOME_URL) -> Optional[str]:
+        """Read a cookie of the persistent context (e.g. ``JSESSIONID`` for CSRF headers)."""
+
+        context = await self._ensure_context(headless=False)
+        for cookie in await context.cookies(url):
+            if cookie.get("name") == name:
+                return str(cookie.get("value", "")).strip('"')
+        return None
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> asyncio.Future[T]:
+        """Schedule a coroutine on the browser loop from any thread."""
+
+        if not self._ensure_loop_ready():
+            raise RuntimeError("O controlador do Playwright já foi finalizado.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
     def login_with_credentials(self, email: str, password: str) -> asyncio.Future:
         """Execute the LinkedIn login flow considering the dynamic homepage layout."""
 
@@ -123,10 +332,9 @@ class LinkedInBrowserController:
         )
 
     async def _login_with_credentials(self, email: str, password: str) -> str:
-        async with self._context_lock():
-            context = await self._ensure_context(headless=False)
-            page = context.pages[0] if context.pages else await context.new_page()
-            await page.goto(self.HOME_URL, wait_until="domcontentloaded")
+        async with self._leased_page(TaskPriority.INTERACTIVE) as page:
+            await page.bring_to_front()
+            await self.navigate(page, self.HOME_URL)
 
             await self._click_first_available(
                 page,
@@ -151,6 +359,7 @@ class LinkedInBrowserController:
                 await page.wait_for_url("**/feed/**", timeout=20000)
             except PlaywrightTimeoutError:
                 await page.wait_for_load_state("networkidle")
+            await self._snapshot_storage_state()
             return page.url
 
     def close_browser(self) -> None:
@@ -160,46 +369,75 @@ class LinkedInBrowserController:
         future.result()
 
     async def _close_browser(self) -> None:
-        async with self._context_lock():
+        self._clear_challenge()
+        async with self._scheduler.slot(TaskPriority.INTERACTIVE, exclusive=True):
             if self._context is not None:
+                await self._snapshot_storage_state()
+                self._pages.reset()
                 await self._context.close()
                 self._context = None
 
     def validate_session(self, probe_url: Optional[str] = None) -> bool:
+        """Check whether the persisted profile is still logged in.
+
+        The ``li_at`` cookie is read from the live context or from the storage
+        state snapshot, so no browser is launched unless its expiry is unclear.
+        """
+
         if not self._ensure_loop_ready():
             return False
         future = asyncio.run_coroutine_threadsafe(self._validate_session(probe_url), self._loop)
         return future.result()
 
     async def _validate_session(self, probe_url: Optional[str]) -> bool:
-        async with self._context_lock():
+        async with self._scheduler.slot(TaskPriority.INTERACTIVE):
             if self._context is not None:
-                await self._context.close()
-                self._context = None
+                state = await self._snapshot_storage_state()
+            else:
+                state = load_storage_state(self.storage_state_path)
+            verdict = inspect_storage_state(state)
+            if verdict is not SessionVerdict.UNKNOWN:
+                return verdict is SessionVerdict.VALID
+            if self._context is not None:
+                async with self._pages.lease() as page:
+                    return await self._probe_session(page, probe_url)
 
-            playwright = await self._ensure_playwright()
-            try:
-                context = await playwright.webkit.launch_persistent_context(
-                    str(self.profile_dir),
-                    headless=True,
-                )
-            except PlaywrightError as exc:  # pragma: no cover - runtime guard
-                message = (
-                    "Não foi possível validar o perfil persistente porque o runtime do WebKit não está disponível. \n"
-                    "Execute `playwright install webkit` e repita a operação."
-                )
-                raise RuntimeError(message) from exc
-            try:
-                page = context.pages[0] if context.pages else await context.new_page()
-                if probe_url:
-                    try:
-                        await page.goto(probe_url)
-                    except Exception:
-                        pass
-                storage = await context.storage_state()
-                return bool(storage.get("cookies") or storage.get("origins"))
-            finally:
-                await context.close()
+        async with self._scheduler.slot(TaskPriority.INTERACTIVE, exclusive=True):
+            return await self._probe_session_headless(probe_url)
+
+    async def _probe_session(self, page: Page, probe_url: Optional[str]) -> bool:
+        try:
+            await page.goto(probe_url or self.FEED_URL, wait_until="domcontentloaded")
+        except PlaywrightError:
+            return False
+        return not any(marker in page.url for marker in self.LOGGED_OUT_URL_MARKERS)
+
+    async def _probe_session_headless(self, probe_url: Optional[str]) -> bool:
+        if self._context is not None:
+            async with self._pages.lease() as page:
+                return await self._probe_session(page, probe_url)
+
+        playwright = await self._ensure_playwright()
+        await self._ensure_webkit_ready()
+        try:
+            context = await playwright.webkit.launch_persistent_context(
+                str(self.profile_dir),
+                headless=True,
+            )
+        except PlaywrightError as exc:  # pragma: no cover - runtime guard
+            message = (
+                "Não foi possível validar o perfil persistente porque o runtime do WebKit não está disponível. \n"
+                "Execute `playwright install webkit` e repita a operação."
+            )
+            raise RuntimeError(message) from exc
+        try:
+            page = context.pages[0] if context.pages else await context.new_page()
+            logged_in = await self._probe_session(page, probe_url)
+            storage = await context.storage_state()
+            save_storage_state(self.storage_state_path, storage)
+            return logged_in and inspect_storage_state(storage) is not SessionVerdict.INVALID
+        finally:
+            await context.close()
 
     def shutdown(self) -> None:
         self._loop_ready.wait()
@@ -214,8 +452,11 @@ class LinkedInBrowserController:
         self._loop.close()
 
     async def _shutdown(self) -> None:
-        async with self._context_lock():
+        self._clear_challenge()
+        async with self._scheduler.slot(TaskPriority.INTERACTIVE, exclusive=True):
             if self._context is not None:
+                await self._snapshot_storage_state()
+                self._pages.reset()
                 await self._context.close()
                 self._context = None
             if self._playwright is not None:
@@ -224,9 +465,116 @@ class LinkedInBrowserController:
 
     # -- helpers ------------------------------------------------------------
     @asynccontextmanager
-    async def _context_lock(self):
-        with self._lock:
-            yield
+    async def _leased_page(self, priority: TaskPriority) -> AsyncIterator[Page]:
+        """Wait for a scheduler slot, then lease a tab on the running context.
+
+        Every task that uses a tab goes through here, so the selector
+        statistics gathered while it held the tab are written when it ends.
+        """
+
+        async with self._scheduler.slot(priority):
+            try:
+                await self._ensure_context(headless=False)
+                async with self._pages.lease() as page:
+                    yield page
+            finally:
+                if self.selector_registry is not None:
+                    self.selector_registry.flush()
+
+    def _watch_page(self, page: Page) -> None:
+        page.on("framenavigated", lambda frame: self._on_frame_navigated(page, frame))
+        page.on("response", self._on_response)
+
+    def _on_frame_navigated(self, page: Page, frame: Frame) -> None:
+        if frame != page.main_frame:
+            return
+        if is_challenge_url(frame.url):
+            self._pause_for_challenge(page, frame.url)
+        elif page is self._challenge_page and frame.url != "about:blank":
+            self._resume_after_challenge()
+
+    def _on_response(self, response: Response) -> None:
+        # Document navigations are measured by ``navigate``; this catches throttled XHRs.
+        if response.status in THROTTLE_STATUSES and response.request.resource_type != "document":
+            self.rate_limiter.record_throttle()
+
+    def _raise_if_challenged(self) -> None:
+        if self.challenge_url is not None:
+            raise ChallengeDetectedError(self.challenge_url)
+
+    def _pause_for_challenge(self, page: Optional[Page], url: str) -> bool:
+        """Pause automation on a checkpoint; returns ``False`` when it was already paused."""
+
+        if self.challenge_url is not None:
+            return False
+        LOGGER.warning("Verificação de segurança detectada em %s; automação pausada.", url)
+        self.challenge_url = url
+        self._challenge_page = page
+        self._scheduler.pause()
+        self._notify_challenge(url)
+        return True
+
+    def _resume_after_challenge(self) -> None:
+        if self.challenge_url is None:
+            return
+        LOGGER.info("Verificação de segurança concluída; retomando a automação.")
+        self.challenge_url = None
+        self._challenge_page = None
+        self._close_challenge_tab()
+        self._scheduler.resume()
+        self._notify_challenge(None)
+
+    async def _show_challenge(self, context: BrowserContext, url: str) -> None:
+        """Open a challenge met by an API request in a tab the user can solve."""
+
+        try:
+            page = await context.new_page()
+            self._challenge_page = self._challenge_tab = page
+            await page.goto(url, wait_until="domcontentloaded")
+        except PlaywrightError as exc:
+            LOGGER.warning("Não foi possível abrir a verificação de segurança em %s: %s", url, exc)
+
+    def _close_challenge_tab(self) -> None:
+        page, self._challenge_tab = self._challenge_tab, None
+        if page is not None and not page.is_closed():
+            self._loop.create_task(self._close_page_quietly(page))
+
+    @staticmethod
+    async def _close_page_quietly(page: Page) -> None:
+        try:
+            await page.close()
+        except PlaywrightError:
+            pass
+
+    def _clear_challenge(self) -> None:
+        """Drop any pending checkpoint when the context goes away."""
+
+        self._scheduler.resume()
+        self._close_challenge_tab()
+        if self.challenge_url is None:
+            return
+        self.challenge_url = None
+        self._challenge_page = None
+        self._notify_challenge(None)
+
+    def _notify_challenge(self, url: Optional[str]) -> None:
+        for listener in list(self._challenge_listeners):
+            try:
+                listener(url)
+            except Exception:  # noqa: BLE001 - listeners must not break the browser loop
+                LOGGER.exception("Falha ao notificar a verificação de segurança.")
+
+    async def _snapshot_storage_state(self) -> Optional[dict]:
+        """Persist the live context's cookies so later checks need no browser."""
+
+        if self._context is None:
+            return None
+        try:
+            state = await self._context.storage_state()
+        except PlaywrightError:
+            return None
+        save_storage_state(self.storage_state_path, state)
+        return state
 
     async def _click_if_exists(self, page, selector: str, timeout: int = 2000) -> None:
         try:
@@ -237,12 +585,20 @@ class LinkedInBrowserController:
             await element.click()
 
     async def _click_first_available(self, page, selectors: list[str]) -> None:
-        for selector in selectors:
-            element = await page.query_selector(selector)
-            if element:
-                await element.click()
-                return
-        await page.goto(self.LOGIN_URL, wait_until="domcontentloaded")
+        # The guest homepage usually has no sign-in CTA, so probe without waiting.
+        match = await first_matching_selector(
+            page,
+            selectors,
+            timeout=0,
+            state="attached",
+            registry=self.selector_registry,
+            target="login_cta",
+        )
+        if match is not None:
+            _, element = match
+            await element.click()
+            return
+        await self.navigate(page, self.LOGIN_URL)
 
 
 __all__ = ["LinkedInBrowserController"]
@@ -0,0 +1,357 @@
+"""Offline parsing of saved LinkedIn HTML with the standard library only.
+
+The parsers mirror the in-page scripts (:data:`PROFILE_EXTRACTION_SCRIPT`,
+:data:`JOB_CARDS_SCRIPT`) and return the same JSON shapes, so snapshots can
+be fed to the existing builders and re-parsed when the extraction improves.
+Every entry point is a module-level function so it can run in a
+:class:`~concurrent.futures.ProcessPoolExecutor`.
+"""
+from __future__ import annotations
+
+import asyncio
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .job_details import parse_guest_job_html
+from .job_extraction import JOB_CARD_FIELD_SELECTORS, JOB_CARD_SELECTOR
+from .profile_extraction import (
+    DETAILS_SUBPAGES,
+    EXPERIENCE_ENTRY_SELECTOR,
+    PROFILE_SECTIONS,
+    SECTION_ITEM_SELECTOR,
+)
+from ..models.html_snapshots import HtmlSnapshot, read_snapshot_file
+
+
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+_BLOCK_TAGS = {
+    "address", "article", "aside", "br", "dd", "div", "dl", "dt", "figcaption", "figure", "footer",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "section", "ul",
+}
+_SKIPPED_TAGS = {"script", "style", "template", "noscript"}
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(slots=True, eq=False)
+class Element:
+    """Minimal DOM node built from saved HTML."""
+
+    tag: str
+    attrs: Dict[str, str] = field(default_factory=dict)
+    children: List[Union["Element", str]] = field(default_factory=list)
+    parent: Optional["Element"] = None
+
+    @property
+    def classes(self) -> set[str]:
+        return set(self.attrs.get("class", "").split())
+
+    def iter(self) -> Iterator["Element"]:
+        """Descendants in document order (excluding ``self``)."""
+
+        for child in self.children:
+            if isinstance(child, Element):
+                yield child
+                yield from child.iter()
+
+    def select(self, selector: str) -> List["Element"]:
+        return list(self._matching(selector))
+
+    def select_one(self, selector: str) -> Optional["Element"]:
+        return next(self._matching(selector), None)
+
+    def _matching(self, selector: str) -> Iterator["Element"]:
+        matchers = _compile_selector(selector)
+        return (element for element in self.iter() if any(matcher(element, self) for matcher in matchers))
+
+    def closest(self, tag: str) -> Optional["Element"]:
+        node: Optional[Element] = self
+        while node is not None and node.tag != tag:
+            node = node.parent
+        return node
+
+    def inner_text(self) -> str:
+        """Approximate ``innerText``: only block elements and ``<br>`` break lines.
+
+        Whitespace inside text nodes (including source newlines) collapses to
+        a single space, as in rendered HTML.
+        """
+        parts: List[str] = []
+        self._collect_text(parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts: List[str]) -> None:
+        block = self.tag in _BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        for child in self.children:
+            if isinstance(child, Element):
+                child._collect_text(parts)
+            else:
+                parts.append(_WHITESPACE.sub(" ", child))
+        if block:
+            parts.append("\n")
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document")
+        self._current = self.root
+        self._skipping = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self._skipping or tag in _SKIPPED_TAGS:
+            self._skipping += tag in _SKIPPED_TAGS
+            return
+        element = Element(tag, {name: value or "" for name, value in attrs}, parent=self._current)
+        self._current.children.append(element)
+        if tag not in _VOID_TAGS:
+            self._current = element
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self._skipping:
+            return
+        element = Element(tag, {name: value or "" for name, value in attrs}, parent=self._current)
+        self._current.children.append(element)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skipping:
+            self._skipping -= tag in _SKIPPED_TAGS
+            return
+        node: Optional[Element] = self._current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        # Ignore stray end tags; otherwise close everything up to the match.
+        if node is not None and node.parent is not None:
+            self._current = node.parent
+
+    def handle_data(self, data: str) -> None:
+        if not self._skipping:
+            self._current.children.append(data)
+
+
+def parse_html(html: str) -> Element:
+    """Build a lightweight element tree from an HTML document."""
+
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# -- selectors -----------------------------------------------------------------
+_COMPOUND = re.compile(r"(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:\.[\w-]+|\[[^\]]+\])*)")
+_PART = re.compile(r"\.(?P<cls>[\w-]+)|\[(?P<attr>[\w-]+)(?:(?P<op>\*?=)['\"]?(?P<value>[^'\"\]]*)['\"]?)?\]")
+
+_Matcher = Callable[[Element, Element], bool]
+
+
+def _compile_compound(text: str) -> Callable[[Element], bool]:
+    match = _COMPOUND.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Seletor não suportado: {text}")
+    tag = match.group("tag")
+    checks: List[Callable[[Element], bool]] = []
+    if tag and tag != "*":
+        checks.append(lambda element, tag=tag.lower(): element.tag == tag)
+    for part in _PART.finditer(match.group("rest")):
+        if part.group("cls"):
+            checks.append(lambda element, cls=part.group("cls"): cls in element.classes)
+            continue
+        name, op, value = part.group("attr"), part.group("op"), part.group("value") or ""
+        if op == "=":
+            checks.append(lambda element, name=name, value=value: element.attrs.get(name) == value)
+        elif op == "*=":
+            checks.append(lambda element, name=name, value=value: value in element.attrs.get(name, ""))
+        else:
+            checks.append(lambda element, name=name: name in element.attrs)
+    return lambda element: all(check(element) for check in checks)
+
+
+def _compile_selector(selector: str) -> List[_Matcher]:
+    """Support the selector subset used by the controllers: compounds and descendants."""
+
+    matchers: List[_Matcher] = []
+    for alternative in selector.split(","):
+        steps = [_compile_compound(step) for step in alternative.split()]
+        if not steps:
+            continue
+
+        def _matches(element: Element, scope: Element, steps=steps) -> bool:
+            if not steps[-1](element):
+                return False
+            node = element.parent
+            for step in reversed(steps[:-1]):
+                while node is not None and node is not scope and not step(node):
+                    node = node.parent
+                if node is None or node is scope:
+                    return False
+                node = node.parent
+            return True
+
+        matchers.append(_matches)
+    return matchers
+
+
+# -- page parsers ----------------------------------------------------------------
+def _lines(element: Optional[Element]) -> List[str]:
+    return element.inner_text().split("\n") if element is not None else []
+
+
+def _find_section(root: Element, anchor: str) -> Optional[Element]:
+    for element in root.iter():
+        if element.attrs.get("id") == anchor:
+            return element.closest("section") or element
+    return root.select_one(f"section[data-section='{anchor}']")
+
+
+def parse_profile_html(html: str) -> Dict[str, Any]:
+    """Return the same JSON shape as :data:`PROFILE_EXTRACTION_SCRIPT`."""
+
+    root = parse_html(html)
+    heading = root.select_one("main h1") or root.select_one("h1")
+    result: Dict[str, Any] = {
+        "name": heading.inner_text() if heading is not None else "",
+        "experiences": None,
+        "sections": {},
+        "details": [],
+    }
+    for anchor, slug in DETAILS_SUBPAGES.items():
+        section = _find_section(root, anchor)
+        if section is not None and section.select_one(f"a[href*='/details/{slug}']") is not None:
+            result["details"].append(anchor)
+
+    experience = _find_section(root, "experience")
+    if experience is not None:
+        result["experiences"] = []
+        for entry in experience.select(EXPERIENCE_ENTRY_SELECTOR):
+            details = entry.select_one("a[href*='add-edit/POSITION']") or entry.select_one(
+                "a[href*='/details/experience']"
+            )
+            if details is None:
+                continue
+            description = entry.select_one("div[class*='inline-show-more-text']")
+            result["experiences"].append(
+                {
+                    "lines": _lines(details),
+                    "description": description.inner_text() if description is not None else "",
+                }
+            )
+
+    for anchor in PROFILE_SECTIONS:
+        section = _find_section(root, anchor)
+        result["sections"][anchor] = (
+            [_lines(item) for item in section.select(SECTION_ITEM_SELECTOR)] if section is not None else None
+        )
+    return result
+
+
+def _outermost(elements: List[Element]) -> List[Element]:
+    """Drop matches nested inside another match, as the in-page script does."""
+
+    matched = {id(element) for element in elements}
+    result: List[Element] = []
+    for element in elements:
+        node = element.parent
+        while node is not None and id(node) not in matched:
+            node = node.parent
+        if node is None:
+            result.append(element)
+    return result
+
+
+def parse_job_cards_html(html: str) -> List[Dict[str, Any]]:
+    """Return the same card dicts as :data:`JOB_CARDS_SCRIPT`."""
+
+    root = parse_html(html)
+    cards: List[Dict[str, Any]] = []
+    for card in _outermost(root.select(JOB_CARD_SELECTOR)):
+        fields: Dict[str, Any] = {}
+        for name, selector in JOB_CARD_FIELD_SELECTORS.items():
+            lines = _lines(card.select_one(selector))
+            fields[name] = lines[0] if lines else ""
+        time_node = card.select_one("time")
+        listed_at = ""
+        if time_node is not None:
+            listed_at = time_node.attrs.get("datetime") or time_node.inner_text()
+        cards.append(
+            {
+                "job_id": card.attrs.get("data-occludable-job-id") or card.attrs.get("data-job-id") or "",
+                **fields,
+                "listed_at": listed_at,
+                "easy_apply": bool(re.search(r"Candidatura simplificada|Easy Apply", card.inner_text(), re.I)),
+            }
+        )
+    return cards
+
+
+def parse_job_details_html(html: str, job_id: str) -> Optional[Dict[str, Any]]:
+    details = parse_guest_job_html(html, job_id)
+    return details.to_dict() if details is not None else None
+
+
+def parse_snapshot_file(kind: str, path: str, key: str = "") -> Any:
+    """Read a stored snapshot and parse it according to its kind."""
+
+    html = read_snapshot_file(Path(path))
+    if kind == "profile":
+        return parse_profile_html(html)
+    if kind == "job_cards":
+        return parse_job_cards_html(html)
+    if kind == "job_details":
+        return parse_job_details_html(html, key)
+    raise ValueError(f"Tipo de snapshot desconhecido: {kind}")
+
+
+class SnapshotParserPool:
+    """Parse stored snapshots in worker processes, off the browser event loop.
+
+    The :class:`ProcessPoolExecutor` is created on first use so the GUI does
+    not pay for spawning workers until offline parsing is needed.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def parse(self, snapshot: HtmlSnapshot) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            parse_snapshot_file,
+            snapshot.kind,
+            str(snapshot.path),
+            snapshot.key,
+        )
+
+    async def parse_many(self, snapshots: Sequence[HtmlSnapshot]) -> List[Any]:
+        """Parse several snapshots in parallel, keeping their order."""
+
+        return list(await asyncio.gather(*(self.parse(snapshot) for snapshot in snapshots)))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+__all__ = [
+    "Element",
+    "SnapshotParserPool",
+    "parse_html",
+    "parse_job_cards_html",
+    "parse_job_details_html",
+    "parse_profile_html",
+    "parse_snapshot_file",
+]
@@ -0,0 +1,284 @@
+"""Render-free retrieval of LinkedIn job details through the API request context."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from playwright.async_api import Error as PlaywrightError
+
+from .browser import LinkedInBrowserController
+from ..models.html_snapshots import HtmlSnapshotStore
+from ..models.job_posting import JobDetails
+
+
+LOGGER = logging.getLogger(__name__)
+
+VOYAGER_JOB_URL = (
+    "https://www.linkedin.com/voyager/api/jobs/jobPostings/{job_id}"
+    "?decorationId=com.linkedin.voyager.deco.jobs.web.shared.WebFullJobPosting-65"
+)
+GUEST_JOB_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+VOYAGER_HEADERS = {
+    "accept": "application/vnd.linkedin.normalized+json+2.1",
+    "x-restli-protocol-version": "2.0.0",
+}
+
+# Classes of the public (guest) job posting fragment.
+GUEST_TITLE_CLASS = "top-card-layout__title"
+GUEST_COMPANY_CLASS = "topcard__org-name-link"
+GUEST_LOCATION_CLASS = "topcard__flavor--bullet"
+GUEST_DESCRIPTION_CLASS = "show-more-less-html__markup"
+GUEST_APPLICANTS_CLASSES = ("num-applicants__caption",)
+GUEST_CRITERIA_NAME_CLASS = "description__job-criteria-subheader"
+GUEST_CRITERIA_VALUE_CLASS = "description__job-criteria-text"
+
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+_BLOCK_TAGS = {"br", "p", "li", "div", "ul", "ol", "h1", "h2", "h3", "h4"}
+
+
+class _ClassTextCollector(HTMLParser):
+    """Collect the text of every element carrying one of the ``targets`` classes."""
+
+    def __init__(self, targets: Iterable[str]) -> None:
+        super().__init__(convert_charrefs=True)
+        self._targets = tuple(targets)
+        self._depth = 0
+        self._open: List[tuple[str, int, List[str]]] = []
+        self.found: Dict[str, List[str]] = {target: [] for target in self._targets}
+
+    def handle_starttag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
+        if tag in _BLOCK_TAGS:
+            self._write("\n")
+        if tag in _VOID_TAGS:
+            return
+        self._depth += 1
+        classes = set((dict(attrs).get("class") or "").split())
+        for target in self._targets:
+            if target in classes:
+                self._open.append((target, self._depth, []))
+
+    def handle_startendtag(self, tag: str, attrs: List[tuple[str, Optional[str]]]) -> None:
+        if tag in _BLOCK_TAGS:
+            self._write("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _VOID_TAGS:
+            return
+        still_open = []
+        for target, depth, parts in self._open:
+            if depth >= self._depth:
+                self.found[target].append(_normalise_text("".join(parts)))
+            else:
+                still_open.append((target, depth, parts))
+        self._open = still_open
+        self._depth = max(0, self._depth - 1)
+
+    def handle_data(self, data: str) -> None:
+        self._write(data)
+
+    def _write(self, text: str) -> None:
+        for _, _, parts in self._open:
+            parts.append(text)
+
+
+def _normalise_text(raw: str) -> str:
+    lines = (" ".join(line.split()) for line in raw.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def parse_guest_job_html(html: str, job_id: str) -> Optional[JobDetails]:
+    """Parse the public job posting fragment served to logged-out visitors."""
+
+    collector = _ClassTextCollector(
+        [
+            GUEST_TITLE_CLASS,
+            GUEST_COMPANY_CLASS,
+            GUEST_LOCATION_CLASS,
+            GUEST_DESCRIPTION_CLASS,
+            *GUEST_APPLICANTS_CLASSES,
+            GUEST_CRITERIA_NAME_CLASS,
+            GUEST_CRITERIA_VALUE_CLASS,
+        ]
+    )
+    collector.feed(html)
+    collector.close()
+    found = collector.found
+
+    def _first(target: str) -> str:
+        return next((text for text in found[target] if text), "")
+
+    title = _first(GUEST_TITLE_CLASS)
+    if not title:
+        return None
+    applicants = next((text for target in GUEST_APPLICANTS_CLASSES for text in found[target] if text), "")
+    return JobDetails(
+        job_id=job_id,
+        title=title,
+        company=_first(GUEST_COMPANY_CLASS),
+        location=_first(GUEST_LOCATION_CLASS),
+        description=_first(GUEST_DESCRIPTION_CLASS),
+        applicants=applicants,
+        criteria=dict(zip(found[GUEST_CRITERIA_NAME_CLASS], found[GUEST_CRITERIA_VALUE_CLASS])),
+        source="guest",
+    )
+
+
+def _company_name(details: Any, included: Mapping[str, Mapping[str, Any]]) -> str:
+    """Find the company name inside the nested ``companyDetails`` union."""
+
+    if isinstance(details, str):
+        entity = included.get(details)
+        return str(entity.get("name") or "") if entity else ""
+    if not isinstance(details, Mapping):
+        return ""
+    for key in ("companyName", "name"):
+        if isinstance(details.get(key), str) and details[key].strip():
+            return details[key].strip()
+    for value in details.values():
+        name = _company_name(value, included)
+        if name:
+            return name
+    return ""
+
+
+def parse_voyager_job(payload: Mapping[str, Any], job_id: str) -> Optional[JobDetails]:
+    """Parse the JSON returned by the Voyager ``jobPostings`` endpoint."""
+
+    data = payload.get("data") if isinstance(payload.get("data"), Mapping) else payload
+    title = str(data.get("title") or "").strip()
+    if not title:
+        return None
+    included = {
+        str(entity.get("entityUrn")): entity
+        for entity in payload.get("included") or []
+        if isinstance(entity, Mapping) and entity.get("entityUrn")
+    }
+    description = data.get("description")
+    if isinstance(description, Mapping):
+        description = description.get("text")
+    criteria = {
+        label: str(data[key])
+        for key, label in (
+            ("formattedExperienceLevel", "Nível de experiência"),
+            ("formattedEmploymentStatus", "Tipo de emprego"),
+            ("formattedIndustries", "Setores"),
+            ("formattedJobFunctions", "Função"),
+        )
+        if data.get(key)
+    }
+    applies = data.get("applies")
+    return JobDetails(
+        job_id=job_id,
+        title=title,
+        company=_company_name(data.get("companyDetails"), included),
+        location=str(data.get("formattedLocation") or "").strip(),
+        description=_normalise_text(str(description or "")),
+        applicants="" if applies is None else str(applies),
+        listed_at="" if data.get("listedAt") is None else str(data.get("listedAt")),
+        criteria=criteria,
+        source="api",
+    )
+
+
+def _parse_voyager_body(body: bytes, job_id: str) -> Optional[JobDetails]:
+    try:
+        payload = json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return parse_voyager_job(payload, job_id) if isinstance(payload, Mapping) else None
+
+
+def _parse_guest_body(body: bytes, job_id: str) -> Optional[JobDetails]:
+    return parse_guest_job_html(body.decode("utf-8", errors="replace"), job_id)
+
+
+class JobDetailsFetcher:
+    """Fetch job details over HTTP with the logged-in profile, no page rendering.
+
+    The authenticated Voyager JSON endpoint is tried first (its CSRF token is
+    the ``JSESSIONID`` cookie); when it is refused or changes shape the public
+    guest fragment is used instead. Response bodies are parsed in ``executor``
+    (the default thread pool unless a process pool is given) so large
+    descriptions never stall the browser event loop. With a ``snapshot_store``
+    the guest HTML is kept for later re-parsing.
+    """
+
+    DEFAULT_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        browser: LinkedInBrowserController,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: Optional[Executor] = None,
+        snapshot_store: Optional[HtmlSnapshotStore] = None,
+    ) -> None:
+        self._browser = browser
+        self.concurrency = max(1, concurrency)
+        self._executor = executor
+        self._snapshots = snapshot_store
+
+    async def fetch(self, job_id: str) -> Optional[JobDetails]:
+        """Return the details of one posting, or ``None`` when both sources fail."""
+
+        details = await self._fetch_voyager(job_id)
+        if details is None:
+            details = await self._fetch_guest(job_id)
+        return details
+
+    async def fetch_many(self, job_ids: Sequence[str]) -> List[JobDetails]:
+        """Fetch several postings concurrently, keeping the order of ``job_ids``."""
+
+        limit = asyncio.Semaphore(self.concurrency)
+
+        async def _bounded(job_id: str) -> Optional[JobDetails]:
+            async with limit:
+                return await self.fetch(job_id)
+
+        results = await asyncio.gather(*(_bounded(job_id) for job_id in dict.fromkeys(job_ids)))
+        return [details for details in results if details is not None]
+
+    async def _fetch_voyager(self, job_id: str) -> Optional[JobDetails]:
+        csrf = await self._browser.cookie_value("JSESSIONID")
+        if not csrf:
+            return None
+        body = await self._get(VOYAGER_JOB_URL.format(job_id=job_id), {**VOYAGER_HEADERS, "csrf-token": csrf})
+        if body is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _parse_voyager_body, body, job_id)
+
+    async def _fetch_guest(self, job_id: str) -> Optional[JobDetails]:
+        body = await self._get(GUEST_JOB_URL.format(job_id=job_id))
+        if body is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._snapshots is not None:
+            html = body.decode("utf-8", errors="replace")
+            await loop.run_in_executor(None, self._snapshots.save, "job_details", job_id, html)
+        return await loop.run_in_executor(self._executor, _parse_guest_body, body, job_id)
+
+    async def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[bytes]:
+        try:
+            response = await self._browser.api_get(url, headers=headers)
+            if not response.ok:
+                LOGGER.info("Requisição de detalhes da vaga retornou %s: %s", response.status, url)
+                return None
+            return await response.body()
+        except PlaywrightError as exc:
+            LOGGER.warning("Falha ao buscar detalhes da vaga em %s: %s", url, exc)
+            return None
+
+
+__all__ = [
+    "GUEST_JOB_URL",
+    "JobDetailsFetcher",
+    "VOYAGER_JOB_URL",
+    "parse_guest_job_html",
+    "parse_voyager_job",
+]
@@ -0,0 +1,76 @@
+"""Page scripts and selectors used to read LinkedIn job search results."""
+from __future__ import annotations
+
+
+JOBS_PAGE_SIZE = 25
+
+JOB_CARD_SELECTOR = "li[data-occludable-job-id], div.job-card-container[data-job-id]"
+
+JOB_LIST_SELECTORS = [
+    "li[data-occludable-job-id]",
+    "div.job-card-container[data-job-id]",
+    "div.jobs-search-no-results-banner",
+    "div.jobs-search-two-pane__no-results-banner",
+]
+
+# Where each field of a job card is read from (first line of the first match).
+JOB_CARD_FIELD_SELECTORS = {
+    "title": "a.job-card-list__title, a.job-card-container__link, strong",
+    "company": ".artdeco-entity-lockup__subtitle, .job-card-container__primary-description",
+    "location": ".artdeco-entity-lockup__caption, .job-card-container__metadata-item",
+}
+
+# Scrolls every card into view until the lazily rendered list stops growing,
+# then returns the cards as plain JSON in the same evaluate call.
+JOB_CARDS_SCRIPT = """
+async ({ cardSelector, fieldSelectors, maxRounds, settleMs }) => {
+  const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+  // The card container nested in a matched <li> is the same posting; keep the outer match.
+  const cards = () =>
+    Array.from(document.querySelectorAll(cardSelector)).filter(
+      (card) => !card.parentElement || !card.parentElement.closest(cardSelector)
+    );
+  const text = (root, selector) => {
+    const node = root.querySelector(selector);
+    return node ? node.innerText.split("\\n")[0].trim() : "";
+  };
+
+  let previous = -1;
+  for (let round = 0; round < maxRounds; round++) {
+    const current = cards();
+    for (const card of current) {
+      if (!card.querySelector("a[href*='/jobs/view/']")) {
+        card.scrollIntoView({ block: "center" });
+        await sleep(settleMs);
+      }
+    }
+    if (current.length) current[current.length - 1].scrollIntoView({ block: "end" });
+    await sleep(settleMs);
+    const pending = cards().filter((card) => !card.querySelector("a[href*='/jobs/view/']"));
+    if (cards().length === previous && pending.length === 0) break;
+    previous = cards().length;
+  }
+
+  return cards().map((card) => {
+    const footer = card.innerText || "";
+    const time = card.querySelector("time");
+    return {
+      job_id: card.getAttribute("data-occludable-job-id") || card.getAttribute("data-job-id") || "",
+      title: text(card, fieldSelectors.title),
+      company: text(card, fieldSelectors.company),
+      location: text(card, fieldSelectors.location),
+      listed_at: time ? time.getAttribute("datetime") || time.innerText.trim() : "",
+      easy_apply: /Candidatura simplificada|Easy Apply/i.test(footer),
+    };
+  });
+}
+"""
+
+
+__all__ = [
+    "JOBS_PAGE_SIZE",
+    "JOB_CARDS_SCRIPT",
+    "JOB_CARD_FIELD_SELECTORS",
+    "JOB_CARD_SELECTOR",
+    "JOB_LIST_SELECTORS",
+]
@@ -1,39 +1,108 @@
 """High-level automation tasks for LinkedIn navigation and scraping."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Set, Union
 
 from playwright.async_api import Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeoutError
 
 from .browser import LinkedInBrowserController
-from ..models.scrap_user import ExperienceRecord, ScrapUserRepository
+from .html_parsing import SnapshotParserPool
+from .job_details import JobDetailsFetcher
+from .job_extraction import (
+    JOB_CARD_FIELD_SELECTORS,
+    JOB_CARD_SELECTOR,
+    JOB_CARDS_SCRIPT,
+    JOB_LIST_SELECTORS,
+    JOBS_PAGE_SIZE,
+)
+from .profile_extraction import (
+    DETAILS_EXTRACTION_SCRIPT,
+    DETAILS_LOAD_MORE_SELECTOR,
+    DETAILS_SUBPAGES,
+    EXPAND_SEE_MORE_SCRIPT,
+    EXPERIENCE_ENTRY_SELECTOR,
+    PROFILE_EXTRACTION_SCRIPT,
+    PROFILE_SECTIONS,
+    SECTION_ITEM_SELECTOR,
+    SEE_MORE_OPTIONS,
+    ProfileSnapshot,
+    build_profile_snapshot,
+    details_url,
+    join_item_lines,
+    merge_details_sections,
+    parse_experience_lines,
+    section_fingerprints,
+)
+from .scheduler import TaskPriority
+from .selectors import first_matching_selector, first_present_selector
+from ..models.html_snapshots import HtmlSnapshotStore
+from ..models.job_posting import JobDetails, JobPosting
+from ..models.scrap_user import DEFAULT_SCRAP_TEMPLATE, ExperienceRecord, ScrapUserRepository
+from ..models.search_preferences import SearchPreferences, build_jobs_search_url
+from ..models.seen_jobs import SeenJobsIndex
+from ..models.selector_stats import SelectorRegistry
+from ..models.sqlite_store import SQLiteJobRepository
 
 
 class LinkedInActionsController:
     """Encapsulate LinkedIn navigation flows after the login is complete."""
 
     JOBS_URL = "https://www.linkedin.com/jobs/search/"
+    PROFILE_ME_URL = "https://www.linkedin.com/in/me/"
     PROFILE_URL_PATTERN = re.compile(r"/in/[^/]+/?")
+    SECTION_EXTRACTION_DEADLINE = 15.0
+    DETAILS_CRAWL_BUDGET = 30.0
+    JOB_BUFFER_SIZE = 25
 
     def __init__(
         self,
         browser: LinkedInBrowserController,
         scrap_repository: ScrapUserRepository,
+        selector_registry: Optional[SelectorRegistry] = None,
+        company_ids: Optional[Mapping[str, str]] = None,
+        seen_jobs: Optional[SeenJobsIndex] = None,
+        fetched_details: Optional[SeenJobsIndex] = None,
+        snapshot_store: Optional[HtmlSnapshotStore] = None,
+        parser_pool: Optional[SnapshotParserPool] = None,
+        job_repository: Optional[SQLiteJobRepository] = None,
     ) -> None:
         self._browser = browser
         self._scrap_repository = scrap_repository
+        self._selectors = selector_registry
+        self._company_ids = dict(company_ids or {})
+        self._seen_jobs = seen_jobs
+        self._fetched_details = fetched_details
+        self._job_repository = job_repository
+        self._snapshots = snapshot_store
+        self._parsers = parser_pool or (SnapshotParserPool() if snapshot_store is not None else None)
+        self._job_details = JobDetailsFetcher(
+            browser,
+            executor=self._parsers.executor if self._parsers is not None else None,
+            snapshot_store=snapshot_store,
+        )
+        self.last_changed_sections: List[str] = []
 
     # -- public API ---------------------------------------------------------
+    @property
+    def browser(self) -> LinkedInBrowserController:
+        return self._browser
+
+    @property
+    def seen_jobs(self) -> Optional[SeenJobsIndex]:
+        return self._seen_jobs
+
     def open_jobs_page(self):
         """Open the LinkedIn jobs section, trying a direct URL first."""
 
-        return self._browser.run_with_page(self._open_jobs_page)
+        return self._browser.run_with_page(self._open_jobs_page, priority=TaskPriority.INTERACTIVE)
 
     def open_profile_page(self):
         """Navigate to the logged user's profile page."""
 
-        return self._browser.run_with_page(self._open_profile_page)
+        return self._browser.run_with_page(self._open_profile_page, priority=TaskPriority.INTERACTIVE)
 
     def capture_profile_snapshot(self):
         """Open the profile page, scrape relevant data and persist it locally."""
@@ -41,9 +110,161 @@ class LinkedInActionsController:
         return self.scan_profile()
 
     def scan_profile(self):
-        """Run the profile scraping routine ensuring duplicate-free storage."""
+        """Run the profile scraping routine ensuring duplicate-free storage.
+
+        Sections truncated on the main page are completed from their
+        ``/details/`` subpages, crawled in parallel within
+        ``DETAILS_CRAWL_BUDGET`` seconds. With a snapshot store the page HTML
+        is saved and parsed in worker processes after the tab has been
+        returned to the pool.
+        """
 
-        return self._browser.run_with_page(self._capture_profile_snapshot)
+        if self._snapshots is not None:
+            return self._browser.submit(self._scan_profile_offline())
+        return self._browser.submit(self._scan_profile())
+
+    async def iter_jobs(
+        self,
+        preferences: SearchPreferences,
+        *,
+        max_pages: Optional[int] = None,
+        buffer_size: int = JOB_BUFFER_SIZE,
+        skip_seen: bool = False,
+        record_seen: bool = True,
+    ) -> AsyncIterator[JobPosting]:
+        """Yield job postings from a search while later result pages keep loading.
+
+        Must be consumed on the browser event loop (see ``stream_jobs`` for
+        other threads). A producer walks the result pages in a pooled tab and
+        feeds a bounded queue: it runs at most ``buffer_size`` postings ahead
+        of the consumer, so memory stays bounded however long the search is.
+
+        With a seen-jobs index, each posting is recorded once the consumer has
+        handled it (asks for the next one), so postings still buffered when
+        the consumer stops are offered again next time. With ``skip_seen``
+        postings already seen with the same content are not yielded, so
+        callers only open new or changed jobs. ``record_seen=False`` leaves
+        recording to a caller that re-buffers the postings.
+        With a job repository every posting is also stored, in batches of
+        ``JOBS_PAGE_SIZE``.
+        """
+
+        queue: asyncio.Queue[JobPosting] = asyncio.Queue(maxsize=buffer_size)
+        unsaved: List[JobPosting] = []
+
+        async def _produce() -> None:
+            try:
+                async with self._browser.page_session(TaskPriority.BACKGROUND, scrape_mode=True) as page:
+                    async for job in self._walk_job_results(page, preferences, max_pages):
+                        if self._job_repository is not None:
+                            unsaved.append(job)
+                            if len(unsaved) >= JOBS_PAGE_SIZE:
+                                self._job_repository.save_many(unsaved)
+                                unsaved.clear()
+                        if skip_seen and self._seen_jobs is not None and self._seen_jobs.is_unchanged(job):
+                            self._seen_jobs.record(job)
+                            continue
+                        await queue.put(job)
+            finally:
+                if self._seen_jobs is not None:
+                    self._seen_jobs.flush()
+                if self._job_repository is not None and unsaved:
+                    self._job_repository.save_many(unsaved)
+
+        producer = asyncio.ensure_future(_produce())
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    job = getter.result()
+                    yield job
+                    if record_seen and self._seen_jobs is not None:
+                        self._seen_jobs.record(job)
+                    continue
+                getter.cancel()
+                if queue.empty():
+                    break
+            # Re-raise any failure from the producer once the buffer is drained.
+            producer.result()
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            if self._seen_jobs is not None:
+                self._seen_jobs.flush()
+
+    def stream_jobs(
+        self,
+        preferences: SearchPreferences,
+        on_job: Callable[[JobPosting], None],
+        *,
+        max_pages: Optional[int] = None,
+        skip_seen: bool = False,
+    ):
+        """Run ``iter_jobs`` on the browser loop, calling ``on_job`` for each posting.
+
+        ``on_job`` runs on the browser thread; the returned future resolves to
+        the number of postings delivered.
+        """
+
+        async def _consume() -> int:
+            delivered = 0
+            async for job in self.iter_jobs(preferences, max_pages=max_pages, skip_seen=skip_seen):
+                on_job(job)
+                delivered += 1
+            return delivered
+
+        return self._browser.submit(_consume())
+
+    def fetch_job_details(
+        self,
+        jobs: Sequence[Union[JobPosting, str]],
+        *,
+        skip_fetched: bool = True,
+    ) -> "asyncio.Future[List[JobDetails]]":
+        """Fetch the details of several postings over HTTP, without opening their panes.
+
+        With a fetched-details index, postings whose details were already
+        fetched (for a :class:`JobPosting`, with the same content) are skipped
+        unless ``skip_fetched`` is false; a posting is recorded only once its
+        details arrive.
+        """
+
+        index = self._fetched_details
+        postings = [job if isinstance(job, JobPosting) else JobPosting(job_id=str(job)) for job in jobs]
+        if index is not None and skip_fetched:
+            postings = [
+                job
+                for job in postings
+                if not (index.is_unchanged(job) if job.title else job.job_id in index)
+            ]
+
+        async def _fetch() -> List[JobDetails]:
+            details = await self._job_details.fetch_many([job.job_id for job in postings])
+            if index is not None:
+                fetched = {item.job_id for item in details}
+                for job in postings:
+                    if job.job_id in fetched:
+                        index.record(job)
+                index.flush()
+            return details
+
+        return self._browser.submit(_fetch())
+
+    def reparse_profile_snapshot(self):
+        """Parse the latest stored profile HTML again and merge it into ``ScrapUser.json``."""
+
+        if self._snapshots is None:
+            raise RuntimeError("Os snapshots de HTML não estão habilitados.")
+        snapshot = self._snapshots.latest("profile", "me")
+        if snapshot is None:
+            raise RuntimeError("Nenhum snapshot do perfil foi salvo ainda.")
+
+        async def _reparse() -> Dict[str, List[Any]]:
+            raw = await self._parsers.parse(snapshot)
+            return self._store_profile_json(raw)
+
+        return self._browser.submit(_reparse())
 
     # -- core automation routines ------------------------------------------
     async def _open_jobs_page(self, page: Page) -> str:
@@ -58,36 +279,227 @@ class LinkedInActionsController:
         await page.wait_for_load_state("domcontentloaded")
         if self.PROFILE_URL_PATTERN.search(page.url):
             return page.url
+        # A leased tab may be on any page (even about:blank), so go straight
+        # to the profile; LinkedIn redirects /in/me/ to the user's own slug.
+        if await self._try_open_profile_via_url(page):
+            return page.url
+        await self._browser.navigate(page, self._browser.FEED_URL)
         await self._click_profile_entry(page)
         await self._ensure_profile_url(page)
         return page.url
 
-    async def _capture_profile_snapshot(self, page: Page) -> Dict[str, List[Any]]:
-        await self._open_profile_page(page)
-        name = await self._extract_profile_name(page)
-        experiences = await self._extract_experiences(page)
-        education = await self._extract_section_items(page, "education")
-        licenses = await self._extract_section_items(page, "licenses_and_certifications")
-        projects = await self._extract_section_items(page, "projects")
-        skills = await self._extract_section_items(page, "skills")
-        recommendations = await self._extract_section_items(page, "recommendations")
-        publications = await self._extract_section_items(page, "publications")
-        payload = self._scrap_repository.update(
-            nome=name,
-            experiencias=[record.to_dict() for record in experiences],
-            formacao=education,
-            licencas=licenses,
-            projetos=projects,
-            competencias=skills,
-            recomendacoes=recommendations,
-            publicacoes=publications,
-        )
+    async def _scan_profile(self) -> Dict[str, List[Any]]:
+        async with self._browser.page_session(TaskPriority.BACKGROUND, scrape_mode=True) as page:
+            await self._open_profile_page(page)
+            profile_url = page.url
+            try:
+                raw = await self._read_profile_json(page)
+            except PlaywrightError:
+                snapshot = await self._extract_profile_with_locators(page)
+                self.last_changed_sections = list(DEFAULT_SCRAP_TEMPLATE)
+                return self._scrap_repository.update(**snapshot.update_arguments())
+        # The main tab is back in the pool, so every tab can serve the details pages.
+        raw = await self._complete_truncated_sections(profile_url, raw)
+        return self._store_profile_json(raw)
+
+    async def _scan_profile_offline(self) -> Dict[str, List[Any]]:
+        async with self._browser.page_session(TaskPriority.BACKGROUND, scrape_mode=True) as page:
+            await self._open_profile_page(page)
+            await self._find(page, "profile_name", ["main h1", "h1"], timeout=4000)
+            await self._expand_truncated_text(page)
+            profile_url = page.url
+            html = await page.content()
+        # The tab is already back in the pool while the snapshot is written and parsed.
+        loop = asyncio.get_running_loop()
+        snapshot = await loop.run_in_executor(None, self._snapshots.save, "profile", "me", html)
+        raw = await self._parsers.parse(snapshot)
+        raw = await self._complete_truncated_sections(profile_url, raw)
+        return self._store_profile_json(raw)
+
+    async def _complete_truncated_sections(self, profile_url: str, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Crawl the ``/details/`` subpage of every truncated section concurrently.
+
+        Subpages still loading when ``DETAILS_CRAWL_BUDGET`` expires are
+        cancelled and their sections keep the main-page content.
+        """
+
+        sections = [section for section in raw.get("details") or [] if section in DETAILS_SUBPAGES]
+        if not sections:
+            return raw
+        tasks = {
+            asyncio.ensure_future(self._read_details_page(details_url(profile_url, section), section)): section
+            for section in sections
+        }
+        done, pending = await asyncio.wait(tasks, timeout=self.DETAILS_CRAWL_BUDGET)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        details: Dict[str, Any] = {}
+        for task in done:
+            if task.exception() is not None:
+                continue
+            details[tasks[task]] = task.result()
+        return merge_details_sections(raw, details)
+
+    async def _read_details_page(self, url: str, section: str) -> List[Any]:
+        async with self._browser.page_session(TaskPriority.BACKGROUND, scrape_mode=True) as page:
+            await self._browser.navigate(page, url)
+            await self._find(page, f"details:{section}", ["main section", "main"], timeout=4000)
+            items = await page.evaluate(
+                DETAILS_EXTRACTION_SCRIPT,
+                {
+                    "experience": section == "experience",
+                    "itemSelector": SECTION_ITEM_SELECTOR,
+                    "entrySelector": EXPERIENCE_ENTRY_SELECTOR,
+                    "loadMoreSelector": DETAILS_LOAD_MORE_SELECTOR,
+                    "maxRounds": 10,
+                    "settleMs": 400,
+                    "expand": SEE_MORE_OPTIONS,
+                },
+            )
+        return items if isinstance(items, list) else []
+
+    def _store_profile_json(self, raw: Dict[str, Any]) -> Dict[str, List[Any]]:
+        # Only sections whose rendered content changed since the last scan are
+        # parsed and merged.
+        fingerprints = section_fingerprints(raw)
+        previous = self._scrap_repository.load_section_hashes()
+        changed = [section for section, digest in fingerprints.items() if previous.get(section) != digest]
+        self.last_changed_sections = changed
+        if changed:
+            snapshot = build_profile_snapshot(raw, sections=changed)
+            payload = self._scrap_repository.update(**snapshot.update_arguments())
+        else:
+            payload = self._scrap_repository.load()
+        self._scrap_repository.save_section_hashes(fingerprints)
         return payload
 
+    async def _read_profile_json(self, page: Page) -> Dict[str, Any]:
+        """Read every profile section with a single ``page.evaluate`` roundtrip.
+
+        Truncated descriptions are expanded inside the same call, so the full
+        text is read without a roundtrip per "ver mais" toggle.
+        """
+
+        # Wait for the heading so the evaluate call runs on a rendered profile.
+        await self._find(page, "profile_name", ["main h1", "h1"], timeout=4000)
+        return await page.evaluate(
+            PROFILE_EXTRACTION_SCRIPT,
+            {
+                "anchors": list(PROFILE_SECTIONS),
+                "itemSelector": SECTION_ITEM_SELECTOR,
+                "entrySelector": EXPERIENCE_ENTRY_SELECTOR,
+                "detailsSlugs": DETAILS_SUBPAGES,
+                "expand": SEE_MORE_OPTIONS,
+            },
+        )
+
+    async def _expand_truncated_text(self, page: Page) -> int:
+        """Expand every "ver mais" toggle in one evaluate; failures leave the text truncated."""
+
+        try:
+            return int(await page.evaluate(EXPAND_SEE_MORE_SCRIPT, SEE_MORE_OPTIONS) or 0)
+        except PlaywrightError:
+            return 0
+
+    async def _extract_profile_with_locators(self, page: Page) -> ProfileSnapshot:
+        """Run the locator-based extractors concurrently under one deadline.
+
+        The profile heading confirms the page has rendered, after which every
+        section is looked up without waiting: a missing section resolves right
+        away instead of burning its own selector timeouts. Sections still
+        running when the deadline expires are left untouched.
+        """
+
+        snapshot = ProfileSnapshot(name=await self._extract_profile_name(page))
+        await self._expand_truncated_text(page)
+        extractors: Dict[str, Awaitable[Any]] = {"experience": self._extract_experiences(page, loaded=True)}
+        for anchor in PROFILE_SECTIONS:
+            extractors[anchor] = self._extract_section_items(page, anchor, loaded=True)
+
+        tasks = {asyncio.ensure_future(coroutine): key for key, coroutine in extractors.items()}
+        done, pending = await asyncio.wait(tasks, timeout=self.SECTION_EXTRACTION_DEADLINE)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        for task in done:
+            key = tasks[task]
+            result = None if task.exception() is not None else task.result()
+            if key == "experience":
+                snapshot.experiences = result
+            else:
+                snapshot.sections[key] = result
+        return snapshot
+
+    async def _walk_job_results(
+        self,
+        page: Page,
+        preferences: SearchPreferences,
+        max_pages: Optional[int],
+    ) -> AsyncIterator[JobPosting]:
+        seen: Set[str] = set()
+        page_index = 0
+        while max_pages is None or page_index < max_pages:
+            url = self._jobs_search_url(preferences, start=page_index * JOBS_PAGE_SIZE)
+            await self._browser.navigate(page, url)
+            page_ids: Set[str] = set()
+            for raw in await self._read_job_cards(page):
+                job = JobPosting.from_card(raw)
+                if job is None:
+                    continue
+                page_ids.add(job.job_id)
+                if job.job_id in seen:
+                    continue
+                seen.add(job.job_id)
+                yield job
+            # Count postings rather than cards so a duplicated card cannot hide a short last page.
+            if len(page_ids) < JOBS_PAGE_SIZE:
+                return
+            page_index += 1
+
+    async def _read_job_cards(self, page: Page) -> List[Dict[str, Any]]:
+        match = await self._find(page, "job_results", JOB_LIST_SELECTORS, timeout=8000)
+        if match is None or match[0] not in JOB_LIST_SELECTORS[:2]:
+            return []
+        cards = await page.evaluate(
+            JOB_CARDS_SCRIPT,
+            {
+                "cardSelector": JOB_CARD_SELECTOR,
+                "fieldSelectors": JOB_CARD_FIELD_SELECTORS,
+                "maxRounds": 8,
+                "settleMs": 150,
+            },
+        )
+        if self._snapshots is not None:
+            # Keep the fully scrolled list so the cards can be re-parsed offline.
+            html = await page.content()
+            key = hashlib.sha1(page.url.encode("utf-8")).hexdigest()[:16]
+            await asyncio.get_running_loop().run_in_executor(None, self._snapshots.save, "job_cards", key, html)
+        return [card for card in cards or [] if isinstance(card, dict)]
+
+    def _jobs_search_url(self, preferences: SearchPreferences, *, start: int = 0) -> str:
+        return build_jobs_search_url(
+            preferences,
+            start=start,
+            company_ids=self._company_ids,
+            base_url=self.JOBS_URL,
+        )
+
     # -- helpers ------------------------------------------------------------
+    async def _find(self, page: Page, target: str, selectors: List[str], *, timeout: float):
+        return await first_matching_selector(
+            page,
+            selectors,
+            timeout=timeout,
+            registry=self._selectors,
+            target=target,
+        )
+
     async def _try_open_jobs_via_url(self, page: Page) -> bool:
         try:
-            await page.goto(self.JOBS_URL, wait_until="domcontentloaded")
+            await self._browser.navigate(page, self.JOBS_URL)
         except PlaywrightError:
             return False
         return "linkedin.com/jobs" in page.url
@@ -99,16 +511,11 @@ class LinkedInActionsController:
             "a[data-test-app-aware-link][href*='/jobs/']",
             "a:has(span:has-text('Vagas'))",
         ]
-        for selector in selectors:
-            try:
-                element = await page.wait_for_selector(selector, timeout=4000)
-            except PlaywrightTimeoutError:
-                continue
-            if element is None:
-                continue
-            await element.click()
-            return
-        raise RuntimeError("Não foi possível localizar o link de vagas do LinkedIn.")
+        match = await self._find(page, "jobs_nav_link", selectors, timeout=4000)
+        if match is None:
+            raise RuntimeError("Não foi possível localizar o link de vagas do LinkedIn.")
+        _, element = match
+        await element.click()
 
     async def _ensure_jobs_url(self, page: Page) -> None:
         try:
@@ -117,6 +524,13 @@ class LinkedInActionsController:
             if "/jobs" not in page.url:
                 raise RuntimeError("Não foi possível abrir a página de vagas do LinkedIn.")
 
+    async def _try_open_profile_via_url(self, page: Page) -> bool:
+        try:
+            await self._browser.navigate(page, self.PROFILE_ME_URL)
+        except PlaywrightError:
+            return False
+        return bool(self.PROFILE_URL_PATTERN.search(page.url))
+
     async def _click_profile_entry(self, page: Page) -> None:
         selectors = [
             "div.profile-card a.profile-card-profile-link",
@@ -124,19 +538,14 @@ class LinkedInActionsController:
             "div.profile-card-member-details a[href^='/in/']",
             "a[href^='/in/']:has(img[alt*='Ver perfil'])",
         ]
-        for selector in selectors:
-            try:
-                element = await page.wait_for_selector(selector, timeout=4000)
-            except PlaywrightTimeoutError:
-                continue
-            if element is None:
-                continue
-            href = await element.get_attribute("href")
-            await element.click()
-            if href and href.startswith("/in/"):
-                await page.wait_for_load_state("networkidle")
-            return
-        raise RuntimeError("Não foi possível localizar o link do perfil do usuário.")
+        match = await self._find(page, "profile_link", selectors, timeout=4000)
+        if match is None:
+            raise RuntimeError("Não foi possível localizar o link do perfil do usuário.")
+        _, element = match
+        href = await element.get_attribute("href")
+        await element.click()
+        if href and href.startswith("/in/"):
+            await page.wait_for_load_state("networkidle")
 
     async def _ensure_profile_url(self, page: Page) -> None:
         try:
@@ -146,26 +555,25 @@ class LinkedInActionsController:
                 raise RuntimeError("A página do perfil do usuário não pôde ser aberta.")
 
     async def _extract_profile_name(self, page: Page) -> str:
-        selectors = ["main h1", "h1"]
-        for selector in selectors:
+        match = await self._find(page, "profile_name", ["main h1", "h1"], timeout=4000)
+        if match is None:
+            return ""
+        _, element = match
+        return (await element.inner_text()).strip()
+
+    async def _extract_experiences(self, page: Page, *, loaded: bool = False) -> List[ExperienceRecord]:
+        if loaded:
+            match = await first_present_selector(page, ["section:has(#experience)"])
+            if match is None:
+                return []
+            _, section = match
+        else:
             try:
-                element = await page.wait_for_selector(selector, timeout=4000)
+                section = await page.wait_for_selector("section:has(#experience)", timeout=4000)
             except PlaywrightTimeoutError:
-                continue
-            if element is None:
-                continue
-            text = (await element.inner_text()).strip()
-            if text:
-                return text
-        return ""
-
-    async def _extract_experiences(self, page: Page) -> List[ExperienceRecord]:
-        try:
-            section = await page.wait_for_selector("section:has(#experience)", timeout=4000)
-        except PlaywrightTimeoutError:
-            return []
+                return []
         records: List[ExperienceRecord] = []
-        entries = section.locator("div[data-view-name='profile-component-entity']")
+        entries = section.locator(EXPERIENCE_ENTRY_SELECTOR)
         count = await entries.count()
         for index in range(count):
             entry = entries.nth(index)
@@ -186,54 +594,35 @@ class LinkedInActionsController:
         except PlaywrightTimeoutError:
             return None
 
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        cargo = lines[0] if lines else ""
-        empresa = lines[1] if len(lines) > 1 else ""
-        periodo = lines[2] if len(lines) > 2 else ""
-        local = lines[3] if len(lines) > 3 else ""
-
-        descricao = ""
+        description = ""
         description_locator = entry.locator("div[class*='inline-show-more-text']")
         if await description_locator.count() > 0:
-            raw_description = await description_locator.first.inner_text()
-            descricao = raw_description.replace("…ver mais", "").replace("ver mais", "").strip()
-
-        record = ExperienceRecord(
-            cargo=cargo,
-            empresa=empresa,
-            periodo=periodo,
-            local=local,
-            descricao=descricao,
-        )
-        if not any(record.to_dict().values()):
-            return None
-        return record
+            description = await description_locator.first.inner_text()
+
+        return parse_experience_lines(text.splitlines(), description)
 
-    async def _extract_section_items(self, page: Page, anchor_id: str) -> List[str]:
+    async def _extract_section_items(self, page: Page, anchor_id: str, *, loaded: bool = False) -> List[str]:
         selectors = [
             f"section:has(#{anchor_id})",
             f"section[id='{anchor_id}']",
             f"section[data-section='{anchor_id}']",
         ]
-        for selector in selectors:
-            try:
-                section = await page.wait_for_selector(selector, timeout=3000)
-            except PlaywrightTimeoutError:
-                continue
-            if section is None:
-                continue
-            entries = section.locator("li.artdeco-list__item, li.pvs-list__item")
-            count = await entries.count()
-            results: List[str] = []
-            for index in range(count):
-                text = await entries.nth(index).inner_text()
-                cleaned_lines = [line.strip() for line in text.splitlines() if line.strip()]
-                cleaned = " \u2013 ".join(cleaned_lines)
-                if cleaned:
-                    results.append(cleaned)
-            if results:
-                return results
-        return []
+        if loaded:
+            match = await first_present_selector(page, selectors)
+        else:
+            match = await self._find(page, f"section:{anchor_id}", selectors, timeout=3000)
+        if match is None:
+            return []
+        _, section = match
+        entries = section.locator(SECTION_ITEM_SELECTOR)
+        count = await entries.count()
+        results: List[str] = []
+        for index in range(count):
+            text = await entries.nth(index).inner_text()
+            cleaned = join_item_lines(text.splitlines())
+            if cleaned:
+                results.append(cleaned)
+        return results
 
 
 __all__ = ["LinkedInActionsController"]
@@ -0,0 +1,89 @@
+"""Pool of reusable tabs opened on the persistent Playwright context."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+
+class PagePool:
+    """Lease tabs from a browser context so independent automations run side by side.
+
+    The pool never opens more than ``size`` tabs of its own. Tabs that already
+    exist on the context (the one opened by ``launch_persistent_context``) are
+    reused first, and closed tabs are discarded when they are returned.
+    """
+
+    def __init__(self, size: int = 3) -> None:
+        if size < 1:
+            raise ValueError("O pool de abas precisa de pelo menos uma aba.")
+        self.size = size
+        self._context: Optional[BrowserContext] = None
+        self._idle: List[Page] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._leased = 0
+
+    @property
+    def leased(self) -> int:
+        """Number of tabs currently handed out to handlers."""
+
+        return self._leased
+
+    def bind(self, context: BrowserContext) -> None:
+        """Attach the pool to a freshly launched context."""
+
+        self._context = context
+        self._idle = [page for page in context.pages if not page.is_closed()][: self.size]
+        self._slots = asyncio.Semaphore(self.size)
+        self._leased = 0
+
+    def reset(self) -> None:
+        """Forget the current context, typically right after closing it."""
+
+        self._context = None
+        self._idle = []
+        self._slots = None
+        self._leased = 0
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Page]:
+        """Yield an idle tab (opening one if needed) and give it back afterwards."""
+
+        context = self._context
+        slots = self._slots
+        if context is None or slots is None:
+            raise RuntimeError("O pool de abas não está associado a um navegador ativo.")
+
+        await slots.acquire()
+        try:
+            page = await self._take(context)
+        except BaseException:
+            slots.release()
+            raise
+
+        self._leased += 1
+        try:
+            yield page
+        finally:
+            self._give_back(context, page)
+            slots.release()
+
+    async def _take(self, context: BrowserContext) -> Page:
+        while self._idle:
+            page = self._idle.pop(0)
+            if not page.is_closed():
+                return page
+        return await context.new_page()
+
+    def _give_back(self, context: BrowserContext, page: Page) -> None:
+        if context is not self._context:
+            # The context was closed or relaunched while the tab was leased.
+            return
+        self._leased = max(0, self._leased - 1)
+        if not page.is_closed():
+            self._idle.append(page)
+
+
+__all__ = ["PagePool"]
@@ -0,0 +1,332 @@
+"""Single-roundtrip extraction of LinkedIn profile sections."""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, List, Mapping, Optional, Sequence
+
+from ..models.scrap_user import ExperienceRecord
+
+
+# Section anchors on the profile page mapped to ``ScrapUserRepository.update`` arguments.
+PROFILE_SECTIONS: Dict[str, str] = {
+    "education": "formacao",
+    "licenses_and_certifications": "licencas",
+    "projects": "projetos",
+    "skills": "competencias",
+    "recommendations": "recomendacoes",
+    "publications": "publicacoes",
+}
+
+# Stored section names (keys of ``ScrapUser.json``) for each piece of the extraction result.
+PROFILE_SECTION_NAMES: Dict[str, str] = {
+    "name": "Nome",
+    "experience": "Experiência",
+    "education": "Formação",
+    "licenses_and_certifications": "Licenças e certificados",
+    "projects": "Projetos",
+    "skills": "Competências",
+    "recommendations": "Recomendações",
+    "publications": "Publicações",
+}
+
+SECTION_ITEM_SELECTOR = "li.artdeco-list__item, li.pvs-list__item"
+EXPERIENCE_ENTRY_SELECTOR = "div[data-view-name='profile-component-entity']"
+DETAILS_LOAD_MORE_SELECTOR = "button.scaffold-finite-scroll__load-button"
+
+# ``/details/<slug>/`` subpages listing the full content of truncated sections.
+DETAILS_SUBPAGES: Dict[str, str] = {
+    "experience": "experience",
+    "education": "education",
+    "licenses_and_certifications": "certifications",
+    "projects": "projects",
+    "skills": "skills",
+    "recommendations": "recommendations",
+    "publications": "publications",
+}
+
+# Buttons that expand text LinkedIn truncates behind "…ver mais"/"…see more".
+SEE_MORE_TOGGLE_SELECTOR = (
+    "button.inline-show-more-text__button, "
+    "button.lt-line-clamp__more, "
+    "a.lt-line-clamp__more"
+)
+
+# Options for the in-page expansion: stop after ``quietMs`` without DOM
+# mutations, or after ``timeoutMs`` at most.
+SEE_MORE_OPTIONS: Dict[str, Any] = {
+    "toggleSelector": SEE_MORE_TOGGLE_SELECTOR,
+    "quietMs": 250,
+    "timeoutMs": 3000,
+}
+
+# Clicks every collapsed toggle at once and resolves when a MutationObserver
+# has seen the DOM stay quiet, returning how many toggles were expanded.
+_EXPAND_SEE_MORE_FUNCTION = """
+const expandSeeMore = ({ toggleSelector, quietMs, timeoutMs }) => new Promise((resolve) => {
+  const toggles = Array.from(document.querySelectorAll(toggleSelector)).filter(
+    (toggle) => toggle.getAttribute("aria-expanded") !== "true"
+  );
+  if (!toggles.length) return resolve(0);
+  let quiet = null;
+  let deadline = null;
+  const observer = new MutationObserver(() => {
+    clearTimeout(quiet);
+    quiet = setTimeout(finish, quietMs);
+  });
+  function finish() {
+    observer.disconnect();
+    clearTimeout(quiet);
+    clearTimeout(deadline);
+    resolve(toggles.length);
+  }
+  observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+  deadline = setTimeout(finish, timeoutMs);
+  for (const toggle of toggles) toggle.click();
+  quiet = setTimeout(finish, quietMs);
+});
+"""
+
+# Standalone expansion, used before reading the raw HTML of a page.
+EXPAND_SEE_MORE_SCRIPT = f"""
+async (options) => {{
+{_EXPAND_SEE_MORE_FUNCTION}
+  return expandSeeMore(options);
+}}
+"""
+
+# Runs inside the page and returns every section as plain JSON in one evaluate
+# call, after expanding truncated descriptions when ``expand`` options are given.
+PROFILE_EXTRACTION_SCRIPT = """
+async ({ anchors, itemSelector, entrySelector, detailsSlugs, expand }) => {
+  // @expandSeeMore
+  if (expand) await expandSeeMore(expand);
+  const lines = (text) => (text || "").split("\\n").map((line) => line.trim()).filter(Boolean);
+  const findSection = (id) => {
+    const anchor = document.getElementById(id);
+    const section = anchor ? anchor.closest("section") : null;
+    return section || document.querySelector(`section[id='${id}'], section[data-section='${id}']`);
+  };
+  const heading = document.querySelector("main h1") || document.querySelector("h1");
+  const result = { name: heading ? heading.innerText.trim() : "", experiences: null, sections: {}, details: [] };
+  // Sections with a "show all" link are truncated and listed in full on a details subpage.
+  for (const [id, slug] of Object.entries(detailsSlugs)) {
+    const section = findSection(id);
+    if (section && section.querySelector(`a[href*='/details/${slug}']`)) result.details.push(id);
+  }
+
+  const experience = findSection("experience");
+  if (experience) {
+    result.experiences = [];
+    for (const entry of experience.querySelectorAll(entrySelector)) {
+      const details =
+        entry.querySelector("a[href*='add-edit/POSITION']") ||
+        entry.querySelector("a[href*='/details/experience']");
+      if (!details) continue;
+      const description = entry.querySelector("div[class*='inline-show-more-text']");
+      result.experiences.push({
+        lines: lines(details.innerText),
+        description: description ? description.innerText : "",
+      });
+    }
+  }
+
+  for (const id of anchors) {
+    const section = findSection(id);
+    result.sections[id] = section
+      ? Array.from(section.querySelectorAll(itemSelector), (item) => lines(item.innerText))
+      : null;
+  }
+  return result;
+}
+""".replace("  // @expandSeeMore", _EXPAND_SEE_MORE_FUNCTION)
+
+
+# Runs on a ``/details/<slug>/`` page: loads every paginated item, then
+# returns experience entries or plain item lines like the main-page script.
+DETAILS_EXTRACTION_SCRIPT = """
+async ({ experience, itemSelector, entrySelector, loadMoreSelector, maxRounds, settleMs, expand }) => {
+  // @expandSeeMore
+  const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+  const lines = (text) => (text || "").split("\\n").map((line) => line.trim()).filter(Boolean);
+  for (let round = 0; round < maxRounds; round++) {
+    const button = document.querySelector(loadMoreSelector);
+    if (!button) break;
+    button.click();
+    await sleep(settleMs);
+  }
+  if (expand) await expandSeeMore(expand);
+  const main = document.querySelector("main") || document.body;
+  if (experience) {
+    return Array.from(main.querySelectorAll(entrySelector), (entry) => {
+      const description = entry.querySelector("div[class*='inline-show-more-text']");
+      const hidden = new Set(lines(description ? description.innerText : ""));
+      return {
+        lines: lines(entry.innerText).filter((line) => !hidden.has(line)),
+        description: description ? description.innerText : "",
+      };
+    });
+  }
+  return Array.from(main.querySelectorAll(itemSelector))
+    .filter((item) => !(item.parentElement && item.parentElement.closest(itemSelector)))
+    .map((item) => lines(item.innerText));
+}
+""".replace("  // @expandSeeMore", _EXPAND_SEE_MORE_FUNCTION)
+
+
+def details_url(profile_url: str, section: str) -> str:
+    """URL of the subpage listing every item of ``section`` for a profile."""
+
+    base = profile_url.split("?", 1)[0].split("#", 1)[0].rstrip("/")
+    return f"{base}/details/{DETAILS_SUBPAGES[section]}/"
+
+
+def merge_details_sections(raw: Mapping[str, Any], details: Mapping[str, Any]) -> Dict[str, Any]:
+    """Replace truncated main-page lists with the full lists read from details pages.
+
+    Empty or missing details results keep the main-page content.
+    """
+
+    merged: Dict[str, Any] = dict(raw)
+    sections = dict(raw.get("sections") or {})
+    for section, items in details.items():
+        if not isinstance(items, list) or not items:
+            continue
+        if section == "experience":
+            merged["experiences"] = items
+        else:
+            sections[section] = items
+    merged["sections"] = sections
+    return merged
+
+
+_TOGGLE_LABELS = ("…ver mais", "…ver menos", "ver mais", "ver menos", "…see more", "…see less")
+
+
+def clean_description(raw: str) -> str:
+    """Strip the "ver mais"/"ver menos" toggle labels LinkedIn appends to truncated text."""
+
+    for label in _TOGGLE_LABELS:
+        raw = raw.replace(label, "")
+    return raw.strip()
+
+
+def parse_experience_lines(lines: Sequence[str], description: str = "") -> Optional[ExperienceRecord]:
+    """Build an :class:`ExperienceRecord` from the text lines of an experience entry."""
+
+    lines = [line.strip() for line in lines if line and line.strip()]
+    record = ExperienceRecord(
+        cargo=lines[0] if lines else "",
+        empresa=lines[1] if len(lines) > 1 else "",
+        periodo=lines[2] if len(lines) > 2 else "",
+        local=lines[3] if len(lines) > 3 else "",
+        descricao=clean_description(description),
+    )
+    if not any(record.to_dict().values()):
+        return None
+    return record
+
+
+def join_item_lines(lines: Sequence[str]) -> str:
+    """Collapse the lines of a list item into the single string stored on disk."""
+
+    return " – ".join(line.strip() for line in lines if line and line.strip())
+
+
+@dataclass(slots=True)
+class ProfileSnapshot:
+    """Structured profile data ready to be merged into ``ScrapUserRepository``.
+
+    ``None`` values mark sections that were not present on the page (or were
+    skipped because they did not change), so the repository leaves them
+    untouched.
+    """
+
+    name: Optional[str] = ""
+    experiences: Optional[List[ExperienceRecord]] = None
+    sections: Dict[str, Optional[List[str]]] = field(default_factory=dict)
+
+    def update_arguments(self) -> Dict[str, Any]:
+        arguments: Dict[str, Any] = {
+            "nome": self.name,
+            "experiencias": (
+                None if self.experiences is None else [record.to_dict() for record in self.experiences]
+            ),
+        }
+        for anchor, argument in PROFILE_SECTIONS.items():
+            arguments[argument] = self.sections.get(anchor)
+        return arguments
+
+
+def section_fingerprints(raw: Mapping[str, Any] | None) -> Dict[str, str]:
+    """Hash the rendered content of each section, keyed by stored section name."""
+
+    raw = raw or {}
+    raw_sections = raw.get("sections") or {}
+    parts: Dict[str, Any] = {"name": raw.get("name"), "experience": raw.get("experiences")}
+    for anchor in PROFILE_SECTIONS:
+        parts[anchor] = raw_sections.get(anchor) if isinstance(raw_sections, dict) else None
+    return {
+        PROFILE_SECTION_NAMES[key]: hashlib.sha256(
+            json.dumps(value, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        for key, value in parts.items()
+    }
+
+
+def build_profile_snapshot(
+    raw: Mapping[str, Any] | None,
+    sections: Optional[Collection[str]] = None,
+) -> ProfileSnapshot:
+    """Map the JSON returned by :data:`PROFILE_EXTRACTION_SCRIPT` onto a snapshot.
+
+    When ``sections`` is given, only those stored section names are parsed;
+    the others are left as ``None`` so the repository does not merge them.
+    """
+
+    raw = raw or {}
+
+    def _wanted(key: str) -> bool:
+        return sections is None or PROFILE_SECTION_NAMES[key] in sections
+
+    snapshot = ProfileSnapshot(name=str(raw.get("name") or "").strip() if _wanted("name") else None)
+
+    raw_experiences = raw.get("experiences")
+    if _wanted("experience") and isinstance(raw_experiences, list):
+        snapshot.experiences = []
+        for entry in raw_experiences:
+            if not isinstance(entry, dict):
+                continue
+            record = parse_experience_lines(entry.get("lines") or [], str(entry.get("description") or ""))
+            if record is not None:
+                snapshot.experiences.append(record)
+
+    raw_sections = raw.get("sections") or {}
+    for anchor in PROFILE_SECTIONS:
+        items = raw_sections.get(anchor) if isinstance(raw_sections, dict) else None
+        if not _wanted(anchor) or not isinstance(items, list):
+            snapshot.sections[anchor] = None
+            continue
+        joined = (join_item_lines(item) for item in items if isinstance(item, list))
+        snapshot.sections[anchor] = [text for text in joined if text]
+    return snapshot
+
+
+__all__ = [
+    "DETAILS_EXTRACTION_SCRIPT",
+    "EXPAND_SEE_MORE_SCRIPT",
+    "DETAILS_SUBPAGES",
+    "PROFILE_EXTRACTION_SCRIPT",
+    "PROFILE_SECTIONS",
+    "PROFILE_SECTION_NAMES",
+    "SEE_MORE_OPTIONS",
+    "ProfileSnapshot",
+    "build_profile_snapshot",
+    "clean_description",
+    "details_url",
+    "join_item_lines",
+    "merge_details_sections",
+    "parse_experience_lines",
+    "section_fingerprints",
+]
@@ -0,0 +1,165 @@
+"""Adaptive pacing of LinkedIn navigations and checkpoint/CAPTCHA detection."""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlparse
+
+
+# Statuses LinkedIn answers with when it throttles a client (999 is LinkedIn specific).
+THROTTLE_STATUSES = frozenset({429, 999})
+
+# First path segments of LinkedIn's security checkpoints and challenges.
+CHALLENGE_PATH_ROOTS = frozenset({"checkpoint", "challenge"})
+# CAPTCHA pages live under ``/uas/captcha...``.
+CAPTCHA_PATH_PREFIX = ("uas", "captcha")
+
+
+def is_challenge_url(url: str) -> bool:
+    """Return ``True`` when ``url`` points at a checkpoint or CAPTCHA page.
+
+    Only the leading path segments are inspected, so search keywords in the
+    query string or profile slugs such as ``/in/challenger-silva/`` never match.
+    """
+
+    segments = [segment for segment in urlparse(url or "").path.lower().split("/") if segment]
+    if not segments:
+        return False
+    if segments[0] in CHALLENGE_PATH_ROOTS:
+        return True
+    root, prefix = CAPTCHA_PATH_PREFIX
+    return len(segments) > 1 and segments[0] == root and segments[1].startswith(prefix)
+
+
+class ChallengeDetectedError(RuntimeError):
+    """Raised when a navigation lands on a checkpoint or CAPTCHA page."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__(
+            "O LinkedIn solicitou uma verificação de segurança. Resolva-a no navegador para continuar."
+        )
+        self.url = url
+
+
+@dataclass(slots=True)
+class RateLimiterStats:
+    """Snapshot of the limiter state for logs and diagnostics."""
+
+    rate: float
+    tokens: float
+    throttled_responses: int
+    slow_responses: int
+    backoff_seconds: float
+
+
+class AdaptiveRateLimiter:
+    """Token bucket shared by every navigation, with AIMD rate control.
+
+    Each navigation takes one token; tokens refill at ``rate`` per second up
+    to ``burst``. A throttling status (429/999) or a response slower than
+    ``latency_target`` halves the rate, and throttling also imposes an
+    exponential backoff before the next token is handed out. Every healthy
+    response raises the rate by ``increase_step`` until ``max_rate``.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 0.5,
+        burst: int = 3,
+        min_rate: float = 0.05,
+        max_rate: float = 1.0,
+        increase_step: float = 0.05,
+        latency_target: float = 4.0,
+        max_backoff: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("A taxa inicial deve estar entre min_rate e max_rate.")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.latency_target = latency_target
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self._throttled = 0
+        self._slow = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a navigation may start."""
+
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                wait = max(0.0, self._blocked_until - now)
+                if wait == 0.0 and self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                if wait == 0.0:
+                    wait = (1.0 - self._tokens) / self.rate
+                await self._sleep(wait)
+
+    def record_response(self, status: Optional[int], latency: float) -> None:
+        """Adapt the rate to the outcome of a navigation."""
+
+        if status in THROTTLE_STATUSES:
+            self.record_throttle()
+            return
+        self._consecutive_throttles = 0
+        if latency > self.latency_target:
+            self._slow += 1
+            self._decrease()
+        else:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def record_throttle(self) -> None:
+        """Back off after LinkedIn answered with a throttling status."""
+
+        self._throttled += 1
+        self._consecutive_throttles += 1
+        self._decrease()
+        backoff = min(self.max_backoff, 2.0 ** self._consecutive_throttles)
+        self._blocked_until = max(self._blocked_until, self._clock() + backoff)
+
+    def stats(self) -> RateLimiterStats:
+        now = self._clock()
+        self._refill(now)
+        return RateLimiterStats(
+            rate=self.rate,
+            tokens=self._tokens,
+            throttled_responses=self._throttled,
+            slow_responses=self._slow,
+            backoff_seconds=max(0.0, self._blocked_until - now),
+        )
+
+    def _decrease(self) -> None:
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 1.0)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "CAPTCHA_PATH_PREFIX",
+    "CHALLENGE_PATH_ROOTS",
+    "ChallengeDetectedError",
+    "RateLimiterStats",
+    "THROTTLE_STATUSES",
+    "is_challenge_url",
+]
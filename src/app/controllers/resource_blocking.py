@@ -0,0 +1,115 @@
+"""Request routing that strips heavy resources while scraping text."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Pattern, Tuple
+
+from playwright.async_api import Page, Request, Route
+
+
+DEFAULT_BLOCKED_RESOURCE_TYPES: FrozenSet[str] = frozenset({"image", "media", "font"})
+
+DEFAULT_BLOCKED_URL_PATTERNS: Tuple[str, ...] = (
+    r"linkedin\.com/li/track",
+    r"linkedin\.com/.*/sensorCollect",
+    r"px\.ads\.linkedin\.com",
+    r"snap\.licdn\.com/li\.lms-analytics",
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+)
+
+# Rough transfer sizes used to estimate the bandwidth saved by an aborted request.
+ESTIMATED_RESOURCE_SIZES: Dict[str, int] = {
+    "image": 40_000,
+    "media": 400_000,
+    "font": 30_000,
+    "stylesheet": 25_000,
+    "script": 50_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+    "ping": 500,
+    "beacon": 500,
+}
+DEFAULT_ESTIMATED_SIZE = 1_000
+
+
+@dataclass(slots=True)
+class BlockList:
+    """Resource types and URL patterns dropped while scrape mode is active."""
+
+    resource_types: FrozenSet[str] = DEFAULT_BLOCKED_RESOURCE_TYPES
+    url_patterns: Tuple[str, ...] = DEFAULT_BLOCKED_URL_PATTERNS
+    _compiled: Tuple[Pattern[str], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.resource_types = frozenset(self.resource_types)
+        self.url_patterns = tuple(self.url_patterns)
+        self._compiled = tuple(re.compile(pattern) for pattern in self.url_patterns)
+
+    def matches(self, resource_type: str, url: str) -> bool:
+        """Return ``True`` when a request should be aborted."""
+
+        if resource_type in self.resource_types:
+            return True
+        return any(pattern.search(url) for pattern in self._compiled)
+
+
+@dataclass(slots=True)
+class ScrapeStats:
+    """Counters collected while scrape mode routed a page's requests."""
+
+    allowed_requests: int = 0
+    blocked_requests: int = 0
+    estimated_bytes_saved: int = 0
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+
+    def record_blocked(self, resource_type: str) -> None:
+        self.blocked_requests += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.estimated_bytes_saved += ESTIMATED_RESOURCE_SIZES.get(resource_type, DEFAULT_ESTIMATED_SIZE)
+
+    def merge(self, other: "ScrapeStats") -> None:
+        """Add the counters of ``other`` to these."""
+
+        self.allowed_requests += other.allowed_requests
+        self.blocked_requests += other.blocked_requests
+        self.estimated_bytes_saved += other.estimated_bytes_saved
+        for resource_type, count in other.blocked_by_type.items():
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + count
+
+
+class ResourceBlocker:
+    """Attach a route handler to a page and abort requests matching a block list."""
+
+    ROUTE_PATTERN = "**/*"
+
+    def __init__(self, blocklist: BlockList | None = None) -> None:
+        self.blocklist = blocklist or BlockList()
+        self.stats = ScrapeStats()
+
+    async def attach(self, page: Page) -> None:
+        await page.route(self.ROUTE_PATTERN, self._handle)
+
+    async def detach(self, page: Page) -> None:
+        if page.is_closed():
+            return
+        await page.unroute(self.ROUTE_PATTERN, self._handle)
+
+    async def _handle(self, route: Route, request: Request) -> None:
+        if self.blocklist.matches(request.resource_type, request.url):
+            self.stats.record_blocked(request.resource_type)
+            await route.abort("blockedbyclient")
+            return
+        self.stats.allowed_requests += 1
+        await route.continue_()
+
+
+__all__ = [
+    "BlockList",
+    "DEFAULT_BLOCKED_RESOURCE_TYPES",
+    "DEFAULT_BLOCKED_URL_PATTERNS",
+    "ResourceBlocker",
+    "ScrapeStats",
+]
@@ -0,0 +1,195 @@
+"""Asyncio-native scheduler that orders browser work by priority."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, TypeVar
+
+
+T = TypeVar("T")
+
+
+class TaskPriority(IntEnum):
+    """Priority classes for browser work, lower values run first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    PREFETCH = 2
+
+
+@dataclass(slots=True)
+class SchedulerStats:
+    """Point-in-time metrics describing the scheduler queue."""
+
+    queued: int
+    running: int
+    completed: int
+    max_queue_depth: int
+    queued_by_priority: Dict[TaskPriority, int] = field(default_factory=dict)
+    paused: bool = False
+
+
+@dataclass(slots=True, eq=False)
+class _Ticket:
+    priority: TaskPriority
+    sequence: int
+    enqueued_at: float
+    exclusive: bool
+    ready: asyncio.Future
+
+
+class BrowserScheduler:
+    """Grant slots for browser work without ever blocking the event loop.
+
+    Up to ``capacity`` tasks run at the same time (one per pooled tab). Waiting
+    tasks are served by priority and, within the same priority, in arrival
+    order. A task that waits longer than ``aging_seconds`` is promoted one
+    priority level per interval, so prefetch work is delayed but never starved.
+    Exclusive tasks (closing or relaunching the context) wait for the running
+    tasks to finish and hold back everyone else while they run. While paused
+    no new slot is granted; running tasks finish and the queue keeps waiting.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        aging_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("O agendador precisa de pelo menos uma vaga de execução.")
+        self.capacity = capacity
+        self.aging_seconds = aging_seconds
+        self._clock = clock
+        self._sequence = itertools.count()
+        self._waiting: List[_Ticket] = []
+        self._running = 0
+        self._exclusive_active = False
+        self._completed = 0
+        self._max_queue_depth = 0
+        self._paused = False
+
+    # -- metrics ------------------------------------------------------------
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks waiting for a slot."""
+
+        return len(self._waiting)
+
+    def stats(self) -> SchedulerStats:
+        by_priority = {priority: 0 for priority in TaskPriority}
+        for ticket in self._waiting:
+            by_priority[ticket.priority] += 1
+        return SchedulerStats(
+            queued=len(self._waiting),
+            running=self._running,
+            completed=self._completed,
+            max_queue_depth=self._max_queue_depth,
+            queued_by_priority=by_priority,
+            paused=self._paused,
+        )
+
+    # -- flow control -------------------------------------------------------
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def pause(self) -> None:
+        """Stop granting slots until :meth:`resume` is called."""
+
+        self._paused = True
+
+    def resume(self) -> None:
+        """Grant slots again, serving the tasks queued during the pause."""
+
+        self._paused = False
+        self._dispatch()
+
+    # -- scheduling ---------------------------------------------------------
+    async def run(
+        self,
+        factory: Callable[[], Awaitable[T]],
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        *,
+        exclusive: bool = False,
+    ) -> T:
+        """Wait for a slot and await the coroutine produced by ``factory``."""
+
+        async with self.slot(priority, exclusive=exclusive):
+            return await factory()
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: TaskPriority = TaskPriority.BACKGROUND,
+        *,
+        exclusive: bool = False,
+    ) -> AsyncIterator[None]:
+        """Hold a scheduler slot for the duration of the ``async with`` block."""
+
+        ticket = _Ticket(
+            priority=TaskPriority(priority),
+            sequence=next(self._sequence),
+            enqueued_at=self._clock(),
+            exclusive=exclusive,
+            ready=asyncio.get_running_loop().create_future(),
+        )
+        self._waiting.append(ticket)
+        self._max_queue_depth = max(self._max_queue_depth, len(self._waiting))
+        self._dispatch()
+
+        try:
+            await ticket.ready
+        except asyncio.CancelledError:
+            if ticket.ready.cancelled():
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+                self._dispatch()
+            else:
+                # The slot was granted right before the waiter got cancelled.
+                self._release(ticket)
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(ticket)
+
+    def _effective_priority(self, ticket: _Ticket, now: float) -> int:
+        if self.aging_seconds <= 0:
+            return int(ticket.priority)
+        promotions = int((now - ticket.enqueued_at) / self.aging_seconds)
+        return max(int(TaskPriority.INTERACTIVE), int(ticket.priority) - promotions)
+
+    def _dispatch(self) -> None:
+        self._waiting = [ticket for ticket in self._waiting if not ticket.ready.cancelled()]
+        while self._waiting and not self._exclusive_active and not self._paused:
+            now = self._clock()
+            ticket = min(
+                self._waiting,
+                key=lambda item: (self._effective_priority(item, now), item.sequence),
+            )
+            if ticket.exclusive:
+                if self._running:
+                    return
+                self._exclusive_active = True
+            elif self._running >= self.capacity:
+                return
+            self._waiting.remove(ticket)
+            self._running += 1
+            ticket.ready.set_result(None)
+
+    def _release(self, ticket: _Ticket) -> None:
+        self._running = max(0, self._running - 1)
+        if ticket.exclusive:
+            self._exclusive_active = False
+        self._completed += 1
+        self._dispatch()
+
+
+__all__ = ["BrowserScheduler", "SchedulerStats", "TaskPriority"]
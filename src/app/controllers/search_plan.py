@@ -0,0 +1,157 @@
+"""Fan-out execution of several job searches over the browser's pooled tabs."""
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import replace
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Sequence, Set
+
+from ..models.job_posting import JobPosting
+from ..models.search_preferences import SearchPreferences
+from .linkedin_actions import LinkedInActionsController
+
+
+# Keywords and locations accept several values separated by ";" or line breaks.
+_QUERY_SEPARATOR = re.compile(r"[;\n]")
+
+
+def _split_terms(raw: str) -> List[str]:
+    return list(dict.fromkeys(term.strip() for term in _QUERY_SEPARATOR.split(raw) if term.strip()))
+
+
+def expand_search_plan(
+    preferences: SearchPreferences,
+    *,
+    keywords: Optional[Iterable[str]] = None,
+    locations: Optional[Iterable[str]] = None,
+) -> List[SearchPreferences]:
+    """Cross every keyword with every location, keeping the remaining filters.
+
+    Without explicit ``keywords``/``locations`` the values are read from the
+    preferences themselves, split on ``;``. An empty side counts as a single
+    blank term so a search with only keywords still produces queries.
+    """
+
+    keyword_terms = list(dict.fromkeys(keywords)) if keywords is not None else _split_terms(preferences.keywords)
+    location_terms = (
+        list(dict.fromkeys(locations)) if locations is not None else _split_terms(preferences.location)
+    )
+    return [
+        replace(
+            preferences,
+            keywords=keyword,
+            location=location,
+            experience_levels=list(preferences.experience_levels),
+            companies=list(preferences.companies),
+        )
+        for keyword in keyword_terms or [""]
+        for location in location_terms or [""]
+    ]
+
+
+class SearchPlanExecutor:
+    """Run many job searches concurrently and merge them into one stream.
+
+    At most ``concurrency`` searches run at a time (by default one per pooled
+    tab); each walks its own result pages through
+    :meth:`LinkedInActionsController.iter_jobs`. Postings are deduplicated by
+    job id across all queries and handed over through a bounded queue, so the
+    searches pause while the consumer is busy.
+    """
+
+    BUFFER_SIZE = 50
+
+    def __init__(self, actions: LinkedInActionsController, *, concurrency: Optional[int] = None) -> None:
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("A concorrência do plano de busca deve ser positiva.")
+        self._actions = actions
+        self.concurrency = concurrency
+
+    async def iter_jobs(
+        self,
+        queries: Sequence[SearchPreferences],
+        *,
+        max_pages: Optional[int] = None,
+        buffer_size: int = BUFFER_SIZE,
+        skip_seen: bool = False,
+    ) -> AsyncIterator[JobPosting]:
+        """Yield unique postings from every query as soon as any search finds them.
+
+        Must be consumed on the browser event loop. A query that fails does
+        not stop the others; the first failure is re-raised once every query
+        has finished and the buffer is drained. ``skip_seen`` is forwarded to
+        :meth:`LinkedInActionsController.iter_jobs`; postings are recorded in
+        its seen-jobs index here, once the consumer has handled them.
+        """
+
+        limit = asyncio.Semaphore(self._resolve_concurrency())
+        queue: asyncio.Queue[JobPosting] = asyncio.Queue(maxsize=buffer_size)
+        seen: Set[str] = set()
+        seen_jobs = getattr(self._actions, "seen_jobs", None)
+
+        async def _run(query: SearchPreferences) -> None:
+            async with limit:
+                async for job in self._actions.iter_jobs(
+                    query, max_pages=max_pages, skip_seen=skip_seen, record_seen=False
+                ):
+                    if job.job_id in seen:
+                        continue
+                    seen.add(job.job_id)
+                    await queue.put(job)
+
+        workers = [asyncio.ensure_future(_run(query)) for query in queries]
+        finished = asyncio.ensure_future(asyncio.gather(*workers, return_exceptions=True))
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, finished}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    job = getter.result()
+                    yield job
+                    # Only postings the consumer handled count as seen.
+                    if seen_jobs is not None:
+                        seen_jobs.record(job)
+                    continue
+                getter.cancel()
+                if queue.empty():
+                    break
+            for outcome in finished.result():
+                if isinstance(outcome, BaseException):
+                    raise outcome
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(finished, *workers, return_exceptions=True)
+            if seen_jobs is not None:
+                seen_jobs.flush()
+
+    def stream_jobs(
+        self,
+        queries: Sequence[SearchPreferences],
+        on_job: Callable[[JobPosting], None],
+        *,
+        max_pages: Optional[int] = None,
+        skip_seen: bool = False,
+    ):
+        """Run ``iter_jobs`` on the browser loop, calling ``on_job`` for each posting.
+
+        ``on_job`` runs on the browser thread; the returned future resolves to
+        the number of unique postings delivered.
+        """
+
+        async def _consume() -> int:
+            delivered = 0
+            async for job in self.iter_jobs(queries, max_pages=max_pages, skip_seen=skip_seen):
+                on_job(job)
+                delivered += 1
+            return delivered
+
+        return self._actions.browser.submit(_consume())
+
+    def _resolve_concurrency(self) -> int:
+        if self.concurrency is not None:
+            return self.concurrency
+        return max(1, getattr(self._actions.browser, "page_pool_size", 1))
+
+
+__all__ = ["SearchPlanExecutor", "expand_search_plan"]
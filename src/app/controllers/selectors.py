@@ -0,0 +1,125 @@
+"""Selector helpers shared by the Playwright controllers."""
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, Optional, Sequence, Tuple
+
+from playwright.async_api import ElementHandle, Error as PlaywrightError, Page
+
+from ..models.selector_stats import SelectorRegistry
+
+
+async def first_matching_selector(
+    page: Page,
+    selectors: Sequence[str],
+    *,
+    timeout: float = 4000,
+    state: str = "visible",
+    registry: Optional[SelectorRegistry] = None,
+    target: Optional[str] = None,
+) -> Optional[Tuple[str, ElementHandle]]:
+    """Wait on every candidate at once and return the first selector that matches.
+
+    The remaining waits are cancelled as soon as one candidate resolves, so
+    stale selectors cost a single ``timeout`` in total instead of one each.
+    When several candidates resolve together the earlier one in ``selectors``
+    wins. Returns ``None`` when no candidate matches within ``timeout``.
+
+    With a ``registry`` and ``target`` the candidates are ranked by past
+    success, the top-ranked one is checked immediately without waiting, and
+    the outcome of the lookup is recorded. A ``timeout`` of zero only probes
+    the DOM as it is, for elements that are usually absent.
+    """
+
+    if not selectors:
+        return None
+    if registry is None or target is None:
+        if timeout <= 0:
+            return await _probe_selectors(page, selectors, state)
+        return await _race_selectors(page, selectors, timeout=timeout, state=state)
+
+    ranked = registry.rank(target, selectors)
+    match = await _check_immediately(page, ranked[0], state)
+    if match is None:
+        if timeout <= 0:
+            match = await _probe_selectors(page, ranked[1:], state)
+        else:
+            match = await _race_selectors(page, ranked, timeout=timeout, state=state)
+    registry.record(target, ranked, match[0] if match else None)
+    return match
+
+
+async def first_present_selector(
+    page: Page,
+    selectors: Sequence[str],
+) -> Optional[Tuple[str, ElementHandle]]:
+    """Return the first candidate already attached to the DOM, without waiting.
+
+    Meant for pages confirmed to be rendered, where a missing element means
+    the content is absent rather than still loading.
+    """
+
+    for selector in selectors:
+        try:
+            element = await page.query_selector(selector)
+        except PlaywrightError:
+            continue
+        if element is not None:
+            return selector, element
+    return None
+
+
+async def _check_immediately(page: Page, selector: str, state: str) -> Optional[Tuple[str, ElementHandle]]:
+    try:
+        element = await page.query_selector(selector)
+        if element is None:
+            return None
+        if state == "visible" and not await element.is_visible():
+            return None
+    except PlaywrightError:
+        return None
+    return selector, element
+
+
+async def _probe_selectors(page: Page, selectors: Sequence[str], state: str) -> Optional[Tuple[str, ElementHandle]]:
+    for selector in selectors:
+        match = await _check_immediately(page, selector, state)
+        if match is not None:
+            return match
+    return None
+
+
+async def _race_selectors(
+    page: Page,
+    selectors: Sequence[str],
+    *,
+    timeout: float,
+    state: str,
+) -> Optional[Tuple[str, ElementHandle]]:
+    tasks: Dict[asyncio.Future, str] = {
+        asyncio.ensure_future(page.wait_for_selector(selector, timeout=timeout, state=state)): selector
+        for selector in selectors
+    }
+    order = {selector: index for index, selector in enumerate(selectors)}
+    winner: Optional[Tuple[str, ElementHandle]] = None
+    try:
+        pending = set(tasks)
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda item: order[tasks[item]]):
+                if task.cancelled() or task.exception() is not None:
+                    continue
+                element = task.result()
+                if element is not None:
+                    winner = (tasks[task], element)
+                    break
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        # Drain the losers so their timeouts are never reported as unretrieved.
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return winner
+
+
+__all__ = ["first_matching_selector", "first_present_selector"]
@@ -0,0 +1,178 @@
+"""Background installation of the Playwright WebKit runtime with a cached manifest."""
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+LOGGER = logging.getLogger(__name__)
+
+ProgressListener = Callable[[str], None]
+
+
+def _playwright_fingerprint() -> Dict[str, str]:
+    """Identify the installed Playwright package and its bundled driver."""
+
+    try:
+        from playwright._repo_version import version
+    except ImportError:  # pragma: no cover - depends on the installed wheel
+        version = "unknown"
+    try:
+        from playwright._impl._driver import compute_driver_executable
+
+        driver = compute_driver_executable()
+        driver_path = " ".join(str(part) for part in driver) if isinstance(driver, tuple) else str(driver)
+    except Exception:  # noqa: BLE001 - private API may change between releases
+        driver_path = "unknown"
+    return {"playwright_version": str(version), "driver_path": driver_path}
+
+
+def _resolve_webkit_executable() -> str:
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        return playwright.webkit.executable_path
+
+
+class WebKitInstaller:
+    """Make sure the WebKit runtime exists without blocking the Tk main thread.
+
+    A manifest in ``storage/`` remembers which Playwright version and driver
+    the runtime was installed for, so regular starts only compare the manifest
+    and check that the executable still exists.
+    """
+
+    MANIFEST_FILENAME = "webkit_install.json"
+
+    def __init__(self, storage_dir: Path) -> None:
+        self.storage_dir = storage_dir
+        self.manifest_path = storage_dir / self.MANIFEST_FILENAME
+        self.status = "Runtime do WebKit ainda não verificado."
+        self.error: Optional[Exception] = None
+        self._ready = threading.Event()
+        self._listeners: List[ProgressListener] = []
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # -- public API ---------------------------------------------------------
+    def add_listener(self, listener: ProgressListener) -> None:
+        """Receive progress messages (called from the installer thread)."""
+
+        self._listeners.append(listener)
+        listener(self.status)
+
+    def remove_listener(self, listener: ProgressListener) -> None:
+        """Stop sending progress messages to ``listener``."""
+
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def is_installed(self) -> bool:
+        """Return ``True`` when the cached manifest matches the current runtime."""
+
+        manifest = self._read_manifest()
+        if manifest is None:
+            return False
+        fingerprint = _playwright_fingerprint()
+        if any(manifest.get(key) != value for key, value in fingerprint.items()):
+            return False
+        executable = manifest.get("executable_path")
+        return bool(executable) and Path(str(executable)).exists()
+
+    def start(self) -> None:
+        """Verify the runtime and install it in a background thread if needed."""
+
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until the runtime is ready, raising if the installation failed."""
+
+        self.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError("A instalação do WebKit ainda está em andamento.")
+        if self.error is not None:
+            message = (
+                "Falha ao instalar o runtime do WebKit. Execute `playwright install webkit` "
+                "manualmente e tente novamente."
+            )
+            raise RuntimeError(message) from self.error
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set() and self.error is None
+
+    # -- internals ----------------------------------------------------------
+    def _run(self) -> None:
+        try:
+            if self.is_installed():
+                self._notify("Runtime do WebKit disponível.")
+                return
+            self._notify("Instalando o runtime do WebKit...")
+            self._install()
+            self._notify("Verificando o runtime do WebKit instalado...")
+            executable = _resolve_webkit_executable()
+            self._write_manifest(executable)
+            self._notify("Runtime do WebKit instalado com sucesso.")
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.error("Falha ao preparar o runtime do WebKit: %s", exc)
+            self.error = exc
+            self._notify(f"Falha ao instalar o runtime do WebKit: {exc}")
+        finally:
+            self._ready.set()
+
+    def _install(self) -> None:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "playwright", "install", "webkit"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        assert process.stdout is not None
+        for line in process.stdout:
+            text = line.strip()
+            if text:
+                self._notify(text)
+        returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, process.args)
+
+    def _notify(self, message: str) -> None:
+        self.status = message
+        for listener in list(self._listeners):
+            try:
+                listener(message)
+            except Exception:  # noqa: BLE001 - listeners must not break the install
+                LOGGER.exception("Falha ao notificar o progresso da instalação do WebKit.")
+
+    def _read_manifest(self) -> Optional[Dict[str, object]]:
+        if not self.manifest_path.exists():
+            return None
+        try:
+            raw = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return raw if isinstance(raw, dict) else None
+
+    def _write_manifest(self, executable_path: str) -> None:
+        manifest = {
+            **_playwright_fingerprint(),
+            "executable_path": executable_path,
+            "installed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+__all__ = ["WebKitInstaller"]
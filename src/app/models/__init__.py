@@ -1,13 +1,27 @@
 """Domain models encapsulating session management and system checks."""
 
+from .job_posting import JobDetails, JobPosting
+from .profile_versions import ProfileVersion, ProfileVersionStore, SectionChange
 from .scrap_user import ExperienceRecord, ScrapUserRepository
+from .seen_jobs import SeenJobsIndex
+from .selector_stats import SelectorRegistry
 from .search_preferences import (
     ALLOWED_DATE_FILTERS,
     ALLOWED_EXPERIENCE_LEVELS,
     SearchPreferences,
     SearchPreferencesRepository,
+    build_jobs_search_url,
 )
 from .session import Credentials, SessionManager, SessionStatus
+from .session_state import SessionVerdict, inspect_storage_state
+from .sqlite_store import (
+    SQLiteDatabase,
+    SQLiteJobRepository,
+    SQLiteRunRepository,
+    SQLiteScrapUserRepository,
+    SQLiteSearchPreferencesRepository,
+    migrate_json_storage,
+)
 from .system import (
     CredentialsExistCheck,
     CredentialsValidityCheck,
@@ -24,15 +38,31 @@ __all__ = [
     "CredentialsExistCheck",
     "CredentialsValidityCheck",
     "InternetConnectivityCheck",
+    "JobDetails",
+    "JobPosting",
     "LinkedInAccessCheck",
+    "ProfileVersion",
+    "ProfileVersionStore",
     "ScrapUserRepository",
     "SearchPreferences",
     "SearchPreferencesRepository",
+    "SectionChange",
+    "SeenJobsIndex",
+    "SQLiteDatabase",
+    "SQLiteJobRepository",
+    "SQLiteRunRepository",
+    "SQLiteScrapUserRepository",
+    "SQLiteSearchPreferencesRepository",
+    "SelectorRegistry",
     "ALLOWED_DATE_FILTERS",
     "ALLOWED_EXPERIENCE_LEVELS",
     "SessionManager",
     "SessionStatus",
+    "SessionVerdict",
     "SystemCheck",
     "SystemCheckResult",
     "SystemTestRunner",
+    "build_jobs_search_url",
+    "inspect_storage_state",
+    "migrate_json_storage",
 ]
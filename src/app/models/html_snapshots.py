@@ -0,0 +1,96 @@
+"""Compressed store of raw LinkedIn HTML captured during scraping."""
+from __future__ import annotations
+
+import gzip
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+
+SNAPSHOT_KINDS = ("profile", "job_cards", "job_details")
+
+_UNSAFE_KEY = re.compile(r"[^\w.-]+")
+
+
+@dataclass(slots=True)
+class HtmlSnapshot:
+    """A stored page: what it was (``kind``/``key``), when and where on disk."""
+
+    kind: str
+    key: str
+    captured_at: str
+    path: Path
+
+
+def read_snapshot_file(path: Path) -> str:
+    """Return the HTML of a stored snapshot file."""
+
+    return gzip.decompress(path.read_bytes()).decode("utf-8")
+
+
+class HtmlSnapshotStore:
+    """Keep the latest ``keep_per_key`` captures of each page under ``storage/html_snapshots``.
+
+    Files are laid out as ``<kind>/<key>/<UTC timestamp>.html.gz`` so old
+    captures can be listed and parsed again when the extraction improves.
+    """
+
+    DIRNAME = "html_snapshots"
+
+    def __init__(self, storage_dir: Path, *, keep_per_key: int = 5) -> None:
+        self.root = storage_dir / self.DIRNAME
+        self.keep_per_key = max(1, keep_per_key)
+
+    def save(self, kind: str, key: str, html: str) -> HtmlSnapshot:
+        """Write a compressed capture and drop the oldest ones beyond the limit."""
+
+        directory = self._directory(kind, key)
+        directory.mkdir(parents=True, exist_ok=True)
+        captured_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        path = directory / f"{captured_at}.html.gz"
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(gzip.compress(html.encode("utf-8"), compresslevel=6))
+        os.replace(temp_path, path)
+        for stale in self._files(directory)[: -self.keep_per_key]:
+            stale.unlink(missing_ok=True)
+        return HtmlSnapshot(kind, directory.name, captured_at, path)
+
+    def read(self, snapshot: HtmlSnapshot) -> str:
+        return read_snapshot_file(snapshot.path)
+
+    def list(self, kind: str, key: Optional[str] = None) -> List[HtmlSnapshot]:
+        """Stored captures of ``kind`` (optionally one ``key``), oldest first."""
+
+        kind_dir = self._kind_directory(kind)
+        if not kind_dir.exists():
+            return []
+        directories = [self._directory(kind, key)] if key is not None else sorted(kind_dir.iterdir())
+        snapshots = [
+            HtmlSnapshot(kind, directory.name, path.name.split(".", 1)[0], path)
+            for directory in directories
+            if directory.is_dir()
+            for path in self._files(directory)
+        ]
+        return sorted(snapshots, key=lambda snapshot: snapshot.captured_at)
+
+    def latest(self, kind: str, key: str) -> Optional[HtmlSnapshot]:
+        snapshots = self.list(kind, key)
+        return snapshots[-1] if snapshots else None
+
+    def _kind_directory(self, kind: str) -> Path:
+        if kind not in SNAPSHOT_KINDS:
+            raise ValueError(f"Tipo de snapshot desconhecido: {kind}")
+        return self.root / kind
+
+    def _directory(self, kind: str, key: str) -> Path:
+        return self._kind_directory(kind) / (_UNSAFE_KEY.sub("_", key).strip("._") or "default")
+
+    @staticmethod
+    def _files(directory: Path) -> List[Path]:
+        return sorted(directory.glob("*.html.gz"))
+
+
+__all__ = ["HtmlSnapshot", "HtmlSnapshotStore", "SNAPSHOT_KINDS", "read_snapshot_file"]
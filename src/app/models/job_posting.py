@@ -0,0 +1,67 @@
+"""Compact representation of LinkedIn job postings found by the scrapers."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+@dataclass(slots=True)
+class JobPosting:
+    """A single job card from a LinkedIn search result list."""
+
+    job_id: str
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    listed_at: str = ""
+    easy_apply: bool = False
+    url: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.url:
+            self.url = JOB_VIEW_URL.format(job_id=self.job_id)
+
+    @classmethod
+    def from_card(cls, raw: Mapping[str, Any] | None) -> Optional["JobPosting"]:
+        """Build a posting from the JSON produced by the job card script."""
+
+        if not raw:
+            return None
+        job_id = str(raw.get("job_id") or "").strip()
+        if not job_id.isdigit():
+            return None
+        return cls(
+            job_id=job_id,
+            title=str(raw.get("title") or "").strip(),
+            company=str(raw.get("company") or "").strip(),
+            location=str(raw.get("location") or "").strip(),
+            listed_at=str(raw.get("listed_at") or "").strip(),
+            easy_apply=bool(raw.get("easy_apply", False)),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class JobDetails:
+    """Full description of a posting, fetched without rendering its detail pane."""
+
+    job_id: str
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    description: str = ""
+    applicants: str = ""
+    listed_at: str = ""
+    criteria: Dict[str, str] = field(default_factory=dict)
+    source: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+__all__ = ["JOB_VIEW_URL", "JobDetails", "JobPosting"]
@@ -0,0 +1,241 @@
+"""Versioned history of the scraped profile with content-addressed sections."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _blob_digest(blob: bytes) -> str:
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class ProfileVersion:
+    """One recorded state of the profile."""
+
+    version_id: int
+    saved_at: float
+    reason: str
+    # Digest of every section's blob in this version.
+    sections: Dict[str, str] = field(default_factory=dict)
+    # Sections whose content differs from the previous version.
+    changed: Tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class SectionChange:
+    """Entries added to and removed from a section between two versions."""
+
+    section: str
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+
+
+class ProfileVersionStore:
+    """Keep every saved profile state without duplicating unchanged sections.
+
+    Every entry is stored once per distinct content under
+    ``blobs/<digest>.json``, and each section as a small blob listing the
+    digests of its entries. ``versions.jsonl`` gets one line per version
+    naming only the sections whose listing changed, so editing one entry
+    costs that entry plus one digest per entry of its section, not a copy of
+    the whole section. Blobs are synced to disk before the line that
+    references them is appended, and a torn last line from an interrupted
+    append is dropped on load.
+    """
+
+    def __init__(self, storage_dir: Path, *, clock: Callable[[], float] = time.time) -> None:
+        self.storage_dir = storage_dir
+        self.blobs_dir = storage_dir / "blobs"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = storage_dir / "versions.jsonl"
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._versions: List[ProfileVersion] = []
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def list(self) -> List[ProfileVersion]:
+        """Return the recorded versions, oldest first."""
+
+        with self._lock:
+            return list(self._versions)
+
+    def latest(self) -> Optional[ProfileVersion]:
+        with self._lock:
+            return self._versions[-1] if self._versions else None
+
+    def record(
+        self,
+        payload: Mapping[str, Sequence[Any]],
+        *,
+        sections: Optional[Iterable[str]] = None,
+        reason: str = "",
+    ) -> Optional[ProfileVersion]:
+        """Store ``payload`` as a new version; returns ``None`` when nothing changed.
+
+        ``sections`` limits hashing to the sections the caller modified; the
+        others are taken from the previous version.
+        """
+
+        with self._lock:
+            previous = self._versions[-1].sections if self._versions else {}
+            candidates = payload.keys() if sections is None or not previous else sections
+            digests = dict(previous)
+            written = False
+            for section in candidates:
+                if section not in payload:
+                    continue
+                entries: List[str] = []
+                for item in payload[section]:
+                    blob = _canonical(item)
+                    entries.append(_blob_digest(blob))
+                    written = self._write_blob(entries[-1], blob) or written
+                listing = _canonical({"entries": entries})
+                digest = _blob_digest(listing)
+                written = self._write_blob(digest, listing) or written
+                digests[section] = digest
+            changed = tuple(section for section, digest in digests.items() if previous.get(section) != digest)
+            if not changed:
+                return None
+            if written:
+                _fsync_dir(self.blobs_dir)
+            version = ProfileVersion(
+                version_id=self._versions[-1].version_id + 1 if self._versions else 1,
+                saved_at=self._clock(),
+                reason=reason,
+                sections=digests,
+                changed=changed,
+            )
+            line = {
+                "id": version.version_id,
+                "saved_at": version.saved_at,
+                "reason": reason,
+                "changes": {section: digests[section] for section in changed},
+            }
+            with self.manifest_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(line, ensure_ascii=False) + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._versions.append(version)
+            return version
+
+    def get(self, version_id: int) -> Dict[str, List[Any]]:
+        """Rebuild the full payload of a version."""
+
+        version = self._find(version_id)
+        return {section: self._read_section(digest) for section, digest in version.sections.items()}
+
+    def diff(self, old_id: int, new_id: int) -> List[SectionChange]:
+        """Compare two versions section by section, skipping identical sections."""
+
+        old, new = self._find(old_id), self._find(new_id)
+        changes: List[SectionChange] = []
+        for section in dict.fromkeys([*old.sections, *new.sections]):
+            if old.sections.get(section) == new.sections.get(section):
+                continue
+            before = self._read_section(old.sections[section]) if section in old.sections else []
+            after = self._read_section(new.sections[section]) if section in new.sections else []
+            before_keys = {_canonical(item) for item in before}
+            after_keys = {_canonical(item) for item in after}
+            changes.append(
+                SectionChange(
+                    section=section,
+                    added=[item for item in after if _canonical(item) not in before_keys],
+                    removed=[item for item in before if _canonical(item) not in after_keys],
+                )
+            )
+        return changes
+
+    # -- persistence --------------------------------------------------------
+    def _find(self, version_id: int) -> ProfileVersion:
+        with self._lock:
+            for version in self._versions:
+                if version.version_id == version_id:
+                    return version
+        raise KeyError(f"Versão do perfil não encontrada: {version_id}")
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / f"{digest}.json"
+
+    def _write_blob(self, digest: str, blob: bytes) -> bool:
+        """Store a blob durably; returns ``False`` when it already existed."""
+
+        path = self._blob_path(digest)
+        if path.exists():
+            return False
+        temp_path = path.with_name(path.name + ".tmp")
+        with temp_path.open("wb") as handle:
+            handle.write(blob)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+        return True
+
+    def _read_blob(self, digest: str) -> Any:
+        return json.loads(self._blob_path(digest).read_text(encoding="utf-8"))
+
+    def _read_section(self, digest: str) -> List[Any]:
+        listing = self._read_blob(digest)
+        if isinstance(listing, dict):
+            return [self._read_blob(entry) for entry in listing["entries"]]
+        # Versions recorded before entries were stored separately hold the whole section.
+        return listing
+
+    def _load(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        data = self.manifest_path.read_bytes()
+        if data and not data.endswith(b"\n"):
+            # Drop the torn line left by an interrupted append before appending again.
+            data = data[: data.rfind(b"\n") + 1]
+            with self.manifest_path.open("r+b") as handle:
+                handle.truncate(len(data))
+        sections: Dict[str, str] = {}
+        for line in data.decode("utf-8").splitlines():
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(raw, dict) or not isinstance(raw.get("changes"), dict):
+                continue
+            sections = {**sections, **raw["changes"]}
+            self._versions.append(
+                ProfileVersion(
+                    version_id=int(raw.get("id") or len(self._versions) + 1),
+                    saved_at=float(raw.get("saved_at") or 0.0),
+                    reason=str(raw.get("reason") or ""),
+                    sections=sections,
+                    changed=tuple(raw["changes"]),
+                )
+            )
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make renames inside ``path`` durable; not supported on Windows."""
+
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+__all__ = ["ProfileVersion", "ProfileVersionStore", "SectionChange"]
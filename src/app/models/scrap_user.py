@@ -3,8 +3,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import hashlib
 import json
+import logging
+import os
+import threading
+import zlib
+
+from .profile_versions import ProfileVersion, ProfileVersionStore, SectionChange
+
+LOGGER = logging.getLogger(__name__)
+
+# Experiences with the same cargo/empresa/periodo whose descriptions share at
+# least this fraction of word trigrams are treated as the same entry.
+NEAR_DUPLICATE_SIMILARITY = 0.5
+SHINGLE_SIZE = 3
 
 
 DEFAULT_SCRAP_TEMPLATE: Dict[str, List[Any]] = {
@@ -19,6 +34,21 @@ DEFAULT_SCRAP_TEMPLATE: Dict[str, List[Any]] = {
 }
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temporary file and move it over ``path`` in one step."""
+
+    temp_path = path.with_name(path.name + ".tmp")
+    with temp_path.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 def _default_payload() -> Dict[str, List[Any]]:
     """Return a fresh copy of the default structure."""
 
@@ -26,28 +56,149 @@ def _default_payload() -> Dict[str, List[Any]]:
 
 
 def _normalise_item(item: Any) -> Any:
-    """Create a hashable representation for comparison purposes."""
-
-    if isinstance(item, dict):
-        return tuple(sorted((key, _normalise_item(value)) for key, value in item.items()))
+    """Create a hashable comparison key, ignoring case, spacing and empty fields."""
+
+    if isinstance(item, str):
+        return " ".join(item.split()).casefold()
+    if isinstance(item, Mapping):
+        return tuple(
+            sorted(
+                (key, _normalise_item(value))
+                for key, value in item.items()
+                if value not in (None, "", [], {})
+            )
+        )
     if isinstance(item, (list, tuple)):
         return tuple(_normalise_item(value) for value in item)
     return item
 
 
-def _merge_unique(existing: Sequence[Any], incoming: Iterable[Any]) -> List[Any]:
-    """Return a list that combines entries without duplicating values."""
+def _experience_identity(item: Any) -> Optional[Tuple[str, str, str]]:
+    """Return the normalised ``(cargo, empresa, periodo)`` of an experience entry."""
+
+    if not isinstance(item, Mapping):
+        return None
+    cargo = _normalise_item(str(item.get("cargo") or ""))
+    empresa = _normalise_item(str(item.get("empresa") or ""))
+    if not cargo or not empresa:
+        return None
+    return cargo, empresa, _normalise_item(str(item.get("periodo") or ""))
+
+
+def _shingles(text: str) -> frozenset[int]:
+    """Hashed word trigrams of ``text`` (single words for very short texts)."""
+
+    words = _normalise_item(text).split()
+    size = min(SHINGLE_SIZE, len(words))
+    return frozenset(
+        zlib.crc32(" ".join(words[index:index + size]).encode("utf-8"))
+        for index in range(len(words) - size + 1)
+    ) if words else frozenset()
+
+
+class _SectionIndex:
+    """Signatures of the entries of one section, updated as entries are merged.
+
+    Exact duplicates are found through normalised keys. Experiences sharing
+    cargo, empresa and periodo are near duplicates when their descriptions'
+    shingle sets overlap by at least ``NEAR_DUPLICATE_SIMILARITY`` (Jaccard),
+    or when either description is missing.
+    """
+
+    __slots__ = ("keys", "experiences")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        self.keys: set[Any] = set()
+        self.experiences: Dict[Tuple[str, str, str], List[frozenset[int]]] = {}
+        for item in items:
+            self.add(item)
+
+    def contains(self, item: Any) -> bool:
+        if _normalise_item(item) in self.keys:
+            return True
+        identity = _experience_identity(item)
+        if identity is None or identity not in self.experiences:
+            return False
+        shingles = _shingles(str(item.get("descricao") or ""))
+        return any(_similar(shingles, other) for other in self.experiences[identity])
+
+    def add(self, item: Any) -> None:
+        self.keys.add(_normalise_item(item))
+        identity = _experience_identity(item)
+        if identity is not None:
+            self.experiences.setdefault(identity, []).append(_shingles(str(item.get("descricao") or "")))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "keys": list(self.keys),
+            "experiences": [
+                [*identity, sorted(shingles)]
+                for identity, signatures in self.experiences.items()
+                for shingles in signatures
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "_SectionIndex":
+        index = cls()
+        # Normalised keys only contain tuples, which JSON stores as lists.
+        index.keys = {_as_tuples(key) for key in raw["keys"]}
+        for cargo, empresa, periodo, shingles in raw["experiences"]:
+            index.experiences.setdefault((cargo, empresa, periodo), []).append(frozenset(shingles))
+        return index
+
+
+def _as_tuples(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_as_tuples(item) for item in value)
+    return value
+
+
+def _similar(first: frozenset[int], second: frozenset[int]) -> bool:
+    if not first or not second:
+        return True
+    return len(first & second) / len(first | second) >= NEAR_DUPLICATE_SIMILARITY
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy: dicts become mapping proxies and lists tuples."""
+
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of :func:`_freeze`, producing a mutable copy."""
+
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _merge_unique(
+    existing: Sequence[Any],
+    incoming: Iterable[Any],
+    index: Optional[_SectionIndex] = None,
+) -> List[Any]:
+    """Return a list that combines entries without duplicating values.
+
+    ``index`` must describe ``existing``; it is updated with the entries that
+    are added, so callers that keep it only pay for the incoming entries.
+    """
 
     merged: List[Any] = list(existing)
-    seen = {_normalise_item(item) for item in existing}
+    if index is None:
+        index = _SectionIndex(existing)
     for item in incoming:
-        if item is None:
-            continue
-        signature = _normalise_item(item)
-        if signature in seen:
+        if item is None or index.contains(item):
             continue
         merged.append(item)
-        seen.add(signature)
+        index.add(item)
     return merged
 
 
@@ -70,43 +221,127 @@ class ExperienceRecord:
 
 
 class ScrapUserRepository:
-    """Persist and retrieve scraped LinkedIn profile data."""
-
-    def __init__(self, storage_dir: Path) -> None:
+    """Persist and retrieve scraped LinkedIn profile data.
+
+    ``ScrapUser.json`` holds a compacted snapshot; each ``update`` appends
+    only the entries it adds to ``ScrapUser.journal.jsonl``, so write cost
+    follows the size of the change. The journal starts with the digest of the
+    snapshot it applies to and is replayed on load; it is folded into the
+    snapshot (written atomically) when first loaded from disk or once it
+    grows beyond ``JOURNAL_COMPACT_BYTES``. A journal left behind by an
+    interrupted compaction no longer matches the snapshot and is discarded,
+    and a torn last line from an interrupted append is ignored.
+
+    The parsed payload is cached as a read-only view, invalidated when either
+    file changes size or modification time and refreshed by the repository's
+    own writes, so repeated reads from the GUI skip the disk entirely.
+    Alongside it a signature index per section is kept across updates, so
+    deduplicating an update only costs the size of the incoming entries. The
+    index is saved to ``ScrapUser.index.json`` whenever the snapshot is
+    written, keyed by the snapshot digest like the journal header, so a
+    restart loads it and replays the journal onto it instead of hashing every
+    entry again.
+
+    Every save and update that changes the profile is also recorded in
+    ``versions`` (see :class:`ProfileVersionStore`), which backs
+    :meth:`list_versions`, :meth:`diff_versions` and :meth:`restore_version`.
+    """
+
+    JOURNAL_COMPACT_BYTES = 256 * 1024
+
+    def __init__(self, storage_dir: Path, *, versions: Optional[ProfileVersionStore] = None) -> None:
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.file_path = self.storage_dir / "ScrapUser.json"
+        self.journal_path = self.storage_dir / "ScrapUser.journal.jsonl"
+        self.hashes_path = self.storage_dir / "ScrapUser.hashes.json"
+        self.index_path = self.storage_dir / "ScrapUser.index.json"
+        self.versions = versions if versions is not None else ProfileVersionStore(storage_dir / "profile_versions")
+        self._lock = threading.RLock()
+        self._cache: Optional[Tuple[Any, Mapping[str, Tuple[Any, ...]]]] = None
+        self._indexes: Optional[Tuple[Mapping[str, Tuple[Any, ...]], Dict[str, _SectionIndex]]] = None
+
+    def view(self) -> Mapping[str, Tuple[Any, ...]]:
+        """Return the stored payload as a shared, read-only mapping.
+
+        Sections are tuples and dict entries are mapping proxies; use
+        :meth:`load` for a mutable copy.
+        """
+
+        with self._lock:
+            signature = self._files_signature()
+            if self._cache is not None and self._cache[0] == signature:
+                return self._cache[1]
+            payload, replayed, indexes = self._read_payload()
+            if replayed:
+                self._compact(payload, indexes)
+            else:
+                self._remember(payload)
+            return self._cache[1] if self._cache is not None else _freeze(payload)
 
     def load(self) -> Dict[str, List[Any]]:
         """Return the stored payload or the default template when missing."""
 
+        return _thaw(self.view())
+
+    def load_section_hashes(self) -> Dict[str, str]:
+        """Return the content fingerprints recorded by the last profile scan."""
+
         if not self.file_path.exists():
-            return _default_payload()
+            # Without stored data every section must be treated as changed.
+            return {}
+        return _read_section_hashes(self.hashes_path)
 
-        try:
-            raw = json.loads(self.file_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return _default_payload()
+    def save_section_hashes(self, hashes: Dict[str, str]) -> None:
+        """Persist per-section content fingerprints next to ``ScrapUser.json``."""
 
-        payload: Dict[str, List[Any]] = {}
-        for key, default_value in DEFAULT_SCRAP_TEMPLATE.items():
-            value = raw.get(key, default_value)
-            payload[key] = value if isinstance(value, list) else default_value.copy()
-        return payload
+        _atomic_write_bytes(
+            self.hashes_path,
+            json.dumps(hashes, ensure_ascii=False, indent=2).encode("utf-8"),
+        )
 
     def save(self, data: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
-        """Persist the provided payload to disk."""
+        """Persist the provided payload to disk, replacing the snapshot atomically."""
 
         normalised = _default_payload()
         for key, value in data.items():
             if key in normalised and isinstance(value, list):
                 normalised[key] = value
-        self.file_path.write_text(
-            json.dumps(normalised, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        with self._lock:
+            self._compact(normalised)
+            self._record_version(normalised, reason="save")
         return normalised
 
+    def list_versions(self) -> List[ProfileVersion]:
+        """Return the recorded versions of the profile, oldest first."""
+
+        return self.versions.list() if self.versions is not None else []
+
+    def diff_versions(self, old_id: int, new_id: int) -> List[SectionChange]:
+        """Entries added and removed per section between two versions."""
+
+        if self.versions is None:
+            raise KeyError(old_id)
+        return self.versions.diff(old_id, new_id)
+
+    def restore_version(self, version_id: int) -> Dict[str, List[Any]]:
+        """Bring back the profile as it was in ``version_id``.
+
+        The restore is recorded as a new version, and the section
+        fingerprints are cleared so the next scan compares every section.
+        """
+
+        if self.versions is None:
+            raise KeyError(version_id)
+        payload = self.versions.get(version_id)
+        with self._lock:
+            restored = _default_payload()
+            restored.update({key: value for key, value in payload.items() if key in restored})
+            self._compact(restored)
+            self._record_version(restored, reason=f"restore:{version_id}")
+            self.save_section_hashes({})
+        return restored
+
     def update(
         self,
         *,
@@ -121,28 +356,289 @@ class ScrapUserRepository:
     ) -> Dict[str, List[Any]]:
         """Update specific fields while keeping the remaining structure intact."""
 
-        current = self.load()
-        if nome is not None:
-            if nome:
+        with self._lock:
+            view = self.view()
+            current = _thaw(view)
+            indexes = self._section_indexes(view, current)
+            record: Dict[str, Dict[str, List[Any]]] = {"set": {}, "add": {}}
+            if nome is not None:
                 # Keep only the most recent value but avoid duplicates.
-                current["Nome"] = _merge_unique(current.get("Nome", []), [nome])[-1:]
-            else:
-                current["Nome"] = []
-
-        def _merge(section: str, values: Sequence[Any] | None) -> None:
-            if values is None:
-                return
-            current[section] = _merge_unique(current.get(section, []), values)
-
-        _merge("Experiência", experiencias)
-        _merge("Formação", formacao)
-        _merge("Licenças e certificados", licencas)
-        _merge("Projetos", projetos)
-        _merge("Competências", competencias)
-        _merge("Recomendações", recomendacoes)
-        _merge("Publicações", publicacoes)
-
-        return self.save(current)
+                names = _merge_unique(current.get("Nome", []), [nome])[-1:] if nome else []
+                if names != current["Nome"]:
+                    current["Nome"] = names
+                    record["set"]["Nome"] = names
+
+            def _merge(section: str, values: Sequence[Any] | None) -> None:
+                if values is None:
+                    return
+                existing = current.get(section, [])
+                merged = _merge_unique(existing, values, indexes[section])
+                if len(merged) > len(existing):
+                    record["add"][section] = merged[len(existing):]
+                current[section] = merged
+
+            _merge("Experiência", experiencias)
+            _merge("Formação", formacao)
+            _merge("Licenças e certificados", licencas)
+            _merge("Projetos", projetos)
+            _merge("Competências", competencias)
+            _merge("Recomendações", recomendacoes)
+            _merge("Publicações", publicacoes)
+
+            if record["set"] or record["add"] or not self._has_snapshot():
+                try:
+                    self._persist_update({key: value for key, value in record.items() if value}, current, indexes)
+                except BaseException:
+                    # The indexes already hold entries that never reached the disk.
+                    self._indexes = None
+                    raise
+                self._record_version(current, sections=[*record["set"], *record["add"]], reason="update")
+            if self._cache is not None:
+                self._indexes = (self._cache[1], indexes)
+            return current
+
+    def _record_version(
+        self, payload: Dict[str, List[Any]], *, sections: Optional[Sequence[str]] = None, reason: str
+    ) -> None:
+        if self.versions is None:
+            return
+        try:
+            self.versions.record(payload, sections=sections, reason=reason)
+        except OSError as exc:
+            # History is best effort: the profile itself is already stored.
+            LOGGER.warning("Não foi possível registrar a versão do perfil: %s", exc)
+
+    def _section_indexes(
+        self, view: Mapping[str, Tuple[Any, ...]], payload: Dict[str, List[Any]]
+    ) -> Dict[str, _SectionIndex]:
+        """Reuse the indexes built for ``view``, load the saved ones or rebuild them from ``payload``."""
+
+        if self._indexes is not None and self._indexes[0] is view:
+            indexes = self._indexes[1]
+        else:
+            indexes = self._stored_indexes() or {}
+        return _complete_indexes(indexes, payload)
+
+    # -- storage ------------------------------------------------------------
+    def _files_signature(self) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        return _stat_signature(self.file_path), _stat_signature(self.journal_path)
+
+    def _has_snapshot(self) -> bool:
+        return self.file_path.exists()
+
+    def _persist_update(
+        self,
+        record: Dict[str, Any],
+        payload: Dict[str, List[Any]],
+        indexes: Optional[Dict[str, _SectionIndex]] = None,
+    ) -> None:
+        """Store the delta produced by :meth:`update`; ``payload`` is the merged result."""
+
+        if not self._has_snapshot():
+            self._compact(payload, indexes)
+        else:
+            self._append_journal(record, payload, indexes)
+
+    def _remember(self, payload: Dict[str, List[Any]]) -> None:
+        self._cache = (self._files_signature(), _freeze(payload))
+
+    def _read_payload(self) -> Tuple[Dict[str, List[Any]], bool, Dict[str, _SectionIndex]]:
+        """Return the snapshot with the journal replayed; see :func:`_read_snapshot`."""
+
+        return _read_snapshot(self.file_path, self.journal_path, index_path=self.index_path)
+
+    def _stored_indexes(self) -> Optional[Dict[str, _SectionIndex]]:
+        """Load the saved indexes when they describe the current snapshot and no journal follows it."""
+
+        if self.journal_path.exists() or not self.file_path.exists():
+            return None
+        return _load_indexes(self.index_path, _digest(self.file_path.read_bytes()))
+
+    def _store_indexes(self, data: bytes, indexes: Dict[str, _SectionIndex]) -> None:
+        stored = {
+            "base": _digest(data),
+            "sections": {section: index.to_dict() for section, index in indexes.items()},
+        }
+        try:
+            _atomic_write_bytes(
+                self.index_path,
+                json.dumps(stored, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            )
+        except (OSError, TypeError, ValueError) as exc:
+            # The index is only a cache; the next restart rebuilds it.
+            LOGGER.warning("Não foi possível salvar o índice do perfil: %s", exc)
+            self.index_path.unlink(missing_ok=True)
+
+    def _append_journal(
+        self,
+        record: Dict[str, Any],
+        payload: Dict[str, List[Any]],
+        indexes: Optional[Dict[str, _SectionIndex]] = None,
+    ) -> None:
+        # A journal cut inside its header line is empty once the torn tail is dropped.
+        if not self.journal_path.exists() or _drop_torn_tail(self.journal_path) == 0:
+            header = {"base": _digest(self.file_path.read_bytes())}
+            lines = [json.dumps(header), json.dumps(record, ensure_ascii=False)]
+        else:
+            lines = [json.dumps(record, ensure_ascii=False)]
+        with self.journal_path.open("ab") as handle:
+            handle.write(("\n".join(lines) + "\n").encode("utf-8"))
+            handle.flush()
+            os.fsync(handle.fileno())
+        if self.journal_path.stat().st_size > self.JOURNAL_COMPACT_BYTES:
+            self._compact(payload, indexes)
+        else:
+            self._remember(payload)
+
+    def _compact(
+        self, payload: Dict[str, List[Any]], indexes: Optional[Dict[str, _SectionIndex]] = None
+    ) -> None:
+        """Write ``payload`` as the new snapshot with its indexes and drop the journal.
+
+        ``indexes`` may cover only some sections of ``payload``; the others are rebuilt.
+        """
+
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        _atomic_write_bytes(self.file_path, data)
+        self.journal_path.unlink(missing_ok=True)
+        self._remember(payload)
+        indexes = _complete_indexes(indexes or {}, payload)
+        self._store_indexes(data, indexes)
+        if self._cache is not None:
+            self._indexes = (self._cache[1], indexes)
+
+
+def _complete_indexes(
+    indexes: Dict[str, _SectionIndex], payload: Mapping[str, Sequence[Any]]
+) -> Dict[str, _SectionIndex]:
+    """Add an index for every section of ``payload`` that ``indexes`` lacks."""
+
+    for section, values in payload.items():
+        if section != "Nome" and section not in indexes:
+            indexes[section] = _SectionIndex(values)
+    return indexes
+
+
+def _load_indexes(path: Path, base_digest: str) -> Optional[Dict[str, _SectionIndex]]:
+    """Read the indexes saved for the snapshot with ``base_digest``."""
+
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(raw, dict) or raw.get("base") != base_digest:
+            return None
+        return {
+            str(section): _SectionIndex.from_dict(value)
+            for section, value in raw["sections"].items()
+            if section in DEFAULT_SCRAP_TEMPLATE
+        }
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _read_snapshot(
+    file_path: Path,
+    journal_path: Path,
+    *,
+    discard_stale: bool = True,
+    index_path: Optional[Path] = None,
+) -> Tuple[Dict[str, List[Any]], bool, Dict[str, _SectionIndex]]:
+    """Read ``ScrapUser.json`` with its journal replayed.
+
+    Returns the payload, whether journal records were applied and the section
+    indexes built while replaying them. With ``index_path`` the replay starts
+    from the indexes saved for the snapshot, so only the journal is hashed.
+
+    A journal whose header does not match the snapshot is left over from a
+    finished compaction; it is deleted unless ``discard_stale`` is false, which
+    keeps the read free of side effects.
+    """
+
+    indexes: Dict[str, _SectionIndex] = {}
+    if not file_path.exists():
+        return _default_payload(), False, indexes
+    data = file_path.read_bytes()
+    try:
+        raw = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        LOGGER.warning("ScrapUser.json está corrompido; usando a estrutura padrão.")
+        return _default_payload(), False, indexes
+
+    payload: Dict[str, List[Any]] = {}
+    for key, default_value in DEFAULT_SCRAP_TEMPLATE.items():
+        value = raw.get(key, default_value) if isinstance(raw, dict) else default_value
+        payload[key] = value if isinstance(value, list) else default_value.copy()
+    if not journal_path.exists():
+        return payload, False, indexes
+    lines = journal_path.read_bytes().splitlines()
+    try:
+        header = json.loads(lines[0]) if lines else {}
+    except json.JSONDecodeError:
+        header = {}
+    base_digest = _digest(data)
+    if not isinstance(header, dict) or header.get("base") != base_digest:
+        if discard_stale:
+            journal_path.unlink(missing_ok=True)
+        return payload, False, indexes
+    if index_path is not None:
+        indexes = _load_indexes(index_path, base_digest) or {}
+    applied = False
+    for line in lines[1:]:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # A torn final line from an interrupted append.
+            continue
+        if not isinstance(record, dict):
+            continue
+        for section, values in (record.get("set") or {}).items():
+            if section in payload and isinstance(values, list):
+                payload[section] = values
+                indexes.pop(section, None)
+        for section, values in (record.get("add") or {}).items():
+            if section in payload and isinstance(values, list):
+                if section not in indexes:
+                    indexes[section] = _SectionIndex(payload[section])
+                payload[section] = _merge_unique(payload[section], values, indexes[section])
+        applied = True
+    return payload, applied, indexes
+
+
+def _read_section_hashes(path: Path) -> Dict[str, str]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {str(key): str(value) for key, value in raw.items() if key in DEFAULT_SCRAP_TEMPLATE}
+
+
+def _drop_torn_tail(path: Path) -> int:
+    """Cut an unterminated last line so the next append starts on a fresh line.
+
+    Returns the size of the file left behind.
+    """
+
+    with path.open("r+b") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        if size == 0:
+            return 0
+        handle.seek(size - 1)
+        if handle.read(1) == b"\n":
+            return size
+        handle.seek(0)
+        data = handle.read()
+        size = data.rfind(b"\n") + 1
+        handle.truncate(size)
+        return size
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 __all__ = ["ExperienceRecord", "ScrapUserRepository"]
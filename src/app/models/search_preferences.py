@@ -4,7 +4,8 @@ from __future__ import annotations
 import json
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Mapping, Optional
+from urllib.parse import urlencode
 
 
 ALLOWED_EXPERIENCE_LEVELS = {
@@ -24,6 +25,27 @@ ALLOWED_DATE_FILTERS = {
 }
 
 
+JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+# LinkedIn query parameter values for each filter.
+WORKPLACE_TYPE_CODES = {"onsite": "1", "remote": "2", "hybrid": "3"}
+
+DATE_FILTER_CODES = {
+    "last_day": "r86400",
+    "last_week": "r604800",
+    "last_month": "r2592000",
+}
+
+EXPERIENCE_LEVEL_CODES = {
+    "Estágio": "1",
+    "Assistente": "2",
+    "Júnior": "3",
+    "Pleno-sênior": "4",
+    "Diretor": "5",
+    "Executivo": "6",
+}
+
+
 @dataclass(slots=True)
 class SearchPreferences:
     """Structured representation of the LinkedIn search filters the user selects."""
@@ -65,6 +87,65 @@ class SearchPreferences:
         return asdict(self)
 
 
+def build_jobs_search_url(
+    preferences: SearchPreferences,
+    *,
+    start: int = 0,
+    company_ids: Optional[Mapping[str, str]] = None,
+    base_url: str = JOBS_SEARCH_URL,
+) -> str:
+    """Compile search preferences into a filtered LinkedIn jobs search URL.
+
+    Companies are sent as LinkedIn company ids (``f_C``): entries that are
+    already numeric are used as-is, names are looked up case-insensitively in
+    ``company_ids`` and names without a known id are left out of the filter.
+    """
+
+    query: Dict[str, str] = {}
+    if preferences.keywords.strip():
+        query["keywords"] = preferences.keywords.strip()
+    if preferences.location.strip():
+        query["location"] = preferences.location.strip()
+
+    workplace = [
+        code
+        for flag, code in WORKPLACE_TYPE_CODES.items()
+        if getattr(preferences, flag)
+    ]
+    if workplace:
+        query["f_WT"] = ",".join(workplace)
+
+    if preferences.date_filter in DATE_FILTER_CODES:
+        query["f_TPR"] = DATE_FILTER_CODES[preferences.date_filter]
+
+    levels = sorted(
+        {
+            EXPERIENCE_LEVEL_CODES[level]
+            for level in preferences.experience_levels
+            if level in EXPERIENCE_LEVEL_CODES
+        }
+    )
+    if levels:
+        query["f_E"] = ",".join(levels)
+
+    lookup = {name.strip().lower(): str(value) for name, value in (company_ids or {}).items()}
+    companies: List[str] = []
+    for company in preferences.companies:
+        text = company.strip()
+        company_id = text if text.isdigit() else lookup.get(text.lower())
+        if company_id and company_id not in companies:
+            companies.append(company_id)
+    if companies:
+        query["f_C"] = ",".join(companies)
+
+    if preferences.easy_apply_only:
+        query["f_AL"] = "true"
+    if start:
+        query["start"] = str(start)
+
+    return f"{base_url}?{urlencode(query, safe=',')}" if query else base_url
+
+
 class SearchPreferencesRepository:
     """Load and save search preferences to a JSON file."""
 
@@ -126,7 +207,9 @@ class SearchPreferencesRepository:
 
 
 __all__ = [
+    "JOBS_SEARCH_URL",
     "SearchPreferences",
+    "build_jobs_search_url",
     "SearchPreferencesRepository",
     "ALLOWED_DATE_FILTERS",
     "ALLOWED_EXPERIENCE_LEVELS",
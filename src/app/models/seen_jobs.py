@@ -0,0 +1,169 @@
+"""Compact on-disk index of LinkedIn job postings already scraped."""
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .job_posting import JobPosting
+
+
+# job id, first seen, last seen (epoch seconds) and a 16-byte content digest.
+_RECORD = struct.Struct("<Qdd16s")
+_MAGIC = b"CVSEEN01"
+
+
+def job_content_hash(job: JobPosting) -> bytes:
+    """Digest of the fields that change when a posting is edited or reposted."""
+
+    text = "\x1f".join(
+        [job.title, job.company, job.location, job.listed_at, "1" if job.easy_apply else "0"]
+    )
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+@dataclass(slots=True)
+class SeenJob:
+    """What the index remembers about one job id."""
+
+    job_id: str
+    first_seen: float
+    last_seen: float
+    content_hash: bytes
+
+
+class SeenJobsIndex:
+    """Remember every job id the scrapers met, across runs and queries.
+
+    Entries are kept in a dict for O(1) lookups and persisted as fixed-size
+    binary records appended to ``seen_jobs.idx`` (40 bytes each), so hundreds
+    of thousands of ids load in a single read. Appends are buffered until
+    :meth:`flush`; superseded records are dropped by :meth:`compact`, which
+    also runs on load when most of the file is stale.
+    """
+
+    FILENAME = "seen_jobs.idx"
+    FLUSH_EVERY = 256
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        *,
+        filename: str = FILENAME,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.storage_dir = storage_dir
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.file_path = self.storage_dir / filename
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[int, SeenJob] = {}
+        self._pending: List[bytes] = []
+        self._records_on_disk = 0
+        self._load()
+        if self._records_on_disk > 2 * max(len(self._entries), 1):
+            self.compact()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, job_id: object) -> bool:
+        key = _key(job_id)
+        return key is not None and key in self._entries
+
+    def get(self, job_id: str) -> Optional[SeenJob]:
+        key = _key(job_id)
+        return None if key is None else self._entries.get(key)
+
+    def is_unchanged(self, job: JobPosting) -> bool:
+        """Return ``True`` when the posting was seen before with the same content."""
+
+        entry = self.get(job.job_id)
+        return entry is not None and entry.content_hash == job_content_hash(job)
+
+    def record(self, job: JobPosting) -> bool:
+        """Mark the posting as seen now; returns ``True`` when it is new or changed."""
+
+        key = _key(job.job_id)
+        if key is None:
+            return True
+        digest = job_content_hash(job)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            changed = entry is None or entry.content_hash != digest
+            if entry is None:
+                entry = SeenJob(job.job_id, now, now, digest)
+                self._entries[key] = entry
+            else:
+                entry.last_seen = now
+                entry.content_hash = digest
+            self._pending.append(_RECORD.pack(key, entry.first_seen, entry.last_seen, digest))
+            should_flush = len(self._pending) >= self.FLUSH_EVERY
+        if should_flush:
+            self.flush()
+        return changed
+
+    def flush(self) -> None:
+        """Append buffered records to disk."""
+
+        with self._lock:
+            if not self._pending:
+                return
+            data = b"".join(self._pending)
+            new_file = not self.file_path.exists()
+            with self.file_path.open("ab") as handle:
+                if new_file:
+                    handle.write(_MAGIC)
+                handle.write(data)
+            self._records_on_disk += len(self._pending)
+            self._pending.clear()
+
+    def compact(self) -> None:
+        """Rewrite the file with one record per job id."""
+
+        with self._lock:
+            self._pending.clear()
+            records = [
+                _RECORD.pack(key, entry.first_seen, entry.last_seen, entry.content_hash)
+                for key, entry in self._entries.items()
+            ]
+            temp_path = self.file_path.with_suffix(".tmp")
+            temp_path.write_bytes(_MAGIC + b"".join(records))
+            os.replace(temp_path, self.file_path)
+            self._records_on_disk = len(records)
+
+    # -- persistence --------------------------------------------------------
+    def _load(self) -> None:
+        if not self.file_path.exists():
+            return
+        data = self.file_path.read_bytes()
+        if not data.startswith(_MAGIC):
+            # Unknown format: start over rather than guessing.
+            self.file_path.unlink()
+            return
+        body = memoryview(data)[len(_MAGIC):]
+        usable = len(body) - len(body) % _RECORD.size
+        if usable != len(body):
+            # Drop the partial record left by an interrupted write before appending again.
+            with self.file_path.open("r+b") as handle:
+                handle.truncate(len(_MAGIC) + usable)
+        for key, first_seen, last_seen, digest in _RECORD.iter_unpack(body[:usable]):
+            self._entries[key] = SeenJob(str(key), first_seen, last_seen, digest)
+            self._records_on_disk += 1
+
+
+def _key(job_id: object) -> Optional[int]:
+    text = str(job_id).strip()
+    if not text.isdigit():
+        return None
+    key = int(text)
+    return key if key < 2**64 else None
+
+
+__all__ = ["SeenJob", "SeenJobsIndex", "job_content_hash"]
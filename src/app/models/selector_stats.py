@@ -0,0 +1,172 @@
+"""Persisted hit/miss statistics that rank LinkedIn DOM selectors."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SelectorStats:
+    """Counters for a single selector candidate of a logical target."""
+
+    hits: int = 0
+    misses: int = 0
+    first_lookup: int = 1
+    last_hit_lookup: int = 0
+
+    @classmethod
+    def from_dict(cls, raw: object) -> "SelectorStats":
+        if not isinstance(raw, dict):
+            return cls()
+        return cls(
+            hits=int(raw.get("hits", 0)),
+            misses=int(raw.get("misses", 0)),
+            first_lookup=int(raw.get("first_lookup", 1)),
+            last_hit_lookup=int(raw.get("last_hit_lookup", 0)),
+        )
+
+
+@dataclass(slots=True)
+class _TargetStats:
+    lookups: int = 0
+    selectors: Dict[str, SelectorStats] = field(default_factory=dict)
+
+
+def _idle_lookups(stats: _TargetStats, entry: SelectorStats) -> int:
+    """Number of lookups since the selector last matched (or was first tried)."""
+
+    return stats.lookups - max(entry.last_hit_lookup, entry.first_lookup - 1)
+
+
+class SelectorRegistry:
+    """Remember which selector matched for each logical target (e.g. ``login_cta``).
+
+    Candidates are ranked so the most recently successful selector is tried
+    first, and selectors that have not matched in ``stale_after`` lookups are
+    reported so they can be removed from the code.
+
+    Lookups only update the counters in memory; :meth:`flush` writes them
+    out, once per page session and at shutdown.
+    """
+
+    FILENAME = "selector_stats.json"
+
+    def __init__(self, storage_dir: Path, *, stale_after: int = 10) -> None:
+        self.storage_dir = storage_dir
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.file_path = self.storage_dir / self.FILENAME
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+        self._targets: Dict[str, _TargetStats] = self._load()
+        self._dirty = False
+
+    def rank(self, target: str, candidates: Sequence[str]) -> List[str]:
+        """Order ``candidates`` by most recent success, then by total hits."""
+
+        with self._lock:
+            stats = self._targets.get(target)
+            known = dict(stats.selectors) if stats else {}
+        order = {selector: index for index, selector in enumerate(candidates)}
+
+        def _key(selector: str) -> tuple[int, int, int]:
+            entry = known.get(selector)
+            if entry is None or entry.hits == 0:
+                return (0, 0, order[selector])
+            return (-entry.last_hit_lookup, -entry.hits, order[selector])
+
+        return sorted(dict.fromkeys(candidates), key=_key)
+
+    def record(self, target: str, candidates: Sequence[str], matched: Optional[str]) -> None:
+        """Store the outcome of one lookup; persisted by the next :meth:`flush`."""
+
+        with self._lock:
+            stats = self._targets.setdefault(target, _TargetStats())
+            stats.lookups += 1
+            for selector in candidates:
+                entry = stats.selectors.setdefault(selector, SelectorStats(first_lookup=stats.lookups))
+                if selector == matched:
+                    entry.hits += 1
+                    entry.last_hit_lookup = stats.lookups
+                else:
+                    entry.misses += 1
+                    if _idle_lookups(stats, entry) == self.stale_after:
+                        LOGGER.warning(
+                            "Seletor '%s' de '%s' não corresponde há %s buscas.",
+                            selector,
+                            target,
+                            self.stale_after,
+                        )
+            self._dirty = True
+
+    def stale_selectors(self, runs: Optional[int] = None) -> Dict[str, List[str]]:
+        """Return, per target, the selectors that have not matched in ``runs`` lookups."""
+
+        threshold = self.stale_after if runs is None else runs
+        report: Dict[str, List[str]] = {}
+        with self._lock:
+            for target, stats in self._targets.items():
+                stale = [
+                    selector
+                    for selector, entry in stats.selectors.items()
+                    if _idle_lookups(stats, entry) >= threshold
+                ]
+                if stale:
+                    report[target] = stale
+        return report
+
+    def flush(self) -> None:
+        """Write the statistics recorded since the last flush, if any."""
+
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    # -- persistence --------------------------------------------------------
+    def _load(self) -> Dict[str, _TargetStats]:
+        if not self.file_path.exists():
+            return {}
+        try:
+            raw = json.loads(self.file_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return {}
+        targets: Dict[str, _TargetStats] = {}
+        for target, value in (raw.get("targets", {}) if isinstance(raw, dict) else {}).items():
+            if not isinstance(value, dict):
+                continue
+            selectors = value.get("selectors", {})
+            targets[str(target)] = _TargetStats(
+                lookups=int(value.get("lookups", 0)),
+                selectors={
+                    str(selector): SelectorStats.from_dict(entry)
+                    for selector, entry in (selectors.items() if isinstance(selectors, dict) else [])
+                },
+            )
+        return targets
+
+    def _save(self) -> None:
+        payload = {
+            "targets": {
+                target: {
+                    "lookups": stats.lookups,
+                    "selectors": {
+                        selector: asdict(entry) for selector, entry in stats.selectors.items()
+                    },
+                }
+                for target, stats in self._targets.items()
+            }
+        }
+        temp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(temp_path, self.file_path)
+
+
+__all__ = ["SelectorRegistry", "SelectorStats"]
@@ -33,12 +33,16 @@ class SessionManager:
     ENV_LOGIN_URL = "LOGIN_URL"
     ENV_EMAIL = "LINKEDIN_EMAIL"
     ENV_PASSWORD = "LINKEDIN_PASSWORD"
+    ENV_PREWARM_BROWSER = "PREWARM_BROWSER"
+    ENV_HTML_SNAPSHOTS = "HTML_SNAPSHOTS"
+    ENV_STORAGE_BACKEND = "STORAGE_BACKEND"
 
     def __init__(self, project_root: Path) -> None:
         self.project_root = project_root
         self.env_path = project_root / ".env"
         self.storage_dir = project_root / "storage"
         self.profile_dir = self.storage_dir / "webkit_profile"
+        self.storage_state_path = self.storage_dir / "webkit_storage_state.json"
         self.storage_dir.mkdir(exist_ok=True)
 
     def status(self) -> SessionStatus:
@@ -88,6 +92,24 @@ class SessionManager:
         values = dotenv_values(self.env_path) if self.env_path.exists() else {}
         return self._read_credentials(values)
 
+    def prewarm_enabled(self) -> bool:
+        """Return whether the browser should be launched while preflight runs."""
+
+        values = dotenv_values(self.env_path) if self.env_path.exists() else {}
+        return (values.get(self.ENV_PREWARM_BROWSER) or "false").lower() == "true"
+
+    def html_snapshots_enabled(self) -> bool:
+        """Return whether scraped pages should be saved and parsed offline."""
+
+        values = dotenv_values(self.env_path) if self.env_path.exists() else {}
+        return (values.get(self.ENV_HTML_SNAPSHOTS) or "false").lower() == "true"
+
+    def storage_backend(self) -> str:
+        """Return ``"sqlite"`` when the SQLite store is enabled, otherwise ``"json"``."""
+
+        values = dotenv_values(self.env_path) if self.env_path.exists() else {}
+        return "sqlite" if (values.get(self.ENV_STORAGE_BACKEND) or "").lower() == "sqlite" else "json"
+
     def _read_credentials(self, values: dict[str, Optional[str]]) -> Optional[Credentials]:
         email = values.get(self.ENV_EMAIL)
         password = values.get(self.ENV_PASSWORD)
@@ -110,6 +132,8 @@ class SessionManager:
                 child_dir.rmdir()
             self.profile_dir.rmdir()
 
+        self.storage_state_path.unlink(missing_ok=True)
+
         if self.env_path.exists():
             current = {
                 key: value
@@ -0,0 +1,95 @@
+"""Offline inspection of persisted Playwright storage state snapshots."""
+from __future__ import annotations
+
+import json
+import os
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+
+AUTH_COOKIE_NAME = "li_at"
+AUTH_COOKIE_DOMAIN = "linkedin.com"
+
+
+class SessionVerdict(Enum):
+    """Outcome of checking the LinkedIn authentication cookie."""
+
+    VALID = "valid"
+    INVALID = "invalid"
+    UNKNOWN = "unknown"
+
+
+def load_storage_state(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the storage state stored at ``path`` or ``None`` when unusable."""
+
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return raw if isinstance(raw, dict) else None
+
+
+def save_storage_state(path: Path, state: Mapping[str, Any]) -> None:
+    """Atomically persist a storage state snapshot next to the browser profile."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def inspect_storage_state(
+    state: Optional[Mapping[str, Any]],
+    *,
+    now: Optional[float] = None,
+    margin_seconds: float = 300.0,
+) -> SessionVerdict:
+    """Decide whether the ``li_at`` cookie in ``state`` still authenticates the user.
+
+    Returns ``UNKNOWN`` when the snapshot is missing or the cookie has no
+    expiry (session cookie), so callers can fall back to a real probe.
+    """
+
+    if not state:
+        return SessionVerdict.UNKNOWN
+    cookies = state.get("cookies")
+    if not isinstance(cookies, list):
+        return SessionVerdict.UNKNOWN
+
+    auth_cookie = next(
+        (
+            cookie
+            for cookie in cookies
+            if isinstance(cookie, dict)
+            and cookie.get("name") == AUTH_COOKIE_NAME
+            and str(cookie.get("domain", "")).lstrip(".").endswith(AUTH_COOKIE_DOMAIN)
+        ),
+        None,
+    )
+    if auth_cookie is None or not auth_cookie.get("value"):
+        return SessionVerdict.INVALID
+
+    try:
+        expires = float(auth_cookie.get("expires", -1))
+    except (TypeError, ValueError):
+        return SessionVerdict.UNKNOWN
+    if expires < 0:
+        return SessionVerdict.UNKNOWN
+
+    current = time.time() if now is None else now
+    if expires <= current + margin_seconds:
+        return SessionVerdict.INVALID
+    return SessionVerdict.VALID
+
+
+__all__ = [
+    "AUTH_COOKIE_NAME",
+    "SessionVerdict",
+    "inspect_storage_state",
+    "load_storage_state",
+    "save_storage_state",
+]
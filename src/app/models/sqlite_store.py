@@ -0,0 +1,483 @@
+"""Optional SQLite storage engine for the profile, settings, jobs and runs.
+
+The JSON files rewrite everything on each save, which stops scaling once tens
+of thousands of postings are kept. :class:`SQLiteDatabase` keeps the same data
+in one WAL-mode database; the repositories below expose the interfaces of
+:class:`ScrapUserRepository` and :class:`SearchPreferencesRepository` so the
+controllers and screens work with either engine.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .job_posting import JobPosting
+from .profile_versions import ProfileVersionStore
+from .scrap_user import (
+    DEFAULT_SCRAP_TEMPLATE,
+    ScrapUserRepository,
+    _SectionIndex,
+    _default_payload,
+    _read_section_hashes,
+    _read_snapshot,
+)
+from .search_preferences import SearchPreferences, SearchPreferencesRepository
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profile_items (
+    section TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (section, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS profile_hashes (
+    section TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    company TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    listed_at TEXT NOT NULL DEFAULT '',
+    easy_apply INTEGER NOT NULL DEFAULT 0,
+    url TEXT NOT NULL DEFAULT '',
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS jobs_listed_at ON jobs (listed_at);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    details TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+"""
+
+_MIGRATED_KEY = "json_migrated_at"
+
+
+class SQLiteDatabase:
+    """Shared connection to the local database, usable from any thread.
+
+    The database runs in WAL mode so the GUI can read while the browser
+    thread writes. Statements are serialised by a lock; :meth:`transaction`
+    may be nested and only the outermost block commits.
+    """
+
+    FILENAME = "cvapply.sqlite3"
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._generation = 0
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("PRAGMA busy_timeout=5000")
+            self._connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block atomically, rolling back when it raises."""
+
+        with self._lock:
+            outermost = self._depth == 0
+            if outermost:
+                self._connection.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self._connection
+            except BaseException:
+                self._depth -= 1
+                if outermost:
+                    self._connection.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if outermost:
+                self._connection.execute("COMMIT")
+                self._generation += 1
+
+    def query(self, sql: str, parameters: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            cursor = self._connection.execute(sql, parameters)
+            cursor.row_factory = sqlite3.Row
+            return cursor.fetchall()
+
+    def data_version(self) -> Tuple[int, int]:
+        """Counter that changes whenever anything commits to the database.
+
+        ``PRAGMA data_version`` only moves for commits made by other
+        connections, so it is paired with the number of commits made through
+        this one.
+        """
+
+        with self._lock:
+            return int(self.query("PRAGMA data_version")[0][0]), self._generation
+
+    def get_meta(self, key: str) -> Optional[str]:
+        rows = self.query("SELECT value FROM meta WHERE key = ?", (key,))
+        return str(rows[0]["value"]) if rows else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self.transaction() as connection:
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class SQLiteScrapUserRepository(ScrapUserRepository):
+    """:class:`ScrapUserRepository` whose sections live in ``profile_items``.
+
+    Merging and the read-only cache are inherited; each update inserts only
+    the rows it adds. The cache is keyed by :meth:`SQLiteDatabase.data_version`
+    so writes through any connection are picked up. The JSON paths of the base
+    class point next to the database file and are only used by the migrator.
+    """
+
+    def __init__(self, database: SQLiteDatabase, *, versions: Optional[ProfileVersionStore] = None) -> None:
+        self.database = database
+        super().__init__(database.path.parent, versions=versions)
+
+    def load_section_hashes(self) -> Dict[str, str]:
+        if not self._has_snapshot():
+            # Without stored data every section must be treated as changed.
+            return {}
+        rows = self.database.query("SELECT section, digest FROM profile_hashes")
+        return {row["section"]: row["digest"] for row in rows if row["section"] in DEFAULT_SCRAP_TEMPLATE}
+
+    def save_section_hashes(self, hashes: Dict[str, str]) -> None:
+        with self.database.transaction() as connection:
+            connection.execute("DELETE FROM profile_hashes")
+            connection.executemany(
+                "INSERT INTO profile_hashes (section, digest) VALUES (?, ?)",
+                [(str(section), str(digest)) for section, digest in hashes.items()],
+            )
+
+    # -- storage ------------------------------------------------------------
+    def _files_signature(self) -> Any:
+        return self.database.data_version()
+
+    def _has_snapshot(self) -> bool:
+        return bool(self.database.query("SELECT 1 FROM profile_items LIMIT 1"))
+
+    def _read_payload(self) -> Tuple[Dict[str, List[Any]], bool, Dict[str, _SectionIndex]]:
+        payload = _default_payload()
+        for row in self.database.query("SELECT section, item FROM profile_items ORDER BY section, position"):
+            if row["section"] in payload:
+                payload[row["section"]].append(json.loads(row["item"]))
+        return payload, False, {}
+
+    # The signature index is kept in memory only: ``data_version`` does not
+    # identify the stored rows across connections the way a snapshot digest does.
+    def _stored_indexes(self) -> Optional[Dict[str, _SectionIndex]]:
+        return None
+
+    def _store_indexes(self, data: bytes, indexes: Dict[str, _SectionIndex]) -> None:
+        pass
+
+    def _persist_update(
+        self,
+        record: Dict[str, Any],
+        payload: Dict[str, List[Any]],
+        indexes: Optional[Dict[str, _SectionIndex]] = None,
+    ) -> None:
+        with self.database.transaction() as connection:
+            for section, values in (record.get("set") or {}).items():
+                connection.execute("DELETE FROM profile_items WHERE section = ?", (section,))
+                _insert_items(connection, section, values, start=0)
+            for section, values in (record.get("add") or {}).items():
+                _insert_items(connection, section, values, start=len(payload[section]) - len(values))
+        self._remember(payload)
+
+    def _compact(
+        self, payload: Dict[str, List[Any]], indexes: Optional[Dict[str, _SectionIndex]] = None
+    ) -> None:
+        with self.database.transaction() as connection:
+            connection.execute("DELETE FROM profile_items")
+            for section, values in payload.items():
+                _insert_items(connection, section, values, start=0)
+        self._remember(payload)
+
+
+def _insert_items(connection: sqlite3.Connection, section: str, values: Sequence[Any], *, start: int) -> None:
+    connection.executemany(
+        "INSERT OR REPLACE INTO profile_items (section, position, item) VALUES (?, ?, ?)",
+        [(section, start + index, json.dumps(value, ensure_ascii=False)) for index, value in enumerate(values)],
+    )
+
+
+class SQLiteSearchPreferencesRepository(SearchPreferencesRepository):
+    """:class:`SearchPreferencesRepository` stored as a row of ``settings``."""
+
+    SETTINGS_KEY = "search_preferences"
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        self.database = database
+
+    def load(self) -> SearchPreferences:
+        rows = self.database.query("SELECT value FROM settings WHERE key = ?", (self.SETTINGS_KEY,))
+        if not rows:
+            return SearchPreferences()
+        try:
+            raw = json.loads(rows[0]["value"])
+        except json.JSONDecodeError:
+            return SearchPreferences()
+        return self._normalise(SearchPreferences.from_dict(raw if isinstance(raw, dict) else None))
+
+    def save(self, preferences: SearchPreferences) -> SearchPreferences:
+        normalised = self._normalise(preferences)
+        with self.database.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                (self.SETTINGS_KEY, json.dumps(normalised.to_dict(), ensure_ascii=False)),
+            )
+        return normalised
+
+
+class SQLiteJobRepository:
+    """Job postings found by the searches, upserted in batched transactions."""
+
+    BATCH_SIZE = 500
+
+    def __init__(self, database: SQLiteDatabase, *, clock: Callable[[], float] = time.time) -> None:
+        self.database = database
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return int(self.database.query("SELECT COUNT(*) FROM jobs")[0][0])
+
+    def save_many(self, jobs: Iterable[JobPosting]) -> int:
+        """Insert or refresh ``jobs``; ``first_seen`` is kept for known ids."""
+
+        saved = 0
+        batch: List[Tuple[Any, ...]] = []
+        for job in jobs:
+            now = self._clock()
+            batch.append(
+                (job.job_id, job.title, job.company, job.location, job.listed_at, int(job.easy_apply), job.url, now, now)
+            )
+            if len(batch) >= self.BATCH_SIZE:
+                saved += self._write_batch(batch)
+                batch = []
+        if batch:
+            saved += self._write_batch(batch)
+        return saved
+
+    def get(self, job_id: str) -> Optional[JobPosting]:
+        rows = self.database.query("SELECT * FROM jobs WHERE job_id = ?", (str(job_id),))
+        return _job_from_row(rows[0]) if rows else None
+
+    def find(
+        self,
+        *,
+        company: Optional[str] = None,
+        listed_since: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[JobPosting]:
+        """Return postings, newest first, optionally filtered by company and posting date."""
+
+        clauses: List[str] = []
+        parameters: List[Any] = []
+        if company:
+            clauses.append("company = ?")
+            parameters.append(company)
+        if listed_since:
+            clauses.append("listed_at >= ?")
+            parameters.append(listed_since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.database.query(
+            f"SELECT * FROM jobs {where} ORDER BY listed_at DESC, last_seen DESC LIMIT ?",
+            (*parameters, limit),
+        )
+        return [_job_from_row(row) for row in rows]
+
+    def _write_batch(self, batch: List[Tuple[Any, ...]]) -> int:
+        with self.database.transaction() as connection:
+            connection.executemany(
+                """
+                INSERT INTO jobs (job_id, title, company, location, listed_at, easy_apply, url, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (job_id) DO UPDATE SET
+                    title = excluded.title,
+                    company = excluded.company,
+                    location = excluded.location,
+                    listed_at = excluded.listed_at,
+                    easy_apply = excluded.easy_apply,
+                    url = excluded.url,
+                    last_seen = excluded.last_seen
+                """,
+                batch,
+            )
+        return len(batch)
+
+
+def _job_from_row(row: sqlite3.Row) -> JobPosting:
+    return JobPosting(
+        job_id=row["job_id"],
+        title=row["title"],
+        company=row["company"],
+        location=row["location"],
+        listed_at=row["listed_at"],
+        easy_apply=bool(row["easy_apply"]),
+        url=row["url"],
+    )
+
+
+@dataclass(slots=True)
+class RunRecord:
+    """One automation run (profile scan, job search...)."""
+
+    run_id: int
+    kind: str
+    status: str
+    started_at: float
+    finished_at: Optional[float] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+class SQLiteRunRepository:
+    """History of automation runs."""
+
+    def __init__(self, database: SQLiteDatabase, *, clock: Callable[[], float] = time.time) -> None:
+        self.database = database
+        self._clock = clock
+
+    def start(self, kind: str, details: Optional[Mapping[str, Any]] = None) -> int:
+        with self.database.transaction() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (kind, status, started_at, details) VALUES (?, 'running', ?, ?)",
+                (kind, self._clock(), json.dumps(dict(details or {}), ensure_ascii=False)),
+            )
+            return int(cursor.lastrowid)
+
+    def finish(self, run_id: int, status: str, details: Optional[Mapping[str, Any]] = None) -> None:
+        with self.database.transaction() as connection:
+            if details is None:
+                connection.execute(
+                    "UPDATE runs SET status = ?, finished_at = ? WHERE id = ?", (status, self._clock(), run_id)
+                )
+            else:
+                connection.execute(
+                    "UPDATE runs SET status = ?, finished_at = ?, details = ? WHERE id = ?",
+                    (status, self._clock(), json.dumps(dict(details), ensure_ascii=False), run_id),
+                )
+
+    def recent(self, limit: int = 20) -> List[RunRecord]:
+        rows = self.database.query("SELECT * FROM runs ORDER BY started_at DESC, id DESC LIMIT ?", (limit,))
+        return [
+            RunRecord(
+                run_id=row["id"],
+                kind=row["kind"],
+                status=row["status"],
+                started_at=row["started_at"],
+                finished_at=row["finished_at"],
+                details=json.loads(row["details"] or "{}"),
+            )
+            for row in rows
+        ]
+
+
+def _import_run(connection: sqlite3.Connection, raw: Mapping[str, Any]) -> None:
+    finished_at = raw.get("finished_at")
+    connection.execute(
+        "INSERT INTO runs (kind, status, started_at, finished_at, details) VALUES (?, ?, ?, ?, ?)",
+        (
+            str(raw.get("kind") or "desconhecido"),
+            str(raw.get("status") or "desconhecido"),
+            float(raw.get("started_at") or 0.0),
+            None if finished_at is None else float(finished_at),
+            json.dumps(raw.get("details") or {}, ensure_ascii=False),
+        ),
+    )
+
+
+def _read_json_list(path: Path, key: str) -> List[Mapping[str, Any]]:
+    """Read ``path`` as a list of objects, also accepting ``{key: [...]}``."""
+
+    if not path.exists():
+        return []
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return []
+    if isinstance(raw, dict):
+        raw = raw.get(key, [])
+    return [item for item in raw if isinstance(item, Mapping)] if isinstance(raw, list) else []
+
+
+def migrate_json_storage(storage_dir: Path, database: SQLiteDatabase) -> Dict[str, int]:
+    """Copy the JSON files of ``storage_dir`` into ``database`` once.
+
+    Imports ``ScrapUser.json`` (with its journal and section hashes),
+    ``search_preferences.json`` and, when present, ``jobs.json`` and
+    ``runs.json`` in a single transaction. The JSON files are left untouched
+    as a backup. Returns how many items were imported per kind; an empty dict
+    means the database had already been migrated.
+    """
+
+    if database.get_meta(_MIGRATED_KEY) is not None:
+        return {}
+    counts: Dict[str, int] = {}
+    with database.transaction() as connection:
+        # Read the JSON profile without the repository so nothing is compacted or deleted.
+        profile_path = storage_dir / "ScrapUser.json"
+        if profile_path.exists():
+            json_payload, _, _ = _read_snapshot(
+                profile_path, storage_dir / "ScrapUser.journal.jsonl", discard_stale=False
+            )
+            profile = SQLiteScrapUserRepository(database)
+            payload = profile.save(json_payload)
+            profile.save_section_hashes(_read_section_hashes(storage_dir / "ScrapUser.hashes.json"))
+            counts["profile"] = sum(len(values) for values in payload.values())
+
+        json_preferences = SearchPreferencesRepository(storage_dir)
+        if json_preferences.file_path.exists():
+            SQLiteSearchPreferencesRepository(database).save(json_preferences.load())
+            counts["settings"] = 1
+
+        jobs = (JobPosting.from_card(raw) for raw in _read_json_list(storage_dir / "jobs.json", "jobs"))
+        counts["jobs"] = SQLiteJobRepository(database).save_many(job for job in jobs if job is not None)
+
+        runs = _read_json_list(storage_dir / "runs.json", "runs")
+        for raw in runs:
+            _import_run(connection, raw)
+        counts["runs"] = len(runs)
+
+        database.set_meta(_MIGRATED_KEY, str(time.time()))
+    return counts
+
+
+__all__ = [
+    "RunRecord",
+    "SQLiteDatabase",
+    "SQLiteJobRepository",
+    "SQLiteRunRepository",
+    "SQLiteScrapUserRepository",
+    "SQLiteSearchPreferencesRepository",
+    "migrate_json_storage",
+]
@@ -3,15 +3,27 @@ from __future__ import annotations
 
 import tkinter as tk
 from pathlib import Path
-from tkinter import ttk
+from tkinter import messagebox, ttk
 
 from ..controllers import LinkedInActionsController
 from ..controllers.browser import LinkedInBrowserController
+from ..controllers.html_parsing import SnapshotParserPool
 from ..controllers.login import LinkedInLoginController
 from ..controllers.navigation import AppState, NavigationController
+from ..controllers.webkit_install import WebKitInstaller
+from ..models.html_snapshots import HtmlSnapshotStore
 from ..models.scrap_user import ScrapUserRepository
 from ..models.search_preferences import SearchPreferencesRepository
+from ..models.seen_jobs import SeenJobsIndex
+from ..models.selector_stats import SelectorRegistry
 from ..models.session import SessionManager, SessionStatus
+from ..models.sqlite_store import (
+    SQLiteDatabase,
+    SQLiteJobRepository,
+    SQLiteScrapUserRepository,
+    SQLiteSearchPreferencesRepository,
+    migrate_json_storage,
+)
 from ..models.system import SystemTestRunner
 from ..views.screens import (
     AutoLoginScreen,
@@ -34,11 +46,51 @@ class Application(tk.Tk):
 
         self.session_manager = SessionManager(project_root)
         initial_status = self.session_manager.status()
-        self.browser = LinkedInBrowserController(initial_status.profile_dir)
+        self.webkit_installer = WebKitInstaller(self.session_manager.storage_dir)
+        self.webkit_installer.start()
+        self.selector_registry = SelectorRegistry(self.session_manager.storage_dir)
+        self.browser = LinkedInBrowserController(
+            initial_status.profile_dir,
+            storage_state_path=self.session_manager.storage_state_path,
+            installer=self.webkit_installer,
+            selector_registry=self.selector_registry,
+        )
+        self.browser.add_challenge_listener(
+            lambda url: self.after(0, self._on_security_challenge, url)
+        )
+        if initial_status.has_credentials and self.session_manager.prewarm_enabled():
+            # Launch WebKit while the preflight checks run so AutoLogin reuses it.
+            self.browser.warm_up()
         self.login_controller = LinkedInLoginController(self.browser, self.session_manager)
-        self.scrap_repository = ScrapUserRepository(self.session_manager.storage_dir)
-        self.search_preferences = SearchPreferencesRepository(self.session_manager.storage_dir)
-        self.actions_controller = LinkedInActionsController(self.browser, self.scrap_repository)
+        storage_dir = self.session_manager.storage_dir
+        self.database: SQLiteDatabase | None = None
+        self.job_repository: SQLiteJobRepository | None = None
+        if self.session_manager.storage_backend() == "sqlite":
+            self.database = SQLiteDatabase(storage_dir / SQLiteDatabase.FILENAME)
+            migrate_json_storage(storage_dir, self.database)
+            self.scrap_repository: ScrapUserRepository = SQLiteScrapUserRepository(self.database)
+            self.search_preferences: SearchPreferencesRepository = SQLiteSearchPreferencesRepository(self.database)
+            self.job_repository = SQLiteJobRepository(self.database)
+        else:
+            self.scrap_repository = ScrapUserRepository(storage_dir)
+            self.search_preferences = SearchPreferencesRepository(storage_dir)
+        self.seen_jobs = SeenJobsIndex(self.session_manager.storage_dir)
+        self.fetched_details = SeenJobsIndex(self.session_manager.storage_dir, filename="fetched_job_details.idx")
+        self.snapshot_store: HtmlSnapshotStore | None = None
+        self.parser_pool: SnapshotParserPool | None = None
+        if self.session_manager.html_snapshots_enabled():
+            self.snapshot_store = HtmlSnapshotStore(self.session_manager.storage_dir)
+            self.parser_pool = SnapshotParserPool()
+        self.actions_controller = LinkedInActionsController(
+            self.browser,
+            self.scrap_repository,
+            selector_registry=self.selector_registry,
+            seen_jobs=self.seen_jobs,
+            fetched_details=self.fetched_details,
+            snapshot_store=self.snapshot_store,
+            parser_pool=self.parser_pool,
+            job_repository=self.job_repository,
+        )
         self.test_runner = SystemTestRunner(self.session_manager)
         self._current_status = initial_status
 
@@ -65,6 +117,7 @@ class Application(tk.Tk):
                 state,
                 tokens,
                 runner=self.test_runner,
+                installer=self.webkit_installer,
                 on_success=self._advance_after_preflight,
                 on_missing_credentials=lambda: self._show_credentials(self._refresh_status()),
             ),
@@ -153,9 +206,25 @@ class Application(tk.Tk):
     def _on_auto_login_completed(self, _event: tk.Event | None = None) -> None:
         self._show_home(self._refresh_status())
 
+    def _on_security_challenge(self, url: str | None) -> None:
+        if url is None:
+            return
+        messagebox.showwarning(
+            "Verificação do LinkedIn",
+            "O LinkedIn pediu uma verificação de segurança (CAPTCHA ou checkpoint).\n"
+            "Resolva-a na janela do navegador; as tarefas pendentes continuam automaticamente em seguida.",
+        )
+
     def _on_close(self) -> None:
         try:
             self.browser.shutdown()
+            if self.parser_pool is not None:
+                self.parser_pool.shutdown()
+            self.seen_jobs.flush()
+            self.fetched_details.flush()
+            self.selector_registry.flush()
+            if self.database is not None:
+                self.database.close()
         finally:
             self.destroy()
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import threading
 import tkinter as tk
-from typing import Any, Callable
+from typing import Any, Callable, Mapping, Sequence
 
 from tkinter import ttk
 
@@ -185,8 +185,8 @@ class HomeScreen(BaseScreen):
     def _ensure_profile_data(self) -> None:
         if self._auto_scan_started:
             return
-        payload = self.scrap_repository.load()
-        nome = payload.get("Nome", [])
+        payload = self.scrap_repository.view()
+        nome = payload.get("Nome", ())
         if nome and any(nome):
             return
 
@@ -202,16 +202,23 @@ class HomeScreen(BaseScreen):
         formacao = payload.get("Formação", [])
         competencias = payload.get("Competências", [])
         prefix = "Varredura automática concluída. " if automatic else "Varredura concluída. "
+        changed = self.actions_controller.last_changed_sections
+        changes = (
+            "Seções atualizadas: " + ", ".join(changed) + "."
+            if changed
+            else "Nenhuma seção mudou desde a última varredura."
+        )
         return (
             prefix
             + f"Experiências registradas: {len(experiencias)}. "
             + f"Formações registradas: {len(formacao)}. "
-            + f"Competências registradas: {len(competencias)}."
+            + f"Competências registradas: {len(competencias)}. "
+            + changes
         )
 
     def _resolve_user_name(self) -> str:
-        payload = self.scrap_repository.load()
-        nomes = payload.get("Nome", [])
+        payload = self.scrap_repository.view()
+        nomes = payload.get("Nome", ())
         if nomes and nomes[0]:
             return str(nomes[0])
         if self.app_state.current_user:
@@ -229,20 +236,20 @@ class HomeScreen(BaseScreen):
     def _refresh_profile_summary(self) -> None:
         if self.profile_text is None:
             return
-        payload = self.scrap_repository.load()
+        payload = self.scrap_repository.view()
         lines: list[str] = []
 
-        nome = payload.get("Nome", [])
+        nome = payload.get("Nome", ())
         lines.append("Nome: " + (nome[0] if nome else "não identificado"))
 
-        def _append_section(title: str, values: list[Any]) -> None:
+        def _append_section(title: str, values: Sequence[Any]) -> None:
             lines.append("")
             lines.append(title + ":")
             if not values:
                 lines.append("  - Nenhum registro disponível")
                 return
             for value in values:
-                if isinstance(value, dict):
+                if isinstance(value, Mapping):
                     description = "; ".join(
                         f"{key}: {val}" for key, val in value.items() if val
                     )
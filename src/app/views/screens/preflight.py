@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import threading
 import tkinter as tk
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 from tkinter import ttk
 
+from ...controllers.webkit_install import WebKitInstaller
 from ...models.system import SystemCheckResult, SystemTestRunner
 from .base import BaseScreen
 
@@ -22,16 +23,19 @@ class PreflightScreen(BaseScreen):
         tokens,
         runner: SystemTestRunner,
         *,
+        installer: Optional[WebKitInstaller] = None,
         on_success: Callable[[], None],
         on_missing_credentials: Callable[[], None],
     ) -> None:
         super().__init__(parent, router, app_state, tokens)
         self.runner = runner
+        self.installer = installer
         self.on_success = on_success
         self.on_missing_credentials = on_missing_credentials
         self._is_running = False
         self._current_checks: List[str] = []
         self._result_vars: List[tk.StringVar] = []
+        self._install_listener: Optional[Callable[[str], None]] = None
 
     def build(self) -> None:
         title = ttk.Label(self, text="Preparação do ambiente", style="Heading.TLabel")
@@ -49,6 +53,16 @@ class PreflightScreen(BaseScreen):
         self.list_frame = ttk.Frame(self)
         self.list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, self.tokens.spacing.section))
 
+        self.install_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.install_var, wraplength=620, justify=tk.LEFT).pack(
+            anchor=tk.W, pady=(0, self.tokens.spacing.section)
+        )
+        if self.installer is not None:
+            if self._install_listener is not None:
+                self.installer.remove_listener(self._install_listener)
+            self._install_listener = lambda message: self.after(0, lambda: self.install_var.set(message))
+            self.installer.add_listener(self._install_listener)
+
         self.retry_button = ttk.Button(self, text="Tentar novamente", command=self._start_checks)
         self.retry_button.pack(anchor=tk.W)
         self.retry_button.config(state=tk.DISABLED)
@@ -56,6 +70,13 @@ class PreflightScreen(BaseScreen):
     def on_show(self, **params: object) -> None:
         self.after(100, self._start_checks)
 
+    def destroy(self) -> None:
+        # The installer outlives the screen; stop it from scheduling callbacks on a dead widget.
+        if self.installer is not None and self._install_listener is not None:
+            self.installer.remove_listener(self._install_listener)
+            self._install_listener = None
+        super().destroy()
+
     def _prepare_rows(self) -> None:
         checks = self.runner.get_checks()
         self._current_checks = [check.name for check in checks]
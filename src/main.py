@@ -9,6 +9,7 @@ def reset_environment(project_root: Path) -> None:
     """Remove persisted state so the app behaves like the first launch."""
 
     storage_path = project_root / "storage" / "webkit_profile"
+    storage_state_path = project_root / "storage" / "webkit_storage_state.json"
     env_path = project_root / ".env"
 
     if storage_path.exists():
@@ -16,6 +17,8 @@ def reset_environment(project_root: Path) -> None:
 
         shutil.rmtree(storage_path)
 
+    storage_state_path.unlink(missing_ok=True)
+
     if env_path.exists():
         env_path.unlink()
 
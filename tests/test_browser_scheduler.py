@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.app.controllers.scheduler import BrowserScheduler, TaskPriority
+
+
+def test_scheduler_serves_higher_priority_first() -> None:
+    async def scenario() -> list[str]:
+        scheduler = BrowserScheduler(1, aging_seconds=0)
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def job(name: str) -> None:
+            order.append(name)
+            if name == "first":
+                await gate.wait()
+
+        first = asyncio.create_task(scheduler.run(lambda: job("first"), TaskPriority.BACKGROUND))
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(scheduler.run(lambda: job("prefetch"), TaskPriority.PREFETCH)),
+            asyncio.create_task(scheduler.run(lambda: job("scan"), TaskPriority.BACKGROUND)),
+            asyncio.create_task(scheduler.run(lambda: job("login"), TaskPriority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 3
+        gate.set()
+        await asyncio.gather(first, *tasks)
+        assert scheduler.stats().max_queue_depth == 3
+        return order
+
+    assert asyncio.run(scenario()) == ["first", "login", "scan", "prefetch"]
+
+
+def test_scheduler_ages_waiting_tasks() -> None:
+    now = [0.0]
+    scheduler = BrowserScheduler(1, aging_seconds=5, clock=lambda: now[0])
+
+    async def scenario() -> list[str]:
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def job(name: str) -> None:
+            order.append(name)
+            if name == "first":
+                await gate.wait()
+
+        first = asyncio.create_task(scheduler.run(lambda: job("first")))
+        await asyncio.sleep(0)
+        prefetch = asyncio.create_task(scheduler.run(lambda: job("prefetch"), TaskPriority.PREFETCH))
+        await asyncio.sleep(0)
+        now[0] = 11.0
+        scan = asyncio.create_task(scheduler.run(lambda: job("scan"), TaskPriority.BACKGROUND))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, prefetch, scan)
+        return order
+
+    assert asyncio.run(scenario()) == ["first", "prefetch", "scan"]
+
+
+def test_exclusive_task_waits_for_running_tasks() -> None:
+    async def scenario() -> list[str]:
+        scheduler = BrowserScheduler(2)
+        events: list[str] = []
+        gate = asyncio.Event()
+
+        async def shared(name: str) -> None:
+            events.append(f"start {name}")
+            await gate.wait()
+            events.append(f"end {name}")
+
+        async def exclusive() -> None:
+            events.append("exclusive")
+
+        a = asyncio.create_task(scheduler.run(lambda: shared("a")))
+        b = asyncio.create_task(scheduler.run(lambda: shared("b")))
+        await asyncio.sleep(0)
+        closing = asyncio.create_task(scheduler.run(exclusive, TaskPriority.INTERACTIVE, exclusive=True))
+        await asyncio.sleep(0)
+        assert events == ["start a", "start b"]
+        gate.set()
+        await asyncio.gather(a, b, closing)
+        return events
+
+    assert asyncio.run(scenario())[-1] == "exclusive"
+
+
+def test_cancelled_waiter_leaves_the_queue() -> None:
+    async def scenario() -> None:
+        scheduler = BrowserScheduler(1)
+        gate = asyncio.Event()
+        first = asyncio.create_task(scheduler.run(gate.wait))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(scheduler.run(gate.wait))
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 1
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 0
+        gate.set()
+        await first
+        assert scheduler.stats().running == 0
+
+    asyncio.run(scenario())
+
+
+def test_paused_scheduler_queues_work_until_resumed() -> None:
+    async def scenario() -> list[str]:
+        scheduler = BrowserScheduler(2)
+        order: list[str] = []
+
+        async def job(name: str) -> None:
+            order.append(name)
+
+        scheduler.pause()
+        tasks = [asyncio.create_task(scheduler.run(lambda name=name: job(name))) for name in ("a", "b")]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert order == []
+        assert scheduler.stats().paused and scheduler.queue_depth == 2
+        scheduler.resume()
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(scenario()) == ["a", "b"]
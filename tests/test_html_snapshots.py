@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.app.controllers.html_parsing import SnapshotParserPool, parse_job_cards_html, parse_profile_html
+from src.app.controllers.profile_extraction import build_profile_snapshot
+from src.app.models.html_snapshots import HtmlSnapshotStore
+
+
+PROFILE_HTML = """
+<html><body><main>
+  <h1 class="text-heading-xlarge">Maria Souza</h1>
+  <section><div id="experience"></div>
+    <div data-view-name="profile-component-entity">
+      <a href="/in/maria/details/experience/">
+        <div><span>Engenheira de
+          Software</span></div>
+        <div><span>ACME</span></div>
+        <div><span>jan 2020 - o momento</span></div><div><span>São Paulo</span></div>
+      </a>
+      <div class="inline-show-more-text--is-collapsed">APIs em Python …ver mais</div>
+    </div>
+    <div data-view-name="profile-component-entity"><span>Sem link de detalhes</span></div>
+  </section>
+  <section><div id="skills"></div>
+    <ul><li class="artdeco-list__item"><span>Python</span></li><li class="pvs-list__item">SQL</li></ul>
+  </section>
+  <script>var ignored = "<li class='artdeco-list__item'>x</li>";</script>
+</main></body></html>
+"""
+
+CARDS_HTML = """
+<ul>
+  <li data-occludable-job-id="111">
+    <div class="job-card-container" data-job-id="111">
+      <a class="job-card-list__title" href="/jobs/view/111/">Dev Python<br>com verificação</a>
+      <div class="artdeco-entity-lockup__subtitle">ACME</div>
+      <div class="artdeco-entity-lockup__caption">Remoto</div>
+      <time datetime="2026-10-01">há 2 semanas</time>
+      <span>Candidatura simplificada</span>
+    </div>
+  </li>
+  <li data-occludable-job-id="222"><strong>Analista</strong></li>
+</ul>
+"""
+
+
+def test_profile_html_matches_the_in_page_script_shape() -> None:
+    raw = parse_profile_html(PROFILE_HTML)
+
+    assert raw["name"] == "Maria Souza"
+    assert raw["sections"]["skills"] == [["Python"], ["SQL"]]
+    assert raw["sections"]["projects"] is None
+
+    snapshot = build_profile_snapshot(raw)
+    assert snapshot.sections["skills"] == ["Python", "SQL"]
+    assert snapshot.experiences is not None and len(snapshot.experiences) == 1
+    assert snapshot.experiences[0].to_dict() == {
+        "cargo": "Engenheira de Software",
+        "empresa": "ACME",
+        "periodo": "jan 2020 - o momento",
+        "local": "São Paulo",
+        "descricao": "APIs em Python",
+    }
+
+
+def test_job_cards_html_matches_the_in_page_script_shape() -> None:
+    cards = parse_job_cards_html(CARDS_HTML)
+
+    assert cards[0] == {
+        "job_id": "111",
+        "title": "Dev Python",
+        "company": "ACME",
+        "location": "Remoto",
+        "listed_at": "2026-10-01",
+        "easy_apply": True,
+    }
+    assert (cards[1]["title"], cards[1]["easy_apply"]) == ("Analista", False)
+    # The container nested in the first <li> is not reported as a second card.
+    assert len(cards) == 2
+
+
+def test_snapshots_are_pruned_and_reparsed_in_worker_processes(tmp_path) -> None:
+    store = HtmlSnapshotStore(tmp_path, keep_per_key=2)
+    for _ in range(3):
+        store.save("profile", "me", PROFILE_HTML)
+    store.save("job_cards", "busca/1?start=0", CARDS_HTML)
+
+    assert len(store.list("profile")) == 2
+    snapshot = store.latest("job_cards", "busca/1?start=0")
+    assert snapshot is not None and store.read(snapshot) == CARDS_HTML
+
+    pool = SnapshotParserPool(max_workers=2)
+    try:
+        profile, cards = asyncio.run(pool.parse_many([store.latest("profile", "me"), snapshot]))
+    finally:
+        pool.shutdown()
+    assert profile["name"] == "Maria Souza"
+    assert [card["job_id"] for card in cards] == ["111", "222"]
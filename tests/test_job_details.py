@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from src.app.controllers.job_details import JobDetailsFetcher, parse_guest_job_html, parse_voyager_job
+
+
+GUEST_HTML = """
+<section class="top-card-layout">
+  <h2 class="top-card-layout__title font-sans">Desenvolvedor Python</h2>
+  <a class="topcard__org-name-link topcard__flavor--black-link" href="#"> ACME &amp; Cia </a>
+  <span class="topcard__flavor topcard__flavor--bullet"> São Paulo, SP </span>
+  <figcaption class="num-applicants__caption">Mais de 200 candidaturas</figcaption>
+</section>
+<div class="show-more-less-html__markup">
+  <p>Responsabilidades:</p><ul><li>APIs</li><li>Automação</li></ul><br>
+</div>
+<ul class="description__job-criteria-list">
+  <li><h3 class="description__job-criteria-subheader">Nível de experiência</h3>
+      <span class="description__job-criteria-text">Pleno-sênior</span></li>
+  <li><h3 class="description__job-criteria-subheader">Tipo de emprego</h3>
+      <span class="description__job-criteria-text">Tempo integral</span></li>
+</ul>
+"""
+
+
+def test_parse_guest_job_html() -> None:
+    details = parse_guest_job_html(GUEST_HTML, "123")
+
+    assert details is not None
+    assert details.title == "Desenvolvedor Python"
+    assert details.company == "ACME & Cia"
+    assert details.location == "São Paulo, SP"
+    assert details.applicants == "Mais de 200 candidaturas"
+    assert details.description == "Responsabilidades:\nAPIs\nAutomação"
+    assert details.criteria == {"Nível de experiência": "Pleno-sênior", "Tipo de emprego": "Tempo integral"}
+    assert parse_guest_job_html("<div>sem vaga</div>", "123") is None
+
+
+def test_parse_voyager_job_resolves_company_from_included() -> None:
+    payload = {
+        "data": {
+            "title": "Engenheira de Dados",
+            "description": {"text": "Pipelines  em\nSpark"},
+            "formattedLocation": "Remoto",
+            "applies": 42,
+            "companyDetails": {
+                "com.linkedin.voyager.jobs.JobPostingCompany": {"company": "urn:li:fs_normalized_company:1"}
+            },
+        },
+        "included": [{"entityUrn": "urn:li:fs_normalized_company:1", "name": "Dados SA"}],
+    }
+
+    details = parse_voyager_job(payload, "9")
+
+    assert details is not None
+    assert (details.company, details.applicants, details.source) == ("Dados SA", "42", "api")
+    assert details.description == "Pipelines em\nSpark"
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self.ok = 200 <= status < 300
+        self._body = body
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, dict | None]] = []
+
+    async def cookie_value(self, name: str) -> str:
+        return "ajax:123"
+
+    async def api_get(self, url: str, *, headers=None) -> FakeResponse:
+        self.requests.append((url, headers))
+        if "voyager" in url:
+            if url.split("jobPostings/")[1].startswith("1"):
+                return FakeResponse(200, json.dumps({"data": {"title": "Via API"}}).encode())
+            return FakeResponse(403, b"")
+        return FakeResponse(200, GUEST_HTML.encode())
+
+
+def test_fetcher_falls_back_to_the_guest_fragment() -> None:
+    browser = FakeBrowser()
+    fetcher = JobDetailsFetcher(browser)  # type: ignore[arg-type]
+
+    results = asyncio.run(fetcher.fetch_many(["1", "2", "1"]))
+
+    assert [(details.job_id, details.title, details.source) for details in results] == [
+        ("1", "Via API", "api"),
+        ("2", "Desenvolvedor Python", "guest"),
+    ]
+    assert browser.requests[0][1]["csrf-token"] == "ajax:123"
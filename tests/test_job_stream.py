@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.app.controllers.linkedin_actions import LinkedInActionsController
+from src.app.models.job_posting import JobPosting
+from src.app.models.search_preferences import SearchPreferences
+
+
+class FakeBrowser:
+    @asynccontextmanager
+    async def page_session(self, priority, *, scrape_mode=False):
+        yield object()
+
+
+def _controller(tmp_path, produced: list[str], total: int, fail_after: int | None = None):
+    controller = LinkedInActionsController(FakeBrowser(), scrap_repository=None)  # type: ignore[arg-type]
+
+    async def fake_walk(page, preferences, max_pages):
+        for index in range(total):
+            if fail_after is not None and index == fail_after:
+                raise RuntimeError("falha na página")
+            produced.append(str(index))
+            yield JobPosting(job_id=str(index))
+            await asyncio.sleep(0)
+
+    controller._walk_job_results = fake_walk  # type: ignore[method-assign]
+    return controller
+
+
+def test_iter_jobs_is_bounded_by_the_buffer(tmp_path) -> None:
+    produced: list[str] = []
+    controller = _controller(tmp_path, produced, total=100)
+
+    async def scenario() -> list[str]:
+        received = []
+        async for job in controller.iter_jobs(SearchPreferences(), buffer_size=5):
+            received.append(job.job_id)
+            for _ in range(20):
+                await asyncio.sleep(0)
+            assert len(produced) - len(received) <= 6
+            if len(received) == 3:
+                break
+        return received
+
+    assert asyncio.run(scenario()) == ["0", "1", "2"]
+    assert len(produced) < 100
+
+
+def test_iter_jobs_drains_buffer_then_raises(tmp_path) -> None:
+    produced: list[str] = []
+    controller = _controller(tmp_path, produced, total=10, fail_after=4)
+
+    async def scenario() -> list[str]:
+        received = []
+        async for job in controller.iter_jobs(SearchPreferences()):
+            received.append(job.job_id)
+        return received
+
+    with pytest.raises(RuntimeError, match="falha"):
+        asyncio.run(scenario())
+    assert produced == ["0", "1", "2", "3"]
+
+
+def test_job_posting_from_card_requires_numeric_id() -> None:
+    assert JobPosting.from_card({"job_id": "abc"}) is None
+    job = JobPosting.from_card({"job_id": "123", "title": " Dev ", "easy_apply": True})
+    assert job is not None
+    assert job.title == "Dev"
+    assert job.url == "https://www.linkedin.com/jobs/view/123/"
+
+
+def test_short_page_with_duplicated_cards_ends_the_walk(tmp_path) -> None:
+    visited: list[str] = []
+
+    class NavigatingBrowser(FakeBrowser):
+        async def navigate(self, page, url: str) -> None:
+            visited.append(url)
+
+    controller = LinkedInActionsController(NavigatingBrowser(), scrap_repository=None)  # type: ignore[arg-type]
+
+    async def fake_read_job_cards(page):
+        # 20 postings whose cards were each reported twice.
+        return [{"job_id": str(index), "title": "Dev"} for index in range(20) for _ in range(2)]
+
+    controller._read_job_cards = fake_read_job_cards  # type: ignore[method-assign]
+
+    async def scenario() -> list[str]:
+        return [job.job_id async for job in controller._walk_job_results(object(), SearchPreferences(), 3)]
+
+    assert asyncio.run(scenario()) == [str(index) for index in range(20)]
+    # Counting the 40 cards would have requested the next pages as well.
+    assert len(visited) == 1
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.app.controllers.page_pool import PagePool
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+
+class FakeContext:
+    def __init__(self, pages=()) -> None:
+        self.pages = list(pages)
+        self.opened = 0
+
+    async def new_page(self) -> FakePage:
+        self.opened += 1
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def test_idle_tabs_are_reused() -> None:
+    async def scenario() -> None:
+        existing = FakePage()
+        context = FakeContext([existing])
+        pool = PagePool(size=2)
+        pool.bind(context)
+
+        async with pool.lease() as first:
+            assert first is existing
+            assert pool.leased == 1
+        async with pool.lease() as second:
+            assert second is existing
+
+        assert context.opened == 0
+        assert pool.leased == 0
+
+    asyncio.run(scenario())
+
+
+def test_pool_never_exceeds_its_size() -> None:
+    async def scenario() -> None:
+        context = FakeContext()
+        pool = PagePool(size=2)
+        pool.bind(context)
+        release = asyncio.Event()
+        leased = []
+
+        async def hold() -> None:
+            async with pool.lease() as page:
+                leased.append(page)
+                await release.wait()
+
+        holders = [asyncio.ensure_future(hold()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert (len(leased), pool.leased, context.opened) == (2, 2, 2)
+
+        release.set()
+        await asyncio.gather(*holders)
+        assert len(leased) == 3
+        assert context.opened == 2
+        assert leased[2] in leased[:2]
+
+    asyncio.run(scenario())
+
+
+def test_closed_tabs_are_dropped() -> None:
+    async def scenario() -> None:
+        context = FakeContext()
+        pool = PagePool(size=1)
+        pool.bind(context)
+
+        async with pool.lease() as page:
+            page.closed = True
+        async with pool.lease() as replacement:
+            assert replacement is not page
+
+        assert context.opened == 2
+
+    asyncio.run(scenario())
+
+
+def test_tabs_from_a_relaunched_context_are_not_returned() -> None:
+    async def scenario() -> None:
+        old_context = FakeContext()
+        pool = PagePool(size=1)
+        pool.bind(old_context)
+
+        async with pool.lease() as old_page:
+            new_context = FakeContext()
+            pool.bind(new_context)
+
+        assert pool.leased == 0
+        async with pool.lease() as page:
+            assert page is not old_page
+        assert new_context.opened == 1
+
+    asyncio.run(scenario())
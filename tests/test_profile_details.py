@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from src.app.controllers.linkedin_actions import LinkedInActionsController
+from src.app.controllers.profile_extraction import details_url, merge_details_sections
+
+
+def test_details_url_and_merge_keep_main_page_content_when_empty() -> None:
+    assert (
+        details_url("https://www.linkedin.com/in/fulano/?miniProfileUrn=x", "licenses_and_certifications")
+        == "https://www.linkedin.com/in/fulano/details/certifications/"
+    )
+    raw = {
+        "name": "Fulano",
+        "experiences": [{"lines": ["A"]}],
+        "sections": {"skills": [["Python"]], "projects": [["P"]]},
+    }
+
+    merged = merge_details_sections(raw, {"skills": [["Python"], ["SQL"]], "projects": [], "experience": None})
+
+    assert merged["sections"] == {"skills": [["Python"], ["SQL"]], "projects": [["P"]]}
+    assert merged["experiences"] == [{"lines": ["A"]}]
+    assert raw["sections"]["skills"] == [["Python"]]
+
+
+class FakePage:
+    def __init__(self, browser: "FakeBrowser") -> None:
+        self.browser = browser
+        self.url = ""
+
+
+class FakeBrowser:
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.open_tabs = 0
+        self.max_open_tabs = 0
+
+    @asynccontextmanager
+    async def page_session(self, priority, *, scrape_mode=False):
+        self.open_tabs += 1
+        self.max_open_tabs = max(self.max_open_tabs, self.open_tabs)
+        try:
+            yield FakePage(self)
+        finally:
+            self.open_tabs -= 1
+
+    async def navigate(self, page, url):
+        page.url = url
+        await asyncio.sleep(self.delays[url.rstrip("/").rsplit("/", 1)[-1]])
+
+
+def test_truncated_sections_are_crawled_concurrently_within_the_budget() -> None:
+    browser = FakeBrowser({"skills": 0.01, "experience": 0.01, "projects": 5})
+    controller = LinkedInActionsController(browser, scrap_repository=None)  # type: ignore[arg-type]
+    controller.DETAILS_CRAWL_BUDGET = 0.2
+
+    async def fake_read(url: str, section: str):
+        async with browser.page_session(None) as page:
+            await browser.navigate(page, url)
+            if section == "experience":
+                return [{"lines": ["Dev", "ACME"], "description": ""}]
+            return [[f"{section} {index}"] for index in range(3)]
+
+    controller._read_details_page = fake_read  # type: ignore[method-assign]
+    raw = {
+        "name": "Fulano",
+        "experiences": [],
+        "sections": {"skills": [["skills 0"]], "projects": [["projeto"]]},
+        "details": ["experience", "skills", "projects"],
+    }
+
+    merged = asyncio.run(controller._complete_truncated_sections("https://www.linkedin.com/in/fulano/", raw))
+
+    assert merged["sections"]["skills"] == [["skills 0"], ["skills 1"], ["skills 2"]]
+    assert merged["sections"]["projects"] == [["projeto"]]
+    assert merged["experiences"] == [{"lines": ["Dev", "ACME"], "description": ""}]
+    assert browser.max_open_tabs == 3
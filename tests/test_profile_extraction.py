@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from src.app.controllers.profile_extraction import (
+    DETAILS_EXTRACTION_SCRIPT,
+    PROFILE_EXTRACTION_SCRIPT,
+    build_profile_snapshot,
+    clean_description,
+    section_fingerprints,
+)
+
+
+def test_bulk_payload_maps_onto_repository_arguments() -> None:
+    raw = {
+        "name": " Fulano de Tal ",
+        "experiences": [
+            {
+                "lines": ["Desenvolvedor", "Empresa X", "2020 - 2021", "Remoto"],
+                "description": "Atuação em APIs …ver mais",
+            },
+            {"lines": [], "description": ""},
+        ],
+        "sections": {
+            "education": [["Universidade Y", "Bacharelado"], []],
+            "skills": [["Python"], ["SQL", "3 endossos"]],
+            "projects": None,
+        },
+    }
+
+    arguments = build_profile_snapshot(raw).update_arguments()
+
+    assert arguments["nome"] == "Fulano de Tal"
+    assert arguments["experiencias"] == [
+        {
+            "cargo": "Desenvolvedor",
+            "empresa": "Empresa X",
+            "periodo": "2020 - 2021",
+            "local": "Remoto",
+            "descricao": "Atuação em APIs",
+        }
+    ]
+    assert arguments["formacao"] == ["Universidade Y – Bacharelado"]
+    assert arguments["competencias"] == ["Python", "SQL – 3 endossos"]
+    assert arguments["projetos"] is None
+    assert arguments["publicacoes"] is None
+
+
+def test_missing_experience_section_is_left_untouched() -> None:
+    arguments = build_profile_snapshot({"name": "", "experiences": None}).update_arguments()
+
+    assert arguments["experiencias"] is None
+    assert arguments["nome"] == ""
+
+
+def test_fingerprints_restrict_parsing_to_changed_sections() -> None:
+    first = {"name": "Fulano", "experiences": [], "sections": {"skills": [["Python"]]}}
+    second = {"name": "Fulano", "experiences": [], "sections": {"skills": [["Python"], ["SQL"]]}}
+
+    before = section_fingerprints(first)
+    after = section_fingerprints(second)
+    changed = [section for section, digest in after.items() if before[section] != digest]
+
+    assert changed == ["Competências"]
+    arguments = build_profile_snapshot(second, sections=changed).update_arguments()
+    assert arguments["competencias"] == ["Python", "SQL"]
+    assert arguments["nome"] is None
+    assert arguments["experiencias"] is None
+
+
+def test_extraction_scripts_expand_truncated_text_in_the_same_call() -> None:
+    for script in (PROFILE_EXTRACTION_SCRIPT, DETAILS_EXTRACTION_SCRIPT):
+        assert "const expandSeeMore" in script
+        assert "if (expand) await expandSeeMore(expand);" in script
+
+    assert clean_description("Atuação completa em APIs\n…ver menos") == "Atuação completa em APIs"
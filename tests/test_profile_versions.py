@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.app.models import profile_versions
+from src.app.models.profile_versions import ProfileVersionStore
+from src.app.models.scrap_user import ScrapUserRepository
+
+
+def test_versions_share_unchanged_sections(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(nome="Fulano", competencias=["Python"])
+    repo.update(competencias=["SQL"], projetos=["CvApply"])
+    repo.update(competencias=["SQL"])
+    repo.save(repo.load())
+
+    versions = repo.list_versions()
+    assert [version.version_id for version in versions] == [1, 2]
+    assert set(versions[1].changed) == {"Competências", "Projetos"}
+    # Entries "Fulano", "Python", "SQL" and "CvApply", plus the listings of Nome, the
+    # three Competências/Projetos states and the one shared by every empty section.
+    blobs = list(repo.versions.blobs_dir.iterdir())
+    assert len(blobs) == 9
+    lines = repo.versions.manifest_path.read_text(encoding="utf-8").splitlines()
+    assert set(json.loads(lines[1])["changes"]) == {"Competências", "Projetos"}
+
+
+def test_diff_and_restore(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(competencias=["Python", "Go"])
+    repo.save({"Competências": ["Python", "SQL"], "Nome": ["Fulano"]})
+    repo.save_section_hashes({"Competências": "abc"})
+
+    [skills, names] = sorted(repo.diff_versions(1, 2), key=lambda change: change.section)
+    assert (names.section, names.added, names.removed) == ("Nome", ["Fulano"], [])
+    assert (skills.added, skills.removed) == (["SQL"], ["Go"])
+
+    restored = repo.restore_version(1)
+
+    assert restored["Competências"] == ["Python", "Go"]
+    assert ScrapUserRepository(tmp_path).load() == restored
+    assert repo.load_section_hashes() == {}
+    latest = repo.list_versions()[-1]
+    assert (latest.version_id, latest.reason) == (3, "restore:1")
+    assert repo.versions.get(3) == repo.versions.get(1)
+
+
+def test_torn_manifest_line_is_dropped(tmp_path: Path) -> None:
+    store = ProfileVersionStore(tmp_path)
+    store.record({"Competências": ["Python"]})
+    with store.manifest_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": 2, "changes": {"Compet')
+
+    reopened = ProfileVersionStore(tmp_path)
+    version = reopened.record({"Competências": ["SQL"]})
+
+    assert version is not None and version.version_id == 2
+    assert [v.version_id for v in ProfileVersionStore(tmp_path).list()] == [1, 2]
+    assert ProfileVersionStore(tmp_path).get(2) == {"Competências": ["SQL"]}
+
+
+def test_blobs_are_synced_before_the_manifest_line(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = ProfileVersionStore(tmp_path)
+    synced: list[bool] = []
+    real_fsync = os.fsync
+
+    def fake_fsync(descriptor: int) -> None:
+        # Whether the manifest already references the new version at each sync.
+        synced.append(store.manifest_path.exists() and store.manifest_path.stat().st_size > 0)
+        real_fsync(descriptor)
+
+    monkeypatch.setattr(profile_versions.os, "fsync", fake_fsync)
+    store.record({"Competências": ["Python"], "Projetos": []})
+
+    # The entry, two listings and the blobs directory before the manifest, then the manifest.
+    assert synced == [False, False, False, False, True]
+
+
+def test_editing_one_entry_stores_only_that_entry(tmp_path: Path) -> None:
+    store = ProfileVersionStore(tmp_path)
+    experiences = [{"cargo": f"Dev {index}", "descricao": "APIs em Python " * 40} for index in range(30)]
+    store.record({"Experiência": experiences})
+    before = {path.name: path.stat().st_size for path in store.blobs_dir.iterdir()}
+
+    experiences[7] = {**experiences[7], "cargo": "Dev Sênior"}
+    store.record({"Experiência": experiences})
+
+    new_blobs = [path for path in store.blobs_dir.iterdir() if path.name not in before]
+    assert len(new_blobs) == 2
+    assert sum(path.stat().st_size for path in new_blobs) < sum(before.values()) / 5
+    assert store.get(2)["Experiência"][7]["cargo"] == "Dev Sênior"
+    [change] = store.diff(1, 2)
+    assert [item["cargo"] for item in change.added] == ["Dev Sênior"]
+
+
+def test_whole_section_blobs_of_older_versions_are_still_read(tmp_path: Path) -> None:
+    store = ProfileVersionStore(tmp_path)
+    legacy = json.dumps(["Python", "SQL"]).encode("utf-8")
+    (store.blobs_dir / "legacy.json").write_bytes(legacy)
+    line = json.dumps({"id": 1, "changes": {"Competências": "legacy"}})
+    store.manifest_path.write_text(line + "\n", encoding="utf-8")
+
+    reopened = ProfileVersionStore(tmp_path)
+    reopened.record({"Competências": ["Python", "Go"]})
+
+    assert reopened.get(1) == {"Competências": ["Python", "SQL"]}
+    [change] = reopened.diff(1, 2)
+    assert (change.added, change.removed) == (["Go"], ["SQL"])
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.app.controllers.browser import LinkedInBrowserController
+from src.app.controllers.rate_limiter import AdaptiveRateLimiter, ChallengeDetectedError, is_challenge_url
+from src.app.models.search_preferences import SearchPreferences, build_jobs_search_url
+
+
+class ReadyInstaller:
+    """Stands in for :class:`WebKitInstaller` so no runtime download is attempted."""
+
+    ready = True
+
+    def start(self) -> None:
+        pass
+
+    def wait(self, timeout: float | None = None) -> None:
+        pass
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(fake: FakeTime, **kwargs) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(clock=fake.clock, sleep=fake.sleep, **kwargs)
+
+
+def test_bucket_allows_a_burst_then_paces_navigations() -> None:
+    fake = FakeTime()
+    limiter = _limiter(fake, rate=0.5, burst=2)
+
+    async def scenario() -> None:
+        for _ in range(3):
+            await limiter.acquire()
+
+    asyncio.run(scenario())
+
+    assert fake.sleeps == [2.0]
+
+
+def test_throttling_halves_the_rate_and_backs_off() -> None:
+    fake = FakeTime()
+    limiter = _limiter(fake, rate=1.0, burst=1, max_rate=1.0)
+
+    limiter.record_response(999, 0.5)
+    limiter.record_response(429, 0.5)
+
+    stats = limiter.stats()
+    assert stats.rate == 0.25
+    assert stats.throttled_responses == 2
+    assert stats.backoff_seconds == 4.0
+
+    asyncio.run(limiter.acquire())
+    assert fake.now >= 4.0
+
+    limiter.record_response(200, 10.0)
+    assert limiter.rate == 0.125
+    limiter.record_response(200, 0.2)
+    assert limiter.rate > 0.125
+
+
+def test_challenge_urls_are_detected() -> None:
+    assert is_challenge_url("https://www.linkedin.com/checkpoint/challenge/AgF...")
+    assert is_challenge_url("https://www.linkedin.com/uas/captcha-submit")
+    assert is_challenge_url("https://www.linkedin.com/challenge")
+    assert not is_challenge_url("https://www.linkedin.com/jobs/search/?keywords=python")
+
+
+def test_search_keywords_and_profile_slugs_are_not_challenges() -> None:
+    search_url = build_jobs_search_url(SearchPreferences(keywords="reCAPTCHA engineer"))
+
+    assert not is_challenge_url(search_url)
+    assert not is_challenge_url("https://www.linkedin.com/jobs/search/?keywords=checkpoint%20challenge")
+    assert not is_challenge_url("https://www.linkedin.com/in/challenger-silva/")
+    assert not is_challenge_url("https://www.linkedin.com/in/captcha-fan/details/experience/")
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.visited: list[str] = []
+        self.closed = False
+
+    async def goto(self, url: str, **_: object) -> None:
+        self.visited.append(url)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, answer_url: str) -> None:
+        self.pages: list[_FakePage] = []
+        self.request = self
+        self.answer_url = answer_url
+
+    async def get(self, url: str, headers=None) -> _FakeResponse:
+        # Let concurrent requests all be in flight before any answer arrives.
+        await asyncio.sleep(0)
+        return _FakeResponse(self.answer_url)
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage()
+        self.pages.append(page)
+        return page
+
+
+def test_api_checkpoint_pauses_automation_until_the_context_closes(tmp_path) -> None:
+    checkpoint = "https://www.linkedin.com/checkpoint/challenge/AgF"
+    browser = LinkedInBrowserController(tmp_path / "profile", installer=ReadyInstaller())
+    context = _FakeContext(checkpoint)
+    notified: list[str | None] = []
+    browser.add_challenge_listener(notified.append)
+
+    async def fake_ensure_context(headless: bool = False) -> _FakeContext:
+        return context
+
+    browser._ensure_context = fake_ensure_context  # type: ignore[method-assign]
+
+    async def concurrent_requests() -> list[object]:
+        urls = [f"https://www.linkedin.com/voyager/api/jobs/{job_id}" for job_id in range(3)]
+        return await asyncio.gather(*(browser.api_get(url) for url in urls), return_exceptions=True)
+
+    try:
+        outcomes = browser.submit(concurrent_requests()).result(timeout=5)
+
+        assert all(isinstance(outcome, ChallengeDetectedError) for outcome in outcomes)
+        assert browser.challenge_url == checkpoint
+        assert browser.scheduler_stats().paused
+        assert [page.visited for page in context.pages] == [[checkpoint]]
+        assert notified == [checkpoint]
+
+        browser.close_browser()
+        browser.submit(asyncio.sleep(0)).result(timeout=5)
+
+        assert browser.challenge_url is None
+        assert not browser.scheduler_stats().paused
+        assert notified == [checkpoint, None]
+        assert context.pages[0].closed
+    finally:
+        browser.shutdown()
+
+
+def test_navigation_refuses_to_run_while_a_checkpoint_is_pending(tmp_path) -> None:
+    fake = FakeTime()
+    limiter = _limiter(fake, burst=1)
+    browser = LinkedInBrowserController(tmp_path / "profile", installer=ReadyInstaller(), rate_limiter=limiter)
+    page = _FakePage()
+    browser.challenge_url = "https://www.linkedin.com/checkpoint/challenge/AgF"
+    try:
+        with pytest.raises(ChallengeDetectedError):
+            browser.submit(browser.navigate(page, "https://www.linkedin.com/jobs/")).result(timeout=5)
+
+        assert page.visited == []
+        assert limiter.stats().tokens == 1
+    finally:
+        browser.challenge_url = None
+        browser.shutdown()
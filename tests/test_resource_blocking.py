@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from src.app.controllers.browser import LinkedInBrowserController
+from src.app.controllers.resource_blocking import BlockList, ResourceBlocker, ScrapeStats
+
+
+class ReadyInstaller:
+    """Stands in for :class:`WebKitInstaller` so no runtime download is attempted."""
+
+    ready = True
+
+    def start(self) -> None:
+        pass
+
+    def wait(self, timeout: float | None = None) -> None:
+        pass
+
+
+class FakeRoute:
+    def __init__(self) -> None:
+        self.outcome: str | None = None
+
+    async def abort(self, error_code: str | None = None) -> None:
+        self.outcome = "aborted"
+
+    async def continue_(self) -> None:
+        self.outcome = "continued"
+
+
+def test_block_list_matches_types_and_patterns() -> None:
+    blocklist = BlockList()
+    assert blocklist.matches("image", "https://media.licdn.com/a.jpg")
+    assert blocklist.matches("xhr", "https://www.linkedin.com/li/track?x=1")
+    assert not blocklist.matches("document", "https://www.linkedin.com/in/fulano/")
+
+
+def test_blocker_counts_saved_requests() -> None:
+    blocker = ResourceBlocker(BlockList(resource_types={"font"}, url_patterns=()))
+
+    async def scenario() -> list[str | None]:
+        outcomes = []
+        for resource_type in ("font", "document", "font"):
+            route = FakeRoute()
+            request = SimpleNamespace(resource_type=resource_type, url="https://www.linkedin.com/")
+            await blocker._handle(route, request)
+            outcomes.append(route.outcome)
+        return outcomes
+
+    assert asyncio.run(scenario()) == ["aborted", "continued", "aborted"]
+    assert blocker.stats.blocked_requests == 2
+    assert blocker.stats.allowed_requests == 1
+    assert blocker.stats.blocked_by_type == {"font": 2}
+    assert blocker.stats.estimated_bytes_saved > 0
+
+
+def test_stats_of_concurrent_sessions_add_up() -> None:
+    total = ScrapeStats()
+    for resource_type in ("font", "image"):
+        session = ScrapeStats(allowed_requests=3)
+        session.record_blocked(resource_type)
+        session.record_blocked("font")
+        total.merge(session)
+
+    assert (total.allowed_requests, total.blocked_requests) == (6, 4)
+    assert total.blocked_by_type == {"font": 3, "image": 1}
+    assert total.estimated_bytes_saved == 3 * 30_000 + 40_000
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.handler = None
+
+    async def route(self, pattern: str, handler) -> None:
+        self.handler = handler
+
+    async def unroute(self, pattern: str, handler) -> None:
+        self.handler = None
+
+    def is_closed(self) -> bool:
+        return False
+
+    async def request(self, resource_type: str) -> None:
+        await self.handler(FakeRoute(), SimpleNamespace(resource_type=resource_type, url="https://www.linkedin.com/"))
+
+
+def test_browser_sums_concurrent_scrape_sessions(tmp_path) -> None:
+    browser = LinkedInBrowserController(tmp_path / "profile", installer=ReadyInstaller())
+
+    @asynccontextmanager
+    async def fake_leased_page(priority):
+        yield FakePage()
+
+    browser._leased_page = fake_leased_page  # type: ignore[method-assign]
+
+    async def session(resource_type: str, started: asyncio.Event, other: asyncio.Event) -> None:
+        async with browser.page_session(scrape_mode=True) as page:
+            await page.request(resource_type)
+            started.set()
+            # Both sessions are open before either finishes.
+            await other.wait()
+
+    async def scenario() -> None:
+        first, second = asyncio.Event(), asyncio.Event()
+        await asyncio.gather(session("image", first, second), session("font", second, first))
+
+    try:
+        browser.submit(scenario()).result(timeout=5)
+        stats = browser.take_scrape_stats()
+        assert stats.blocked_by_type == {"image": 1, "font": 1}
+        assert browser.take_scrape_stats().blocked_requests == 0
+    finally:
+        browser.shutdown()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 
+import pytest
+
+from src.app.models import scrap_user
 from src.app.models.scrap_user import ExperienceRecord, ScrapUserRepository
 
 
@@ -66,3 +70,185 @@ def test_update_merges_other_sections(tmp_path: Path) -> None:
     assert payload["Formação"] == ["Curso A", "Curso B"]
     assert payload["Competências"] == ["Python", "SQL"]
     assert payload["Licenças e certificados"] == ["Certificado X"]
+
+
+def test_section_hashes_require_stored_profile(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.save_section_hashes({"Competências": "abc"})
+    assert repo.load_section_hashes() == {}
+
+    repo.update(competencias=["Python"])
+    assert repo.load_section_hashes() == {"Competências": "abc"}
+
+
+def test_view_is_cached_read_only_and_tracks_external_writes(tmp_path: Path, monkeypatch) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(nome="Fulano", experiencias=[{"cargo": "Dev"}])
+
+    reads = []
+    original = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or original(self))
+
+    view = repo.view()
+    assert repo.view() is view
+    assert reads == []
+    assert view["Nome"] == ("Fulano",)
+    assert view["Experiência"][0]["cargo"] == "Dev"
+    with pytest.raises(TypeError):
+        view["Experiência"][0]["cargo"] = "Outro"  # type: ignore[index]
+
+    mutable = repo.load()
+    mutable["Nome"].append("Outro")
+    assert repo.view()["Nome"] == ("Fulano",)
+
+    payload = json.loads(original(repo.file_path))
+    payload["Nome"] = ["Beltrano da Silva"]
+    repo.file_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+    assert repo.view()["Nome"] == ("Beltrano da Silva",)
+    assert reads == [repo.file_path]
+
+
+def test_updates_are_journaled_and_compacted_on_load(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(nome="Fulano", competencias=["Python"])
+    snapshot = repo.file_path.read_bytes()
+
+    repo.update(competencias=["Python", "SQL"], formacao=["Curso A"])
+    repo.update(competencias=["SQL"])
+
+    assert repo.file_path.read_bytes() == snapshot
+    records = repo.journal_path.read_text(encoding="utf-8").splitlines()
+    assert len(records) == 2
+    assert json.loads(records[1]) == {"add": {"Formação": ["Curso A"], "Competências": ["SQL"]}}
+
+    with repo.journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"add": {"Projetos": ["interrom')
+
+    reloaded = ScrapUserRepository(tmp_path).load()
+
+    assert reloaded["Competências"] == ["Python", "SQL"]
+    assert reloaded["Formação"] == ["Curso A"]
+    assert reloaded["Projetos"] == []
+    assert not repo.journal_path.exists()
+    assert json.loads(repo.file_path.read_text(encoding="utf-8")) == reloaded
+
+
+def test_stale_journal_from_interrupted_compaction_is_discarded(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(competencias=["Python"])
+    repo.update(competencias=["SQL"])
+    stale_journal = repo.journal_path.read_bytes()
+
+    repo.save({"Competências": ["Go"]})
+    repo.journal_path.write_bytes(stale_journal)
+
+    assert ScrapUserRepository(tmp_path).load()["Competências"] == ["Go"]
+
+
+def test_update_skips_case_and_spacing_duplicates(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(competencias=["Python", "Machine  Learning"])
+
+    payload = repo.update(competencias=["python ", "machine learning", "SQL"])
+
+    assert payload["Competências"] == ["Python", "Machine  Learning", "SQL"]
+
+
+def test_update_detects_near_duplicate_experiences(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    original = ExperienceRecord(
+        cargo="Desenvolvedor",
+        empresa="ACME",
+        periodo="2020 - 2022",
+        descricao="Desenvolvimento de APIs em Python com FastAPI e PostgreSQL para o time de pagamentos.",
+    ).to_dict()
+    repo.update(experiencias=[original])
+    indexes = repo._indexes[1]
+
+    rescraped = dict(
+        original,
+        cargo="desenvolvedor ",
+        descricao="Desenvolvimento de APIs em Python com FastAPI e PostgreSQL para o time de pagamentos e cobrança.",
+    )
+    other_role = dict(original, periodo="2022 - 2024", descricao="Liderança técnica do time de dados.")
+    rewritten = dict(original, descricao="Suporte a clientes corporativos e treinamento de usuários finais.")
+    payload = repo.update(experiencias=[rescraped, dict(original, descricao=""), other_role, rewritten])
+
+    assert payload["Experiência"] == [original, other_role, rewritten]
+    assert repo._indexes[1] is indexes
+    assert ScrapUserRepository(tmp_path).load()["Experiência"] == [original, other_role, rewritten]
+
+
+def test_append_after_torn_journal_line_starts_a_new_record(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(competencias=["Python"])
+    repo.update(competencias=["SQL"])
+    with repo.journal_path.open("r+b") as handle:
+        handle.truncate(repo.journal_path.stat().st_size - 5)
+
+    repo.update(projetos=["CvApply"])
+
+    reloaded = ScrapUserRepository(tmp_path).load()
+    assert reloaded["Projetos"] == ["CvApply"]
+    assert reloaded["Competências"] == ["Python"]
+
+
+def test_append_after_torn_journal_header_writes_a_new_header(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(competencias=["Python"])
+    # Interrupted right after the header, before its newline reached the disk.
+    header = json.dumps({"base": hashlib.blake2b(repo.file_path.read_bytes(), digest_size=16).hexdigest()})
+    repo.journal_path.write_text(header, encoding="utf-8")
+
+    repo.update(projetos=["CvApply"])
+
+    header = json.loads(repo.journal_path.read_text(encoding="utf-8").splitlines()[0])
+    assert set(header) == {"base"}
+    reloaded = ScrapUserRepository(tmp_path).load()
+    assert reloaded["Projetos"] == ["CvApply"]
+    assert reloaded["Competências"] == ["Python"]
+
+
+def _experience(index: int, descricao: str = "") -> dict:
+    return {
+        "cargo": f"Dev {index}",
+        "empresa": "ACME",
+        "periodo": "2020",
+        "descricao": descricao or f"APIs em Python {index}",
+    }
+
+
+def test_signature_index_is_reused_after_a_restart(tmp_path: Path, monkeypatch) -> None:
+    ScrapUserRepository(tmp_path).update(experiencias=[_experience(index) for index in range(20)])
+    ScrapUserRepository(tmp_path).update(experiencias=[_experience(20)])
+    assert ScrapUserRepository(tmp_path).journal_path.exists()
+
+    hashed: list[str] = []
+    original = scrap_user._shingles
+    monkeypatch.setattr(scrap_user, "_shingles", lambda text: hashed.append(text) or original(text))
+
+    # Replaying the journal onto the saved index only hashes the journal's entry.
+    repo = ScrapUserRepository(tmp_path)
+    assert len(repo.view()["Experiência"]) == 21
+    assert hashed == ["APIs em Python 20"]
+    assert not repo.journal_path.exists()
+
+    hashed.clear()
+    payload = ScrapUserRepository(tmp_path).update(
+        experiencias=[_experience(3, "APIs em Python 3 e Go"), _experience(21)]
+    )
+
+    # The near duplicate is matched against the saved shingles of "Dev 3".
+    assert [item["cargo"] for item in payload["Experiência"]][-2:] == ["Dev 20", "Dev 21"]
+    assert hashed == ["APIs em Python 3 e Go", "APIs em Python 21"]
+
+
+def test_signature_index_of_another_snapshot_is_ignored(tmp_path: Path) -> None:
+    repo = ScrapUserRepository(tmp_path)
+    repo.update(competencias=["Python"])
+    repo.file_path.write_text(json.dumps({"Competências": ["Go"]}), encoding="utf-8")
+
+    payload = ScrapUserRepository(tmp_path).update(competencias=["python", "go "])
+
+    assert payload["Competências"] == ["Go", "python"]
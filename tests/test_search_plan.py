@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from src.app.controllers.search_plan import SearchPlanExecutor, expand_search_plan
+from src.app.models.job_posting import JobPosting
+from src.app.models.search_preferences import SearchPreferences
+from src.app.models.seen_jobs import SeenJobsIndex
+
+
+class FakeActions:
+    def __init__(self, results: dict[tuple[str, str], list[str]], fail: set[str] | None = None) -> None:
+        self.results = results
+        self.fail = fail or set()
+        self.running = 0
+        self.max_running = 0
+        self.browser = type("Browser", (), {"page_pool_size": 2})()
+
+    async def iter_jobs(self, preferences, *, max_pages=None, skip_seen=False, record_seen=True):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            for job_id in self.results[(preferences.keywords, preferences.location)]:
+                await asyncio.sleep(0)
+                yield JobPosting(job_id=job_id)
+            if preferences.keywords in self.fail:
+                raise RuntimeError(f"falha em {preferences.keywords}")
+        finally:
+            self.running -= 1
+
+
+def test_expand_search_plan_crosses_keywords_and_locations() -> None:
+    preferences = SearchPreferences(keywords="Python; Django;", location="Brasil", remote=True, companies=["1"])
+
+    plan = expand_search_plan(preferences, locations=["Brasil", "Suécia"])
+
+    assert [(query.keywords, query.location) for query in plan] == [
+        ("Python", "Brasil"),
+        ("Python", "Suécia"),
+        ("Django", "Brasil"),
+        ("Django", "Suécia"),
+    ]
+    assert all(query.remote and query.companies == ["1"] for query in plan)
+    assert plan[0].companies is not preferences.companies
+    assert [(query.keywords, query.location) for query in expand_search_plan(SearchPreferences())] == [("", "")]
+
+
+def test_executor_merges_and_deduplicates_under_the_concurrency_limit() -> None:
+    results = {
+        ("a", ""): ["1", "2", "3"],
+        ("b", ""): ["3", "4"],
+        ("c", ""): ["1", "5"],
+    }
+    actions = FakeActions(results)
+    executor = SearchPlanExecutor(actions)  # type: ignore[arg-type]
+    plan = expand_search_plan(SearchPreferences(keywords="a;b;c"))
+
+    async def scenario() -> list[str]:
+        return [job.job_id async for job in executor.iter_jobs(plan)]
+
+    received = asyncio.run(scenario())
+
+    assert sorted(received) == ["1", "2", "3", "4", "5"]
+    assert actions.max_running == 2
+
+
+def test_executor_reports_failures_after_other_queries_finish() -> None:
+    actions = FakeActions({("a", ""): ["1"], ("b", ""): ["2", "3"]}, fail={"a"})
+    executor = SearchPlanExecutor(actions, concurrency=1)  # type: ignore[arg-type]
+    received: list[str] = []
+
+    async def scenario() -> None:
+        async for job in executor.iter_jobs(expand_search_plan(SearchPreferences(keywords="a;b"))):
+            received.append(job.job_id)
+
+    with pytest.raises(RuntimeError, match="falha em a"):
+        asyncio.run(scenario())
+    assert received == ["1", "2", "3"]
+
+
+def test_executor_records_only_postings_the_consumer_handled(tmp_path) -> None:
+    actions = FakeActions({("a", ""): ["1", "2", "3", "4"]})
+    actions.seen_jobs = SeenJobsIndex(tmp_path)
+    executor = SearchPlanExecutor(actions)  # type: ignore[arg-type]
+
+    async def scenario() -> None:
+        async with aclosing(executor.iter_jobs(expand_search_plan(SearchPreferences(keywords="a")))) as jobs:
+            async for job in jobs:
+                if job.job_id == "3":
+                    break
+
+    asyncio.run(scenario())
+
+    reloaded = SeenJobsIndex(tmp_path)
+    assert [job_id in reloaded for job_id in "1234"] == [True, True, False, False]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlsplit
+
+from src.app.models.search_preferences import SearchPreferences, build_jobs_search_url
+
+
+def _query(url: str) -> dict[str, list[str]]:
+    return parse_qs(urlsplit(url).query)
+
+
+def test_all_filters_are_compiled_into_query_parameters() -> None:
+    preferences = SearchPreferences(
+        keywords="Desenvolvedor Python",
+        location="São Paulo, Brasil",
+        remote=True,
+        hybrid=True,
+        date_filter="last_week",
+        experience_levels=["Pleno-sênior", "Júnior"],
+        companies=["1586", "Empresa X", "Desconhecida"],
+        easy_apply_only=True,
+    )
+
+    url = build_jobs_search_url(preferences, start=50, company_ids={"empresa x": "2222"})
+
+    assert url.startswith("https://www.linkedin.com/jobs/search/?")
+    assert "f_WT=2,3" in url
+    assert _query(url) == {
+        "keywords": ["Desenvolvedor Python"],
+        "location": ["São Paulo, Brasil"],
+        "f_WT": ["2,3"],
+        "f_TPR": ["r604800"],
+        "f_E": ["3,4"],
+        "f_C": ["1586,2222"],
+        "f_AL": ["true"],
+        "start": ["50"],
+    }
+
+
+def test_default_preferences_only_request_easy_apply() -> None:
+    url = build_jobs_search_url(SearchPreferences())
+
+    assert _query(url) == {"f_AL": ["true"]}
+    assert build_jobs_search_url(SearchPreferences(easy_apply_only=False)) == "https://www.linkedin.com/jobs/search/"
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+
+from src.app.controllers.linkedin_actions import LinkedInActionsController
+from src.app.models.job_posting import JobDetails, JobPosting
+from src.app.models.search_preferences import SearchPreferences
+from src.app.models.seen_jobs import SeenJobsIndex
+
+
+def test_index_tracks_first_and_last_seen_across_reloads(tmp_path) -> None:
+    clock = iter([100.0, 200.0, 300.0])
+    index = SeenJobsIndex(tmp_path, clock=lambda: next(clock))
+
+    assert index.record(JobPosting(job_id="42", title="Dev"))
+    assert not index.record(JobPosting(job_id="42", title="Dev"))
+    assert index.record(JobPosting(job_id="42", title="Dev Sênior"))
+    index.flush()
+
+    reloaded = SeenJobsIndex(tmp_path)
+    entry = reloaded.get("42")
+    assert entry is not None
+    assert (entry.first_seen, entry.last_seen) == (100.0, 300.0)
+    assert reloaded.is_unchanged(JobPosting(job_id="42", title="Dev Sênior"))
+    assert "43" not in reloaded
+
+
+def test_index_compacts_superseded_records_and_ignores_partial_writes(tmp_path) -> None:
+    index = SeenJobsIndex(tmp_path)
+    for _ in range(5):
+        index.record(JobPosting(job_id="1"))
+    index.flush()
+    with index.file_path.open("ab") as handle:
+        handle.write(b"\x00" * 7)
+
+    reloaded = SeenJobsIndex(tmp_path)
+
+    assert len(reloaded) == 1
+    assert reloaded.file_path.stat().st_size == 8 + 40
+
+
+class FakeBrowser:
+    @asynccontextmanager
+    async def page_session(self, priority, *, scrape_mode=False):
+        yield object()
+
+
+def test_iter_jobs_skips_postings_seen_in_previous_runs(tmp_path) -> None:
+    index = SeenJobsIndex(tmp_path)
+    index.record(JobPosting(job_id="1", title="Dev"))
+    index.record(JobPosting(job_id="2", title="QA"))
+    controller = LinkedInActionsController(FakeBrowser(), scrap_repository=None, seen_jobs=index)  # type: ignore[arg-type]
+
+    async def fake_walk(page, preferences, max_pages):
+        for job in [JobPosting(job_id="1", title="Dev"), JobPosting(job_id="2", title="QA II"), JobPosting(job_id="3")]:
+            yield job
+
+    controller._walk_job_results = fake_walk  # type: ignore[method-assign]
+
+    async def scenario() -> list[str]:
+        return [job.job_id async for job in controller.iter_jobs(SearchPreferences(), skip_seen=True)]
+
+    assert asyncio.run(scenario()) == ["2", "3"]
+    assert "3" in SeenJobsIndex(tmp_path)
+
+
+def test_iter_jobs_records_only_postings_the_consumer_handled(tmp_path) -> None:
+    index = SeenJobsIndex(tmp_path)
+    controller = LinkedInActionsController(FakeBrowser(), scrap_repository=None, seen_jobs=index)  # type: ignore[arg-type]
+
+    async def fake_walk(page, preferences, max_pages):
+        for job_id in "12345":
+            yield JobPosting(job_id=job_id)
+
+    controller._walk_job_results = fake_walk  # type: ignore[method-assign]
+
+    async def scenario() -> list[str]:
+        handled = []
+        async with aclosing(controller.iter_jobs(SearchPreferences(), skip_seen=True)) as jobs:
+            async for job in jobs:
+                if job.job_id == "3":
+                    break
+                handled.append(job.job_id)
+        return handled
+
+    assert asyncio.run(scenario()) == ["1", "2"]
+    reloaded = SeenJobsIndex(tmp_path)
+    assert ("1" in reloaded, "2" in reloaded, "3" in reloaded, "4" in reloaded) == (True, True, False, False)
+
+
+def test_fetch_job_details_skips_postings_already_fetched(tmp_path) -> None:
+    fetched = SeenJobsIndex(tmp_path, filename="fetched_job_details.idx")
+    fetched.record(JobPosting(job_id="1", title="Dev"))
+    fetched.record(JobPosting(job_id="2", title="QA"))
+
+    class SubmittingBrowser(FakeBrowser):
+        def submit(self, coroutine):
+            return asyncio.run(coroutine)
+
+    controller = LinkedInActionsController(
+        SubmittingBrowser(), scrap_repository=None, fetched_details=fetched  # type: ignore[arg-type]
+    )
+    requested: list[list[str]] = []
+
+    async def fake_fetch_many(job_ids):
+        requested.append(list(job_ids))
+        return [JobDetails(job_id=job_id) for job_id in job_ids if job_id != "4"]
+
+    controller._job_details.fetch_many = fake_fetch_many  # type: ignore[method-assign]
+
+    postings = [
+        JobPosting(job_id="1", title="Dev"),
+        JobPosting(job_id="2", title="QA Sênior"),
+        JobPosting(job_id="3", title="Ops"),
+        JobPosting(job_id="4", title="Data"),
+    ]
+    details = controller.fetch_job_details(postings)
+
+    assert requested == [["2", "3", "4"]]
+    assert [item.job_id for item in details] == ["2", "3"]
+    reloaded = SeenJobsIndex(tmp_path, filename="fetched_job_details.idx")
+    assert "3" in reloaded and "4" not in reloaded
+    assert reloaded.is_unchanged(JobPosting(job_id="2", title="QA Sênior"))
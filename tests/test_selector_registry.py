@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.app.controllers.browser import LinkedInBrowserController
+from src.app.controllers.scheduler import TaskPriority
+from src.app.models.selector_stats import SelectorRegistry
+
+
+CANDIDATES = ["a.primary", "a.secondary", "a.fallback"]
+
+
+def test_most_recent_match_is_ranked_first_and_persisted(tmp_path: Path) -> None:
+    registry = SelectorRegistry(tmp_path)
+    assert registry.rank("login_cta", CANDIDATES) == CANDIDATES
+
+    registry.record("login_cta", CANDIDATES, "a.primary")
+    registry.record("login_cta", CANDIDATES, "a.fallback")
+    registry.flush()
+
+    reloaded = SelectorRegistry(tmp_path)
+    assert reloaded.rank("login_cta", CANDIDATES) == ["a.fallback", "a.primary", "a.secondary"]
+
+
+def test_selectors_without_matches_are_reported(tmp_path: Path) -> None:
+    registry = SelectorRegistry(tmp_path, stale_after=3)
+    for _ in range(3):
+        registry.record("jobs_nav_link", CANDIDATES, "a.secondary")
+    registry.record("jobs_nav_link", CANDIDATES + ["a.new"], "a.secondary")
+
+    assert registry.stale_selectors() == {"jobs_nav_link": ["a.primary", "a.fallback"]}
+    assert registry.stale_selectors(runs=1) == {"jobs_nav_link": ["a.primary", "a.fallback", "a.new"]}
+
+
+def test_lookups_are_written_only_on_flush(tmp_path: Path) -> None:
+    registry = SelectorRegistry(tmp_path)
+    registry.record("login_cta", CANDIDATES, "a.secondary")
+    assert not registry.file_path.exists()
+
+    registry.flush()
+    written = registry.file_path.read_bytes()
+    registry.flush()
+
+    assert registry.file_path.read_bytes() == written
+    assert [path.name for path in tmp_path.iterdir()] == [SelectorRegistry.FILENAME]
+    assert SelectorRegistry(tmp_path).rank("login_cta", CANDIDATES)[0] == "a.secondary"
+
+
+class ReadyInstaller:
+    ready = True
+
+    def start(self) -> None:
+        pass
+
+    def wait(self, timeout: float | None = None) -> None:
+        pass
+
+
+class FakePage:
+    def is_closed(self) -> bool:
+        return False
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.pages: list[FakePage] = []
+
+    async def new_page(self) -> FakePage:
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def test_every_leased_tab_flushes_the_statistics(tmp_path: Path) -> None:
+    registry = SelectorRegistry(tmp_path / "stats")
+    browser = LinkedInBrowserController(
+        tmp_path / "profile", installer=ReadyInstaller(), selector_registry=registry
+    )
+    context = FakeContext()
+
+    async def fake_ensure_context(headless: bool = False) -> FakeContext:
+        browser._pages.bind(context)
+        return context
+
+    browser._ensure_context = fake_ensure_context  # type: ignore[method-assign]
+
+    async def login_like_task() -> None:
+        # The login flow leases its tab directly instead of through page_session.
+        async with browser._leased_page(TaskPriority.INTERACTIVE):
+            registry.record("login_cta", CANDIDATES, "a.secondary")
+            assert not registry.file_path.exists()
+
+    try:
+        browser.submit(login_like_task()).result(timeout=5)
+        assert SelectorRegistry(tmp_path / "stats").rank("login_cta", CANDIDATES)[0] == "a.secondary"
+    finally:
+        browser.shutdown()
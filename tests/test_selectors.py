@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.app.controllers.selectors import first_matching_selector
+
+
+class FakePage:
+    """Resolve selectors after a fixed delay or time out."""
+
+    def __init__(self, delays: dict[str, float | None]) -> None:
+        self.delays = delays
+        self.cancelled: list[str] = []
+
+    async def wait_for_selector(self, selector: str, timeout: float, state: str):
+        delay = self.delays[selector]
+        try:
+            if delay is None:
+                await asyncio.sleep(timeout / 1000)
+                raise PlaywrightTimeoutError(f"{selector} timed out")
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(selector)
+            raise
+        return f"element:{selector}"
+
+
+def test_first_matching_selector_does_not_wait_for_stale_candidates() -> None:
+    page = FakePage({"stale-a": None, "stale-b": None, "live": 0.01})
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        match = await first_matching_selector(page, ["stale-a", "stale-b", "live"], timeout=2000)
+        return match, loop.time() - started
+
+    match, elapsed = asyncio.run(scenario())
+
+    assert match == ("live", "element:live")
+    assert elapsed < 1
+    assert sorted(page.cancelled) == ["stale-a", "stale-b"]
+
+
+def test_first_matching_selector_returns_none_when_nothing_matches() -> None:
+    page = FakePage({"a": None, "b": None})
+
+    assert asyncio.run(first_matching_selector(page, ["a", "b"], timeout=10)) is None
+
+
+class ProbePage:
+    """Only answers instant lookups; any wait fails the test."""
+
+    def __init__(self, attached: set[str]) -> None:
+        self.attached = attached
+        self.queried: list[str] = []
+
+    async def query_selector(self, selector: str):
+        self.queried.append(selector)
+        return f"element:{selector}" if selector in self.attached else None
+
+    async def wait_for_selector(self, selector: str, timeout: float, state: str):
+        raise AssertionError("a zero timeout must not wait")
+
+
+def test_zero_timeout_only_probes_the_current_dom() -> None:
+    page = ProbePage({"b"})
+
+    assert asyncio.run(first_matching_selector(page, ["a", "b", "c"], timeout=0, state="attached")) == (
+        "b",
+        "element:b",
+    )
+    assert page.queried == ["a", "b"]
+    assert asyncio.run(first_matching_selector(ProbePage(set()), ["a", "b"], timeout=0)) is None
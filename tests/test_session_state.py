@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.app.models.session_state import (
+    SessionVerdict,
+    inspect_storage_state,
+    load_storage_state,
+    save_storage_state,
+)
+
+
+def _state(**cookie: object) -> dict:
+    base = {"name": "li_at", "value": "token", "domain": ".www.linkedin.com", "expires": 2_000.0}
+    base.update(cookie)
+    return {"cookies": [base], "origins": []}
+
+
+def test_valid_cookie_is_accepted_without_browser() -> None:
+    assert inspect_storage_state(_state(), now=1_000.0) is SessionVerdict.VALID
+
+
+def test_expired_or_missing_cookie_is_rejected() -> None:
+    assert inspect_storage_state(_state(expires=900.0), now=1_000.0) is SessionVerdict.INVALID
+    assert inspect_storage_state({"cookies": []}, now=1_000.0) is SessionVerdict.INVALID
+
+
+def test_session_cookie_or_missing_snapshot_is_unknown(tmp_path: Path) -> None:
+    assert inspect_storage_state(_state(expires=-1), now=1_000.0) is SessionVerdict.UNKNOWN
+    assert load_storage_state(tmp_path / "missing.json") is None
+    assert inspect_storage_state(None) is SessionVerdict.UNKNOWN
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "webkit_storage_state.json"
+    save_storage_state(path, _state())
+    assert load_storage_state(path) == _state()
+    assert not path.with_name(path.name + ".tmp").exists()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.app.models.job_posting import JobPosting
+from src.app.models.scrap_user import ScrapUserRepository
+from src.app.models.search_preferences import SearchPreferences, SearchPreferencesRepository
+from src.app.models.sqlite_store import (
+    SQLiteDatabase,
+    SQLiteJobRepository,
+    SQLiteRunRepository,
+    SQLiteScrapUserRepository,
+    SQLiteSearchPreferencesRepository,
+    migrate_json_storage,
+)
+
+
+@pytest.fixture
+def database(tmp_path: Path):
+    database = SQLiteDatabase(tmp_path / SQLiteDatabase.FILENAME)
+    yield database
+    database.close()
+
+
+def test_database_uses_wal_and_indexes_jobs(database: SQLiteDatabase) -> None:
+    assert database.query("PRAGMA journal_mode")[0][0] == "wal"
+    indexes = {row["name"] for row in database.query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"jobs_company", "jobs_listed_at"} <= indexes
+
+
+def test_profile_repository_matches_json_behaviour(tmp_path: Path, database: SQLiteDatabase) -> None:
+    repo = SQLiteScrapUserRepository(database)
+    json_repo = ScrapUserRepository(tmp_path / "json")
+    for target in (repo, json_repo):
+        target.update(nome="Fulano", experiencias=[{"cargo": "Dev"}], competencias=["Python"])
+        target.update(nome="Fulano de Tal", competencias=["Python", "SQL"])
+
+    assert repo.load() == json_repo.load()
+    assert repo.view() is repo.view()
+
+    repo.save_section_hashes({"Competências": "abc"})
+    other_connection = SQLiteDatabase(database.path)
+    reopened = SQLiteScrapUserRepository(other_connection)
+    assert reopened.load()["Competências"] == ["Python", "SQL"]
+    assert reopened.load()["Nome"] == ["Fulano de Tal"]
+    assert reopened.load_section_hashes() == {"Competências": "abc"}
+
+    reopened.update(projetos=["CvApply"])
+    assert repo.view()["Projetos"] == ("CvApply",)
+    other_connection.close()
+
+
+def test_search_preferences_round_trip(database: SQLiteDatabase) -> None:
+    repo = SQLiteSearchPreferencesRepository(database)
+    assert repo.load() == SearchPreferences()
+
+    saved = repo.save(SearchPreferences(keywords="  python  ", companies=["ACME", "acme"]))
+
+    assert saved.keywords == "python"
+    assert saved.companies == ["ACME"]
+    assert repo.load() == saved
+
+
+def test_jobs_are_upserted_in_batches(database: SQLiteDatabase) -> None:
+    clock = iter(range(100, 10_000)).__next__
+    repo = SQLiteJobRepository(database, clock=lambda: float(clock()))
+    repo.BATCH_SIZE = 2
+    jobs = [
+        JobPosting(job_id="1", title="Dev", company="ACME", listed_at="2024-05-01"),
+        JobPosting(job_id="2", title="QA", company="Globex", listed_at="2024-05-03"),
+        JobPosting(job_id="3", title="Ops", company="ACME", listed_at="2024-04-20"),
+    ]
+
+    assert repo.save_many(jobs) == 3
+    repo.save_many([JobPosting(job_id="1", title="Dev Sênior", company="ACME", listed_at="2024-05-01")])
+
+    assert len(repo) == 3
+    assert repo.get("1").title == "Dev Sênior"
+    first_seen, last_seen = database.query("SELECT first_seen, last_seen FROM jobs WHERE job_id = '1'")[0]
+    assert first_seen < last_seen
+    assert [job.job_id for job in repo.find(company="ACME")] == ["1", "3"]
+    assert [job.job_id for job in repo.find(listed_since="2024-05-01")] == ["2", "1"]
+
+
+def test_runs_are_recorded(database: SQLiteDatabase) -> None:
+    repo = SQLiteRunRepository(database, clock=lambda: 50.0)
+    run_id = repo.start("job_search", {"query": "python"})
+    repo.finish(run_id, "ok", {"jobs": 12})
+
+    [run] = repo.recent()
+    assert (run.run_id, run.kind, run.status, run.finished_at) == (run_id, "job_search", "ok", 50.0)
+    assert run.details == {"jobs": 12}
+
+
+def test_migrator_imports_json_files_once(tmp_path: Path, database: SQLiteDatabase) -> None:
+    storage = tmp_path / "storage"
+    ScrapUserRepository(storage).update(nome="Fulano", competencias=["Python"])
+    ScrapUserRepository(storage).save_section_hashes({"Nome": "h1"})
+    SearchPreferencesRepository(storage).save(SearchPreferences(keywords="python"))
+    (storage / "jobs.json").write_text(
+        json.dumps({"jobs": [{"job_id": "42", "title": "Dev"}, {"job_id": "x"}]}), encoding="utf-8"
+    )
+    (storage / "runs.json").write_text(
+        json.dumps([{"kind": "profile_scan", "status": "ok", "started_at": 1.0}]), encoding="utf-8"
+    )
+
+    counts = migrate_json_storage(storage, database)
+
+    assert counts == {"profile": 2, "settings": 1, "jobs": 1, "runs": 1}
+    profile = SQLiteScrapUserRepository(database)
+    assert profile.load()["Competências"] == ["Python"]
+    assert profile.load_section_hashes() == {"Nome": "h1"}
+    assert SQLiteSearchPreferencesRepository(database).load().keywords == "python"
+    assert SQLiteJobRepository(database).get("42").title == "Dev"
+    assert (storage / "ScrapUser.json").exists()
+
+    assert migrate_json_storage(storage, database) == {}
+    assert len(SQLiteRunRepository(database).recent()) == 1
+
+
+def test_profile_cache_sees_writes_from_the_same_connection(database: SQLiteDatabase) -> None:
+    first = SQLiteScrapUserRepository(database)
+    second = SQLiteScrapUserRepository(database)
+    first.update(competencias=["Python"])
+    assert second.view()["Competências"] == ("Python",)
+
+    first.update(competencias=["SQL"])
+
+    assert second.view()["Competências"] == ("Python", "SQL")
+    assert second.storage_dir == database.path.parent
+    assert second.file_path == database.path.parent / "ScrapUser.json"
+    assert first.versions is not None and len(first.versions) == 2
+
+
+def test_migrator_leaves_json_files_untouched(tmp_path: Path, database: SQLiteDatabase) -> None:
+    storage = tmp_path / "storage"
+    json_repo = ScrapUserRepository(storage)
+    json_repo.save({"Competências": ["Python"]})
+    json_repo.update(competencias=["SQL"])
+    files = {path.name: path.read_bytes() for path in storage.iterdir() if path.is_file()}
+    assert "ScrapUser.journal.jsonl" in files
+
+    counts = migrate_json_storage(storage, database)
+
+    assert counts["profile"] == 2
+    assert SQLiteScrapUserRepository(database).load()["Competências"] == ["Python", "SQL"]
+    assert {path.name: path.read_bytes() for path in storage.iterdir() if path.is_file()} == files
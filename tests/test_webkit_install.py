@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.app.controllers.webkit_install import WebKitInstaller
+
+
+FINGERPRINT = {"playwright_version": "1.55.0", "driver_path": "/opt/driver/node cli.js"}
+
+
+def _write_manifest(storage: Path, executable: Path, **overrides: str) -> None:
+    manifest = {**FINGERPRINT, "executable_path": str(executable), **overrides}
+    (storage / WebKitInstaller.MANIFEST_FILENAME).write_text(json.dumps(manifest), encoding="utf-8")
+
+
+def test_manifest_hit_skips_installation(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("src.app.controllers.webkit_install._playwright_fingerprint", lambda: FINGERPRINT)
+    executable = tmp_path / "pw_run.sh"
+    executable.write_text("", encoding="utf-8")
+    _write_manifest(tmp_path, executable)
+
+    installer = WebKitInstaller(tmp_path)
+    monkeypatch.setattr(installer, "_install", lambda: (_ for _ in ()).throw(AssertionError("installed")))
+    messages: list[str] = []
+    installer.add_listener(messages.append)
+    installer.wait(timeout=5)
+
+    assert installer.ready
+    assert messages[-1] == "Runtime do WebKit disponível."
+
+
+def test_manifest_is_invalidated_by_version_or_missing_runtime(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("src.app.controllers.webkit_install._playwright_fingerprint", lambda: FINGERPRINT)
+    executable = tmp_path / "pw_run.sh"
+    executable.write_text("", encoding="utf-8")
+    installer = WebKitInstaller(tmp_path)
+
+    _write_manifest(tmp_path, executable, playwright_version="1.40.0")
+    assert not installer.is_installed()
+
+    _write_manifest(tmp_path, tmp_path / "missing.sh")
+    assert not installer.is_installed()
+
+
+def test_removed_listener_is_not_notified(tmp_path: Path) -> None:
+    installer = WebKitInstaller(tmp_path)
+    initial = installer.status
+    kept: list[str] = []
+    removed: list[str] = []
+    installer.add_listener(kept.append)
+    installer.add_listener(removed.append)
+
+    installer.remove_listener(removed.append)
+    installer.remove_listener(removed.append)
+    installer._notify("Baixando WebKit...")
+
+    assert kept == [initial, "Baixando WebKit..."]
+    assert removed == [initial]